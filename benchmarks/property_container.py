@@ -0,0 +1,54 @@
+"""Microbenchmark of attribute accesses on a |PropertyContainer| compared to a plain Python object.
+
+Usage::
+
+    python benchmarks/property_container.py
+
+Plain attributes of a |PropertyContainer| are expected to resolve as fast as those of a plain object, whereas
+properties go through the :meth:`~object.__getattr__` fallback.
+
+"""
+import timeit
+
+from plums.commons.data import Record
+from plums.commons.data.mixin import PropertyContainer
+
+
+class Plain(object):
+    def __init__(self, **properties):
+        self.properties = properties
+
+
+class Container(PropertyContainer):
+    pass
+
+
+def _best(statement, **namespace):
+    return min(timeit.repeat(statement, globals=namespace, number=100000, repeat=7)) / 100000 * 1e9
+
+
+def main():
+    plain = Plain(some_property='some property')
+    plain.attribute = 'attribute'
+    container = Container(some_property='some property')
+    container.attribute = 'attribute'
+    record = Record([0, 1], ['car'], 0.5, some_property='some property')
+
+    cases = (
+        ('plain object attribute read', 'o.attribute', plain),
+        ('container attribute read', 'o.attribute', container),
+        ('container property read', 'o.some_property', container),
+        ('plain object attribute write', 'o.attribute = 0', plain),
+        ('container attribute write', 'o.attribute = 0', container),
+        ('container property write', 'o.some_property = 0', container),
+        ('record.confidence read', 'o.confidence', record),
+        ('record.coordinates read', 'o.coordinates', record),
+        ('record.some_property read', 'o.some_property', record),
+    )
+
+    for name, statement, obj in cases:
+        print('{:<30} {:>8.1f} ns'.format(name, _best(statement, o=obj)))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,3 @@
 from .path import Path  # noqa: I100
 from .data import DataPoint, TileCollection, Tile, TileWrapper, Annotation, MaskCollection, VectorMask, RasterMask, \
-    RecordCollection, Record, Taxonomy, Label, Tree, PropertyContainer  # noqa: I100
+    RecordCollection, ArrayRecordCollection, Record, Taxonomy, Label, Tree, PropertyContainer  # noqa: I100
@@ -1,6 +1,6 @@
 from .base import GeoInterfaced, ArrayInterfaced
 from .mixin import PropertyContainer
-from .record import RecordCollection, Record
+from .record import RecordCollection, ArrayRecordCollection, Record
 from .mask import RasterMask, VectorMask, MaskCollection, Mask
 from .tile import Tile, TileWrapper, TileCollection
 from .data import Annotation, DataPoint
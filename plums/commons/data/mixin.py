@@ -73,12 +73,12 @@ class SlottedDict(object, metaclass=SlottedDictMeta):
 class IdentifiedMixIn(SlottedDict):
     """Mix In class to add a unique identifier and the ability to manually provide it in the constructor.
 
+    If no identifier is provided, a random *UUID4* is only generated the first time :attr:`id` is accessed, or when the
+    instance is copied or serialized, so that copies share the same identifier.
+
     Args:
         id (str): Optional. Default to a random *UUID4*. An id to store along the instance.
 
-    Attributes:
-        id (str): The instance *uuid*.
-
     """
 
     __slots__ = ()
@@ -86,12 +86,28 @@ class IdentifiedMixIn(SlottedDict):
     def __init__(self, *args, **kwargs):
         # Init id
         id = kwargs.pop('id', None)
-        if hasattr(self.__class__, 'id'):
-            self._id = id or str(uuid.uuid4())
-        else:
-            self.id = id or str(uuid.uuid4())
+        if id:
+            self._id = id
         super(IdentifiedMixIn, self).__init__(*args, **kwargs)
 
+    @property
+    def id(self):
+        """str: The instance *uuid*."""
+        try:
+            return self.__dict__['_id']
+        except KeyError:
+            # dict.setdefault is atomic, concurrent first accesses agree on the same identifier
+            return self.__dict__.setdefault('_id', str(uuid.uuid4()))
+
+    @id.setter
+    def id(self, value):
+        self._id = value
+
+    def __getstate__(self):
+        """Return a dictionary of all slotted and in dictionary attributes, including the materialized :attr:`id`."""
+        _ = self.id
+        return super(IdentifiedMixIn, self).__getstate__()
+
 
 class PropertyContainer(SlottedDict):
     """Utility class which swallows every key-word arguments provided and exposes them as attributes.
@@ -114,37 +130,32 @@ class PropertyContainer(SlottedDict):
     @property
     def properties(self):  # noqa: D401
         """dict: Properties provided as kwargs in the constructor."""
-        return self.__getattribute__('_properties')
+        return self._properties
 
     @properties.setter
     def properties(self, value):
         super(PropertyContainer, self).__setattr__('_properties', value)
 
-    def __getattribute__(self, key):
-        """Get an attribute or a property value."""
-        try:
-            return super(PropertyContainer, self).__getattribute__(key)
-        except AttributeError as error:
-            if key in ('properties', '_properties'):
-                raise error
+    def __getattr__(self, key):
+        """Get a property value, only called if no attribute was found with the normal lookup."""
+        if key in ('properties', '_properties'):
+            raise AttributeError("'{}' object has no attribute '{}'".format(self.__class__.__name__, key))
 
-            try:
-                return self.properties[key]
-            except KeyError:
-                raise error
+        try:
+            return self.properties[key]
+        except KeyError:
+            raise AttributeError("'{}' object has no attribute '{}'".format(self.__class__.__name__, key)) from None
 
     def __setattr__(self, key, value):
         """Add or set an attribute or a property."""
-        if key == '_properties':
-            super(PropertyContainer, self).__setattr__(key, value)
-            return
-
         try:
-            if key in self._properties.keys():
-                self._properties[key] = value
-            else:
-                super(PropertyContainer, self).__setattr__(key, value)
-        except AttributeError:
+            properties = self._properties
+        except AttributeError:  # Properties are not set yet
+            properties = ()
+
+        if key in properties:
+            properties[key] = value
+        else:
             super(PropertyContainer, self).__setattr__(key, value)
 
     def __delattr__(self, key):
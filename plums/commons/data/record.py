@@ -3,6 +3,10 @@ try:
 except ImportError:
     import collections as abc_collections
 
+import uuid
+
+import numpy as np
+
 from .base import GeoInterfaced
 from .mixin import PropertyContainer
 from .taxonomy import Taxonomy, Label, clean
@@ -199,6 +203,610 @@ class RecordCollection(GeoInterfaced):
         }
 
 
+class ArrayRecordCollection(RecordCollection):
+    """A |RecordCollection| which stores its records in columnar arrays and only constructs |Record| when accessed.
+
+    Constructing thousands of |Record| (each with its own properties dictionary, |Label| tuple, *uuid* and nested
+    coordinates lists) is costly both in time and in memory, although most of them might never be accessed
+    individually. An |ArrayRecordCollection| rather stores its records as:
+
+    * A single array of geometry vertices, delimited in rings by an array of offsets, themselves delimited in record
+      geometries by another array of offsets. *Point* geometries are stored as single vertex rings.
+    * An array of label indices in a table of label names, delimited in record labels by an array of offsets.
+    * An array of confidence scores, where ``NaN`` stands for a missing score.
+    * Lists of identifiers and of additional properties.
+
+    A |Record| is constructed the first time it is accessed and kept afterward, so that its modifications are
+    preserved. Records provided to the constructor, appended or set are kept as-is. Kept records are encoded back in
+    the arrays whenever those are accessed, *e.g.* through :attr:`vertices`, so that the arrays always reflect the
+    enclosed records, and :meth:`compact` releases them once they are not needed anymore.
+
+    :meth:`get` and :meth:`to_geojson` work straight on the arrays, and the arrays are exposed as read-only attributes
+    so that descriptors, metrics or painters may operate on whole collections at once.
+
+    Args:
+        *records (|Record|): |Record| instances to aggregate.
+        id (str): Optional. Default to a random *UUID4*. An id to store along the instance.
+        taxonomy (|Taxonomy|): Optional. Default to ``None``. A |Taxonomy| describing the range of possible values
+            one may expect as labels in the enclosed |Record|. If not provided a new implicit, "*flat*" |Taxonomy| will
+            be constructed on the go.
+
+    Attributes:
+        id (str): The instance *uuid*.
+
+    """
+
+    def __init__(self, *records, **kwargs):
+        # Init empty arrays
+        self._vertices = np.zeros((0, 2))
+        self._ring_offsets = np.zeros((1, ), dtype=np.int64)
+        self._geometry_offsets = np.zeros((1, ), dtype=np.int64)
+        self._points = np.zeros((0, ), dtype=bool)
+        self._label_indices = np.zeros((0, ), dtype=np.int32)
+        self._label_offsets = np.zeros((1, ), dtype=np.int64)
+        self._label_names = ()
+        self._confidences = np.zeros((0, ))
+        self._ids = []
+        self._properties = []
+        self._records = []
+
+        # Init Taxonomy
+        taxonomy = kwargs.pop('taxonomy', None)
+        self._explicit_taxonomy = False
+        self._taxonomy = Taxonomy()
+        if taxonomy is not None:
+            self.taxonomy = taxonomy
+
+        # Add records to list
+        for record in records:
+            self.append(record)
+
+        # Init
+        super(RecordCollection, self).__init__(**kwargs)
+
+    @classmethod
+    def from_arrays(cls, vertices, ring_offsets, geometry_offsets, label_indices, label_offsets, label_names,
+                    confidences=None, ids=None, properties=None, points=None, taxonomy=None, id=None):
+        """Construct an |ArrayRecordCollection| from columnar arrays, without constructing any |Record|.
+
+        Args:
+            vertices (:class:`~numpy.ndarray`): A ``(V, D)`` array of the geometries vertices.
+            ring_offsets (:class:`~numpy.ndarray`): A ``(R + 1, )`` array delimiting rings in ``vertices``.
+            geometry_offsets (:class:`~numpy.ndarray`): A ``(N + 1, )`` array delimiting record geometries in rings.
+            label_indices (:class:`~numpy.ndarray`): A ``(L, )`` array of indices in ``label_names``.
+            label_offsets (:class:`~numpy.ndarray`): A ``(N + 1, )`` array delimiting record labels in
+                ``label_indices``.
+            label_names (Sequence[str]): The label names table.
+            confidences (:class:`~numpy.ndarray`): Optional. Default to no confidence score. A ``(N, )`` array of
+                confidence scores, where ``NaN`` stands for a missing score. Integer scores are kept as integers, other
+                scores are stored as floats.
+            ids (Sequence[str]): Optional. Default to random *UUID4*. A sequence of record identifiers, where ``None``
+                stands for a random *UUID4*.
+            properties (Sequence[dict]): Optional. Default to no additional properties. A sequence of record additional
+                properties.
+            points (:class:`~numpy.ndarray`): Optional. Default to *Polygon* geometries only. A ``(N, )`` boolean array
+                flagging records with a *Point* geometry, stored as a single vertex ring.
+            taxonomy (|Taxonomy|): Optional. Default to ``None``. A |Taxonomy| against which records labels are
+                validated. If not provided a new implicit, "*flat*" |Taxonomy| is constructed.
+            id (str): Optional. Default to a random *UUID4*. An id to store along the instance.
+
+        Returns:
+            |ArrayRecordCollection|: The record collection.
+
+        Raises:
+            ValueError: If the arrays lengths are inconsistent, if some records have no label or if their labels are
+                incompatible with ``taxonomy``.
+
+        """
+        label_offsets = np.asarray(label_offsets, dtype=np.int64)
+        length = len(label_offsets) - 1
+
+        collection = cls(id=id)
+        collection._vertices = np.asarray(vertices)
+        collection._ring_offsets = np.asarray(ring_offsets, dtype=np.int64)
+        collection._geometry_offsets = np.asarray(geometry_offsets, dtype=np.int64)
+        collection._points = np.zeros((length, ), dtype=bool) if points is None else np.asarray(points, dtype=bool)
+        collection._label_indices = np.asarray(label_indices, dtype=np.int32)
+        collection._label_offsets = label_offsets
+        collection._label_names = tuple(str(name) for name in label_names)
+        collection._confidences = np.full((length, ), np.nan) if confidences is None \
+            else cls._as_confidences(confidences)
+        collection._ids = [None] * length if ids is None else list(ids)
+        collection._properties = [{}] * length if properties is None else list(properties)
+        collection._records = [None] * length
+
+        if collection._vertices.ndim != 2 \
+                or len(collection._geometry_offsets) != length + 1 \
+                or collection._ring_offsets[-1] != len(collection._vertices) \
+                or collection._geometry_offsets[-1] != len(collection._ring_offsets) - 1 \
+                or collection._label_offsets[-1] != len(collection._label_indices) \
+                or not len(collection._points) == len(collection._confidences) == len(collection._ids) \
+                == len(collection._properties) == length:
+            raise ValueError('Invalid arrays: Arrays lengths and offsets are inconsistent.')
+
+        if np.any(np.diff(label_offsets) == 0):
+            raise ValueError('Expected at least 1 label, got: 0')
+
+        if taxonomy is not None:
+            collection.taxonomy = taxonomy
+        else:
+            names = {collection._label_names[index] for index in np.unique(collection._label_indices).tolist()}
+            collection._taxonomy.root.add(*{Label(name) for name in names
+                                            if name not in collection._taxonomy.root.descendants.keys()})
+
+        return collection
+
+    @property
+    def taxonomy(self):
+        """|Taxonomy|: The range of possible label values in the enclosed |Record| and their relationships.
+
+        Warnings:
+            The *setter* validates each distinct label tuple of the enclosed records once to assess that the proposed
+            |Taxonomy| is compatible with the |ArrayRecordCollection|.
+
+        Raises:
+            ValueError: If trying to set a |Taxonomy| incompatible with the enclosed records.
+
+        """
+        return self._taxonomy
+
+    @taxonomy.setter
+    def taxonomy(self, taxonomy):
+        for labels in self._label_tuples():
+            taxonomy.validate(*(Label(name) for name in labels))
+
+        for record in self._records:
+            if record is not None:
+                record.taxonomy = taxonomy
+
+        self._explicit_taxonomy = True
+        self._taxonomy = taxonomy
+
+    def _label_tuples(self):
+        """Return the set of distinct label name tuples of the enclosed records."""
+        labels = set()
+        for index, record in enumerate(self._records):
+            if record is not None:
+                labels.add(tuple(label.name for label in record.labels))
+            else:
+                start, stop = self._label_offsets[index:index + 2].tolist()
+                labels.add(tuple(self._label_names[i] for i in self._label_indices[start:stop].tolist()))
+        return labels
+
+    def _coordinates(self, index):
+        """Return the GeoJSON coordinates of the i-th record stored in the arrays."""
+        start, stop = self._geometry_offsets[index:index + 2].tolist()
+        offsets = self._ring_offsets[start:stop + 1].tolist()
+        if self._points[index]:
+            return self._vertices[offsets[0]].tolist()
+        return [self._vertices[offsets[i]:offsets[i + 1]].tolist() for i in range(stop - start)]
+
+    def _record_id(self, index):
+        """Return the identifier of the i-th record stored in the arrays, generating it once if need be."""
+        if self._ids[index] is None:
+            self._ids[index] = str(uuid.uuid4())
+        return self._ids[index]
+
+    def _record(self, index):
+        """Return the i-th |Record|, constructing it from the arrays if need be."""
+        record = self._records[index]
+        if record is not None:
+            return record
+
+        start, stop = self._label_offsets[index:index + 2].tolist()
+        labels = tuple(self._label_names[i] for i in self._label_indices[start:stop].tolist())
+        confidence = self._confidences[index]
+        record = Record(self._coordinates(index), labels, None if np.isnan(confidence) else confidence.item(),
+                        self._record_id(index), **self._properties[index])
+        if self._explicit_taxonomy:
+            record.taxonomy = self._taxonomy
+
+        self._records[index] = record
+        return record
+
+    @property
+    def records(self):
+        """list: The enclosed |Record| instances, constructed if need be.
+
+        Warnings:
+            Each access returns a new list, modifying it does not modify the collection.
+
+        """
+        return [self._record(index) for index in range(len(self._records))]
+
+    def __getitem__(self, index):
+        """Access the i-th stored |Record|, constructing it if need be.
+
+        Returns:
+            |Record|: The specified |Record| instance.
+
+        Raises:
+            IndexError: If ``index`` is out of range.
+
+        """
+        if isinstance(index, slice):
+            return [self._record(i) for i in range(*index.indices(len(self._records)))]
+
+        if not -len(self._records) <= index < len(self._records):
+            raise IndexError('list index out of range')
+        return self._record(index % len(self._records))
+
+    def __setitem__(self, index, record):
+        """Set the i-th |Record|.
+
+        Raises:
+            IndexError: If ``index`` is out of range.
+            ValueError: If trying to set a |Record| incompatible with the enclosed :attr:`taxonomy`.
+
+        """
+        if not -len(self._records) <= index < len(self._records):
+            raise IndexError('list assignment index out of range')
+        self._update(record)
+        self._records[index] = record
+
+    def __len__(self):
+        """Return the number of stored |Record|."""
+        return len(self._records)
+
+    def __iter__(self):
+        """Iterate over the stored |Record|, constructing them if need be."""
+        for index in range(len(self._records)):
+            yield self._record(index)
+
+    def get(self, max_depth=None):
+        """Get |Record| and cap their :attr:`~plums.commons.data.record.Record.labels` to a maximum depth.
+
+        Records which were never accessed are constructed straight from the arrays and their labels are capped once
+        per distinct label instead of once per |Record|.
+
+        See Also:
+            The label :meth:`~plums.commons.data.record.Record.get_labels` method which handles the lifting.
+
+        Args:
+            max_depth (int, dict): Optional. Default to ``None``.
+
+                * If an integer is provided, |Label| fetched through the attached :attr:`taxonomy` will be capped to
+                  the provided maximum tree depth.
+                * If a dictionary is provided, it must map :attr:`taxonomy` true-roots to a given integer
+                  ``max_depth``. Missing true-root will be interpreted as non-capped.
+
+        Returns:
+            (|Label|, ): The |Record| labels as a tuple of |Label|.
+
+        Raises:
+            ValueError: If a ``max_depth`` is provided although :attr:`taxonomy` is implicit.
+            IndexError: If ``index`` is out of range.
+
+        """
+        class _DepthWiseArrayRecordAccessor(object):
+            """Get |Record| and optionally cap their labels to a maximum depth."""
+
+            def __init__(self, record_collection, max_depth=None):
+                self.record_collection = record_collection
+                self.max_depth = max_depth
+                self._labels = None
+
+            def _capped_labels(self):
+                """Return the capped |Label| of each label name in the record collection names table."""
+                if self._labels is not None:
+                    return self._labels
+
+                collection = self.record_collection
+                if not collection._explicit_taxonomy:
+                    if self.max_depth is not None:
+                        raise ValueError('Invalid arguments: No taxonomy exists for this record '
+                                         'but a max_depth was provided.')
+                    self._labels = tuple(Label(name) for name in collection._label_names)
+                elif isinstance(self.max_depth, abc_collections.MutableMapping):
+                    taxonomy = collection.taxonomy
+                    labels = []
+                    for name in collection._label_names:
+                        patriarch = ((taxonomy[name], ) + taxonomy.ancestors(taxonomy[name]))[-2]
+                        root_tree = taxonomy.properties[clean(patriarch.name)]
+                        labels.append(root_tree.get(max_depth=self.max_depth.get(patriarch)).name[name])
+                    self._labels = tuple(labels)
+                else:
+                    capped = collection.taxonomy.get(max_depth=self.max_depth).name
+                    self._labels = tuple(capped[name] for name in collection._label_names)
+
+                return self._labels
+
+            def _get(self, index):
+                collection = self.record_collection
+                record = collection._records[index]
+                if record is not None:
+                    return Record(record.coordinates, record.get_labels(max_depth=self.max_depth),
+                                  record.confidence, record.id, collection.taxonomy, **record.properties)
+
+                labels = self._capped_labels()
+                start, stop = collection._label_offsets[index:index + 2].tolist()
+                confidence = collection._confidences[index]
+                return Record(collection._coordinates(index),
+                              tuple(labels[i] for i in collection._label_indices[start:stop].tolist()),
+                              None if np.isnan(confidence) else confidence.item(), collection._record_id(index),
+                              collection.taxonomy, **collection._properties[index])
+
+            def __getitem__(self, index):
+                """Access the i-th stored |Record|.
+
+                Returns:
+                    |Record|: The specified |Record| instance.
+
+                Raises:
+                    ValueError: If a ``max_depth`` is provided although :attr:`taxonomy` is implicit.
+                    IndexError: If ``index`` is out of range.
+
+                """
+                length = len(self.record_collection)
+                if isinstance(index, slice):
+                    return [self._get(i) for i in range(*index.indices(length))]
+
+                if not -length <= index < length:
+                    raise IndexError('list index out of range')
+                return self._get(index % length)
+
+        return _DepthWiseArrayRecordAccessor(self, max_depth=max_depth)
+
+    def append(self, record):
+        """Append a |Record| to the collection.
+
+        The |Record| is kept as-is until :meth:`compact` is called.
+
+        Args:
+            record (|Record|): A |Record| to append to the collection.
+
+        Raises:
+            ValueError: If trying to append a |Record| incompatible with the enclosed :attr:`taxonomy`.
+
+        """
+        self._update(record)
+        self._records.append(record)
+
+    def compact(self):
+        """Encode the constructed or appended |Record| in the arrays and release them.
+
+        Accessing a released |Record| afterward constructs a new |Record| from the arrays.
+
+        Raises:
+            ValueError: If the records coordinates could not be stored in the arrays.
+
+        """
+        self._consolidate()
+        self._records = [None] * len(self._records)
+
+    @staticmethod
+    def _as_confidences(confidences):
+        """Return confidence scores as an integer array if they all are integers, as a float array otherwise."""
+        confidences = np.asarray(confidences)
+        if confidences.dtype.kind in 'iu':
+            return confidences.astype(np.int64)
+        return confidences.astype(np.float64)
+
+    def _consolidate(self):
+        """Encode the kept |Record| in the arrays, so that the arrays reflect all the enclosed records.
+
+        Raises:
+            ValueError: If the records coordinates could not be stored in the arrays.
+
+        """
+        length = len(self._records)
+        encoded = len(self._confidences)
+        kept = [index for index, record in enumerate(self._records) if record is not None]
+        if not kept and encoded == length:
+            return
+
+        # Prepare new arrays
+        names = {name: index for index, name in enumerate(self._label_names)}
+        vertices, ring_offsets, geometry_offsets, label_indices, label_offsets = [], [[0]], [[0]], [], [[0]]
+        vertex_count, ring_count, label_count = 0, 0, 0
+        points = np.zeros((length, ), dtype=bool)
+        points[:encoded] = self._points
+        confidences = np.full((length, ), np.nan)
+        confidences[:encoded] = self._confidences
+        integral = not encoded or self._confidences.dtype.kind in 'iu'
+        ids = self._ids + [None] * (length - encoded)
+        properties = self._properties + [{}] * (length - encoded)
+
+        # Copy encoded records by contiguous runs and encode kept records one by one
+        start = 0
+        for stop in kept + [length]:
+            if start < stop:
+                ring_start, ring_stop = self._geometry_offsets[[start, stop]].tolist()
+                vertex_start, vertex_stop = self._ring_offsets[[ring_start, ring_stop]].tolist()
+                label_start, label_stop = self._label_offsets[[start, stop]].tolist()
+                vertices.append(self._vertices[vertex_start:vertex_stop])
+                ring_offsets.append(self._ring_offsets[ring_start + 1:ring_stop + 1] - vertex_start + vertex_count)
+                geometry_offsets.append(self._geometry_offsets[start + 1:stop + 1] - ring_start + ring_count)
+                label_indices.append(self._label_indices[label_start:label_stop])
+                label_offsets.append(self._label_offsets[start + 1:stop + 1] - label_start + label_count)
+                vertex_count += vertex_stop - vertex_start
+                ring_count += ring_stop - ring_start
+                label_count += label_stop - label_start
+
+            if stop < length:
+                record = self._records[stop]
+                # +-> Geometry
+                points[stop] = record.type == 'Point'
+                rings = [[record.coordinates]] if points[stop] else record.coordinates
+                for ring in rings:
+                    ring = np.asarray(ring)
+                    if ring.ndim != 2 or ring.dtype.kind not in 'iuf':
+                        raise ValueError('Invalid coordinates: Expected Point or Polygon coordinates, '
+                                         'got {}.'.format(record.coordinates))
+                    vertices.append(ring)
+                    vertex_count += len(ring)
+                    ring_offsets.append([vertex_count])
+                ring_count += len(rings)
+                geometry_offsets.append([ring_count])
+                # +-> Labels
+                label_indices.append([names.setdefault(label.name, len(names)) for label in record.labels])
+                label_count += len(record.labels)
+                label_offsets.append([label_count])
+                # +-> Others
+                confidences[stop] = np.nan if record.confidence is None else record.confidence
+                integral = integral and isinstance(record.confidence, (int, np.integer)) \
+                    and not isinstance(record.confidence, bool)
+                ids[stop] = record.id
+                properties[stop] = record.properties
+
+            start = stop + 1
+
+        # Store new arrays
+        vertices = [array for array in vertices if len(array)]
+        if len({array.shape[1] for array in vertices}) > 1:
+            raise ValueError('Invalid coordinates: Expected records coordinates to share the same dimension.')
+        self._vertices = np.concatenate(vertices) if vertices else self._vertices[:0]
+        self._ring_offsets = np.concatenate(ring_offsets).astype(np.int64)
+        self._geometry_offsets = np.concatenate(geometry_offsets).astype(np.int64)
+        self._points = points
+        self._label_indices = np.concatenate(label_indices).astype(np.int32)
+        self._label_offsets = np.concatenate(label_offsets).astype(np.int64)
+        self._label_names = tuple(names)
+        self._confidences = confidences.astype(np.int64) if integral and length else confidences
+        self._ids = ids
+        self._properties = properties
+
+    @staticmethod
+    def _read_only(array):
+        """Return a read-only view of an array."""
+        view = array.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def vertices(self):
+        """:class:`~numpy.ndarray`: A read-only ``(V, D)`` array of the records geometries vertices."""
+        self._consolidate()
+        return self._read_only(self._vertices)
+
+    @property
+    def ring_offsets(self):
+        """:class:`~numpy.ndarray`: A read-only ``(R + 1, )`` array delimiting rings in :attr:`vertices`."""
+        self._consolidate()
+        return self._read_only(self._ring_offsets)
+
+    @property
+    def geometry_offsets(self):
+        """:class:`~numpy.ndarray`: A read-only ``(N + 1, )`` array delimiting records geometries in rings."""
+        self._consolidate()
+        return self._read_only(self._geometry_offsets)
+
+    @property
+    def points(self):
+        """:class:`~numpy.ndarray`: A read-only ``(N, )`` boolean array flagging records with a *Point* geometry."""
+        self._consolidate()
+        return self._read_only(self._points)
+
+    @property
+    def label_indices(self):
+        """:class:`~numpy.ndarray`: A read-only ``(L, )`` array of records labels indices in :attr:`label_names`."""
+        self._consolidate()
+        return self._read_only(self._label_indices)
+
+    @property
+    def label_offsets(self):
+        """:class:`~numpy.ndarray`: A read-only ``(N + 1, )`` array delimiting labels in :attr:`label_indices`."""
+        self._consolidate()
+        return self._read_only(self._label_offsets)
+
+    @property
+    def label_names(self):
+        """tuple: The label names table :attr:`label_indices` refer to."""
+        self._consolidate()
+        return self._label_names
+
+    @property
+    def confidences(self):
+        """:class:`~numpy.ndarray`: A read-only ``(N, )`` array of records confidence scores, ``NaN`` if missing.
+
+        Scores are stored as integers if they all are integers, as floats otherwise.
+
+        """
+        self._consolidate()
+        return self._read_only(self._confidences)
+
+    @property
+    def bounds(self):
+        """:class:`~numpy.ndarray`: A ``(N, 2 * D)`` array of records bounding boxes, as minimum then maximum vertex.
+
+        Records without any vertex have ``NaN`` bounds.
+
+        """
+        self._consolidate()
+        starts = self._ring_offsets[self._geometry_offsets[:-1]]
+        valid = self._ring_offsets[self._geometry_offsets[1:]] > starts
+        vertices = self._vertices.astype(np.float64)
+        bounds = np.full((len(self), 2 * vertices.shape[1]), np.nan)
+        if np.any(valid):
+            # Records without vertex are empty ranges and may be skipped without breaking the reduction ranges
+            bounds[valid, :vertices.shape[1]] = np.minimum.reduceat(vertices, starts[valid], axis=0)
+            bounds[valid, vertices.shape[1]:] = np.maximum.reduceat(vertices, starts[valid], axis=0)
+        return bounds
+
+    @property
+    def nbytes(self):
+        """int: The number of bytes used by the arrays, excluding identifiers, properties and kept |Record|."""
+        return sum(array.nbytes for array in (self._vertices, self._ring_offsets, self._geometry_offsets, self._points,
+                                              self._label_indices, self._label_offsets, self._confidences))
+
+    def to_geojson(self, style='GeoPaaS'):
+        """Implement the object conversion into a valid GeoJSON mapping.
+
+        Records which were never accessed are converted straight from the arrays.
+
+        Args:
+            style (str): Either 'GeoPaaS' or 'export-service'. Control the GeoJSON representation properties format.
+
+        Returns:
+            dict: The GeoJSON representation of the |ArrayRecordCollection|.
+
+        """
+        if style == 'GeoPaaS':
+            label_key = 'category'
+            label_fn = list
+            confidence_key = 'confidence'
+        elif style == 'export-service':
+            label_key = 'tags'
+            label_fn = ','.join
+            confidence_key = 'score'
+        else:
+            raise ValueError('Invalid style: Expected "GeoPaaS" or "export-service", got {}'.format(style))
+
+        vertices = self._vertices.tolist()
+        ring_offsets = self._ring_offsets.tolist()
+        geometry_offsets = self._geometry_offsets.tolist()
+        label_indices = self._label_indices.tolist()
+        label_offsets = self._label_offsets.tolist()
+        confidences = [None if np.isnan(confidence) else confidence for confidence in self._confidences.tolist()]
+
+        features = []
+        for index, record in enumerate(self._records):
+            if record is not None:
+                features.append(record.to_geojson(style=style))
+                continue
+
+            rings = ring_offsets[geometry_offsets[index]:geometry_offsets[index + 1] + 1]
+            if self._points[index]:
+                geometry = {'type': 'Point', 'coordinates': vertices[rings[0]]}
+            else:
+                geometry = {'type': 'Polygon',
+                            'coordinates': [vertices[rings[i]:rings[i + 1]] for i in range(len(rings) - 1)]}
+
+            properties = {
+                label_key: label_fn([self._label_names[i]
+                                     for i in label_indices[label_offsets[index]:label_offsets[index + 1]]]),
+                confidence_key: confidences[index]
+            }
+            properties.update(self._properties[index])
+
+            features.append({'type': 'Feature', 'geometry': geometry, 'properties': properties})
+
+        return {
+            'type': 'FeatureCollection',
+            'features': features
+        }
+
+
 class Record(PropertyContainer, GeoInterfaced):
     """Data model class which represents a |Record|.
 
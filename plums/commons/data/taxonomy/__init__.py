@@ -167,17 +167,8 @@ class Taxonomy(Tree):
 
     def __getstate__(self):
         """Return a dictionary of all slotted and in dictionary attributes."""
-        dct = {key: value for key, value in self.__dict__.items()}
-
-        for key in self.__all_slots__:
-            if self._is_dunder(key):
-                continue
-            if key == '_properties':
-                properties = self._get_slot(key)
-                dct[key] = {key: value for key, value in properties.items() if not isinstance(value, Tree)}
-            else:
-                dct[key] = self._get_slot(key)
-
+        dct = super(Taxonomy, self).__getstate__()
+        dct['_properties'] = {key: value for key, value in dct['_properties'].items() if not isinstance(value, Tree)}
         return dct
 
     def validate(self, *labels):
@@ -105,7 +105,7 @@ class Label(PropertyContainer, IdentifiedMixIn):
     @property
     def id(self):
         """str: An identifier unique for all |Label| instance *independent* on content."""
-        return self._id
+        return super(Label, self).id
 
     @property
     def parent(self):
@@ -176,7 +176,7 @@ class Label(PropertyContainer, IdentifiedMixIn):
         cls = self.__class__
         result = cls.__new__(cls, deepcopy(self._name, memo))
         result._properties = deepcopy(self._properties, memo)
-        result._id = deepcopy(self._id, memo)
+        result._id = deepcopy(self.id, memo)
         result._name = deepcopy(self._name, memo)
         result._hash = None
         result._depth = deepcopy(self._depth, memo)
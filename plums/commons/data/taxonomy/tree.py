@@ -155,7 +155,7 @@ class Tree(PropertyContainer, IdentifiedMixIn):
     @property
     def id(self):
         """str: An identifier unique for all |Tree| instance *independent* on content."""
-        return self._id
+        return super(Tree, self).id
 
     @property
     def max_depth(self):
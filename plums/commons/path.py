@@ -28,10 +28,11 @@ class _Stat(object):
             path (|Path|): A |Path| for which to store stat information.
 
         """
+        path = str(path)
         self._hash = hash(path)
         self._exists = True
         try:
-            lstat_result = os.lstat(str(path))
+            lstat_result = os.lstat(path)
         except OSError:
             self.stat_result = None
             self._exists = False
@@ -39,7 +40,7 @@ class _Stat(object):
         else:
             self._islink = stat.S_ISLNK(lstat_result.st_mode)
             try:
-                self.stat_result = os.stat(str(path))
+                self.stat_result = os.stat(path) if self._islink else lstat_result
             except OSError:
                 self.stat_result = None
                 self._exists = False
@@ -1,3 +1,5 @@
-from .base import Dataset, SizedDataset, Subset, ConcatDataset
-from .pattern import PatternDataset
+from .base import Dataset, SizedDataset, IterableDataset, Subset, ConcatDataset
+from .pattern import PatternDataset, IterablePatternDataset
 from .playground import PlaygroundDataset
+from .shard import ShardedDataset
+from .loader import DataLoader, collate
@@ -5,6 +5,15 @@ from collections.abc import Sequence
 import numpy as np
 
 
+def _get_many(dataset, indices):
+    """Fetch several indexed items from a dataset, which may not be a |Dataset| and lack the ``get_many`` method."""
+    try:
+        get_many = dataset.get_many
+    except AttributeError:
+        return [dataset[item] for item in indices]
+    return get_many(indices)
+
+
 # If PyTorch exists in the current python environment, we make Plums dataset as explicit subclasses to allow
 # type-check pass and robust compatibility.
 class Dataset(object, metaclass=ABCMeta):
@@ -42,6 +51,21 @@ class Dataset(object, metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def get_many(self, indices):
+        """Fetch several indexed items from the |Dataset| at once.
+
+        Subclasses may override this method to fetch items in a more efficient order than the requested one, *e.g.* to
+        read neighbouring files together, as long as items are returned in the requested order.
+
+        Args:
+            indices (Iterable[int, Hashable]): Valid indices for the |Dataset|.
+
+        Returns:
+            list: The |Dataset| data-point elements, in the ``indices`` order.
+
+        """
+        return [self[item] for item in indices]
+
     # Although subclasses SHOULD override the len method, it is deliberately not implemented by default to assert
     # valid behaviour with non-sized samplers. If one wants to explicitly signal that the len is or should be present,
     # use the SizedDataset base class instead.
@@ -109,6 +133,30 @@ class SizedDataset(Dataset, metaclass=ABCMeta):
         return ConcatDataset(self, datasets, *additional_datasets)
 
 
+class IterableDataset(object, metaclass=ABCMeta):
+    """Abstract base class for all |Dataset| which are iterated on rather than indexed to inherit from.
+
+    Subclasses must override the :meth:`__iter__` method to allow |IterableDataset| to act as an
+    :class:`~collection.abc.Iterable` stream of data-points, *e.g.* if data-points are discovered while being read.
+
+    .. hint::
+
+        Like the |Dataset| API mimics PyTorch's own :class:`~torch.utils.data.Dataset`, the |IterableDataset| API
+        mimics PyTorch's :class:`~torch.utils.data.IterableDataset` so that it can be used as a stand-in.
+
+    """
+
+    @abstractmethod
+    def __iter__(self):
+        """Iterate over the |IterableDataset| data-points.
+
+        Yields:
+            Any: A |Dataset| data-point element.
+
+        """
+        raise NotImplementedError
+
+
 class Subset(SizedDataset):
     """Create a subset of a |Dataset| from a |Dataset| to wrap and a selector container.
 
@@ -138,6 +186,18 @@ class Subset(SizedDataset):
         """
         return self.dataset[self.indices[item]]
 
+    def get_many(self, indices):
+        """Fetch several indexed items from the registered subset of the enclosed |Dataset| at once.
+
+        Args:
+            indices (Iterable[int, Hashable]): Valid indices for the :attr:`indices` selector container.
+
+        Returns:
+            list: Data-point elements from the enclosed |Dataset|, in the ``indices`` order.
+
+        """
+        return _get_many(self.dataset, [self.indices[item] for item in indices])
+
     def __len__(self):
         """Return the subset's length."""
         return len(self.indices)
@@ -210,6 +270,45 @@ class ConcatDataset(SizedDataset):
 
         return self.datasets[dataset_item][item - dataset_length]
 
+    def get_many(self, indices):
+        """Fetch several indexed items from the concatenated |Dataset| at once.
+
+        Indices are grouped by enclosed |Dataset| in a vectorized fashion and each group is fetched at once from its
+        |Dataset|, through its own ``get_many`` method if any.
+
+        Args:
+            indices (Iterable[int]): Valid numerical indices for the enclosed |Dataset|.
+
+        Returns:
+            list: Data-point elements from the enclosed |Dataset|, in the ``indices`` order.
+
+        Raises:
+            IndexError: If any index is out of range.
+
+        """
+        indices = np.fromiter(indices, dtype=np.int64)
+        length = len(self)
+
+        if np.any((indices >= length) | (indices < -length)):
+            raise IndexError('Dataset index is out of range')
+        indices = np.where(indices < 0, indices + length, indices)
+
+        # Group indices by enclosed dataset
+        cumulative_size = np.asarray(self.cumulative_size, dtype=np.int64)
+        owners = np.searchsorted(cumulative_size, indices, side='right')
+        order = np.argsort(owners, kind='stable')
+        bounds = np.searchsorted(owners[order], np.arange(len(self.datasets) + 1))
+        offsets = np.concatenate(([0], cumulative_size[:-1]))
+
+        items = [None] * len(indices)
+        for dataset_item in np.flatnonzero(np.diff(bounds)).tolist():
+            positions = order[bounds[dataset_item]:bounds[dataset_item + 1]]
+            group = (indices[positions] - offsets[dataset_item]).tolist()
+            for position, item in zip(positions.tolist(), _get_many(self.datasets[dataset_item], group)):
+                items[position] = item
+
+        return items
+
     def __len__(self):
         """Return the sum of all enclosed |Dataset| length."""
         return self.cumulative_size[-1]
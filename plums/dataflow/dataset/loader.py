@@ -0,0 +1,298 @@
+from numbers import Number
+from queue import Queue, Full
+from threading import Thread, Event
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import numpy as np
+
+from plums.commons.data import DataPoint
+from .base import IterableDataset, _get_many
+
+
+def collate(samples):
+    """Collate a list of data-points into a batch.
+
+    Samples are collated recursively according to their type:
+
+    * |DataPoint| are collated as a ``(tiles, annotations)`` tuple, where ``tiles`` is the collated
+      |TileCollection| and ``annotations`` the list of the data-points |Annotation|.
+    * Mappings, *e.g.* |TileCollection|, are collated key-wise into an :class:`~collections.OrderedDict`.
+    * Tiles and :class:`~numpy.ndarray` are stacked along a new leading batch axis, *i.e.* HWC tiles are collated
+      into a single NHWC :class:`~numpy.ndarray`. Single-channel HW tiles are given a trailing channel axis.
+    * Numbers are gathered into a 1-dimensional :class:`~numpy.ndarray`.
+    * Tuples and lists are collated item-wise.
+    * Anything else (*e.g.* strings or annotations) is gathered into a list.
+
+    Args:
+        samples (Sequence[Any]): A non-empty sequence of data-points of the same structure.
+
+    Returns:
+        Any: The collated batch.
+
+    Raises:
+        ValueError: If tiles or arrays in ``samples`` do not share the same shape.
+
+    """
+    sample = samples[0]
+
+    if isinstance(sample, DataPoint):
+        return collate([sample.tiles for sample in samples]), [sample.annotation for sample in samples]
+
+    if isinstance(sample, Mapping):
+        return OrderedDict((key, collate([sample[key] for sample in samples])) for key in sample)
+
+    if isinstance(sample, np.ndarray) or hasattr(sample, '__array_interface__'):
+        arrays = [np.asarray(sample) for sample in samples]
+        if arrays[0].ndim == 2:
+            arrays = [array[..., np.newaxis] for array in arrays]
+        return np.stack(arrays)
+
+    if isinstance(sample, (Number, np.generic)):
+        return np.asarray(samples)
+
+    if isinstance(sample, (tuple, list)):
+        collated = [collate(list(items)) for items in zip(*samples)]
+        return tuple(collated) if isinstance(sample, tuple) else collated
+
+    return list(samples)
+
+
+# Worker processes hold the dataset and collate function they were initialized with.
+_worker_state = {}
+
+
+def _initialize(dataset, collate_fn):
+    _worker_state['dataset'] = dataset
+    _worker_state['collate_fn'] = collate_fn
+
+
+def _load(dataset, collate_fn, indices):
+    return collate_fn(_get_many(dataset, indices))
+
+
+def _load_in_worker(indices):
+    return _load(_worker_state['dataset'], _worker_state['collate_fn'], indices)
+
+
+class DataLoader(object):
+    """Iterate over batches of a |Dataset|, loaded ahead of time by a pool of workers.
+
+    Batches are fetched at once with the dataset :meth:`~Dataset.get_many` and collated in a pool of ``workers`` threads
+    or processes, so that up to ``prefetch`` batches per worker are being loaded while the current one is consumed.
+    Batches are yielded in the sampling order if ``ordered`` is ``True``, or as soon as they are loaded otherwise,
+    which avoids stalling on a single slow batch.
+
+    Thread workers are cheap to start and share the dataset with the caller, which suits datasets whose loading is
+    dominated by I/O or by code releasing the GIL (*e.g.* image decoding). Process workers are started once per epoch
+    and receive the dataset once, at start-up, which suits CPU-bound loading.
+
+    |IterableDataset| are read sequentially, in a single background thread, ``prefetch`` batches ahead.
+
+    .. hint::
+
+        The |DataLoader| API mimics PyTorch's own :class:`~torch.utils.data.DataLoader` but does not depend on it.
+        Batches are made of :class:`~numpy.ndarray` which may be converted afterward, *e.g.* with
+        :func:`torch.from_numpy`.
+
+    Args:
+        dataset (|SizedDataset|, |IterableDataset|): The dataset to load data-points from.
+        batch_size (int): Optional. Default to ``1``. The number of data-points in each batch.
+        shuffle (bool): Optional. Default to ``False``. If ``True``, data-points are sampled in a different random
+            order on each epoch.
+        drop_last (bool): Optional. Default to ``False``. If ``True``, the last batch is dropped if incomplete.
+        workers (int): Optional. Default to ``0``. The number of workers used to load batches. If ``0``, batches are
+            loaded in the caller's thread when requested.
+        mode (str): Optional. Default to ``'thread'``. The kind of workers used, either ``'thread'`` or
+            ``'process'``.
+        prefetch (int): Optional. Default to ``2``. The number of batches loaded ahead of time per worker.
+        ordered (bool): Optional. Default to ``True``. If ``False``, batches are yielded as soon as they are loaded
+            instead of in the sampling order.
+        collate_fn (Callable): Optional. Default to :func:`collate`. A function which turns a list of data-points
+            into a batch. It must be picklable if ``mode`` is ``'process'``.
+        seed (int): Optional. Default to ``None``. A seed for the shuffling random generator.
+
+    Raises:
+        ValueError: If ``batch_size`` or ``prefetch`` is not strictly positive, if ``workers`` is negative, if
+            ``mode`` is invalid or if ``shuffle`` is requested on an |IterableDataset|.
+
+    """
+
+    def __init__(self, dataset, batch_size=1, shuffle=False, drop_last=False, workers=0, mode='thread',
+                 prefetch=2, ordered=True, collate_fn=collate, seed=None):
+        if batch_size < 1:
+            raise ValueError('Invalid batch size: Expected a strictly positive integer, got {}.'.format(batch_size))
+        if prefetch < 1:
+            raise ValueError('Invalid prefetch depth: Expected a strictly positive integer, got {}.'.format(prefetch))
+        if workers < 0:
+            raise ValueError('Invalid number of workers: Expected a positive integer, got {}.'.format(workers))
+        if mode not in ('thread', 'process'):
+            raise ValueError('Invalid mode: Expected "thread" or "process", got {}.'.format(mode))
+        if shuffle and isinstance(dataset, IterableDataset):
+            raise ValueError('Iterable datasets can not be shuffled.')
+
+        self.dataset = dataset
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.workers = workers
+        self.mode = mode
+        self.prefetch = prefetch
+        self.ordered = ordered
+        self.collate_fn = collate_fn
+
+        self._random = np.random.default_rng(seed)
+
+    def __len__(self):
+        """Return the number of batches in an epoch.
+
+        Raises:
+            TypeError: If the dataset is an |IterableDataset|.
+
+        """
+        if isinstance(self.dataset, IterableDataset):
+            raise TypeError('The number of batches of an iterable dataset is unknown.')
+
+        if self.drop_last:
+            return len(self.dataset) // self.batch_size
+        return -(-len(self.dataset) // self.batch_size)
+
+    def __iter__(self):
+        """Iterate over an epoch of batches.
+
+        Yields:
+            Any: A batch, as collated by :attr:`collate_fn`.
+
+        """
+        if isinstance(self.dataset, IterableDataset):
+            if not self.workers:
+                return self._stream()
+            return self._prefetch_stream()
+
+        if not self.workers:
+            return (_load(self.dataset, self.collate_fn, indices) for indices in self._batches())
+        return self._prefetch()
+
+    def _batches(self):
+        """Sample the data-points indices of each batch in an epoch.
+
+        Returns:
+            list: A list of lists of data-points indices.
+
+        """
+        length = len(self.dataset)
+        order = self._random.permutation(length) if self.shuffle else np.arange(length)
+        stop = length - length % self.batch_size if self.drop_last else length
+        return [order[start:start + self.batch_size].tolist() for start in range(0, stop, self.batch_size)]
+
+    def _prefetch(self):
+        """Load batches in a pool of workers while they are being consumed.
+
+        Yields:
+            Any: A batch, as collated by :attr:`collate_fn`.
+
+        """
+        if self.mode == 'process':
+            executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_initialize,
+                                           initargs=(self.dataset, self.collate_fn))
+
+            def submit(indices):
+                return executor.submit(_load_in_worker, indices)
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.workers)
+
+            def submit(indices):
+                return executor.submit(_load, self.dataset, self.collate_fn, indices)
+
+        depth = self.prefetch * self.workers
+        pending = deque()
+        try:
+            for indices in self._batches():
+                pending.append(submit(indices))
+                if len(pending) >= depth:
+                    yield self._next(pending)
+            while pending:
+                yield self._next(pending)
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _next(self, pending):
+        """Pop the next batch to yield from the pending loads.
+
+        Args:
+            pending (deque[Future]): The pending loads, in the sampling order.
+
+        Returns:
+            Any: The oldest loaded batch, or the first batch in the sampling order if :attr:`ordered` is ``True``.
+
+        """
+        if not self.ordered:
+            wait(pending, return_when=FIRST_COMPLETED)
+            for i, future in enumerate(pending):
+                if future.done():
+                    del pending[i]
+                    return future.result()
+        return pending.popleft().result()
+
+    def _stream(self):
+        """Read and collate batches from an |IterableDataset|.
+
+        Yields:
+            Any: A batch, as collated by :attr:`collate_fn`.
+
+        """
+        samples = []
+        for sample in self.dataset:
+            samples.append(sample)
+            if len(samples) == self.batch_size:
+                yield self.collate_fn(samples)
+                samples = []
+        if samples and not self.drop_last:
+            yield self.collate_fn(samples)
+
+    def _prefetch_stream(self):
+        """Read and collate batches from an |IterableDataset| in a background thread while they are being consumed.
+
+        Yields:
+            Any: A batch, as collated by :attr:`collate_fn`.
+
+        """
+        queue = Queue(maxsize=self.prefetch)
+        stop = Event()
+
+        def put(item):
+            # Periodically check whether the consumer has stopped iterating to let the thread exit
+            while not stop.is_set():
+                try:
+                    queue.put(item, timeout=0.1)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                for batch in self._stream():
+                    if not put(('batch', batch)):
+                        return
+            except BaseException as e:  # noqa: B902
+                put(('error', e))
+            else:
+                put(('end', None))
+
+        thread = Thread(target=produce, daemon=True)
+        thread.start()
+        try:
+            while True:
+                kind, value = queue.get()
+                if kind == 'end':
+                    return
+                if kind == 'error':
+                    raise value
+                yield value
+        finally:
+            stop.set()
+            thread.join()
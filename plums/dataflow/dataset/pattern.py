@@ -1,13 +1,18 @@
+import zlib
+import asyncio
+from functools import partial
 from inspect import signature, Parameter
-from collections import defaultdict
+from collections import OrderedDict, deque
 
+import numpy as np
 from ordered_set import OrderedSet
 
 from plums.commons.path import Path
 from plums.commons.data import DataPoint
-from .base import SizedDataset
+from .base import SizedDataset, IterableDataset
 from ..utils.cache import DatasetCache, NotInCacheError
 from ..utils.path import PathResolver
+from ..utils.index import PathDatabase, GroupIndex
 
 
 def _check_driver(fn, name):
@@ -40,6 +45,39 @@ def _check_driver(fn, name):
                         'Expected function(path_tuple, **matched_groups), got function{}.'.format(name, fn_signature))
 
 
+def _make_resolvers(tile_pattern, annotation_pattern):
+    """Construct a pair of tile and annotation |PathResolver| and compute the groups used to match their files.
+
+    Args:
+        tile_pattern (str): The path pattern corresponding to the dataset tiles.
+        annotation_pattern (str): The path pattern corresponding to the dataset annotations.
+
+    Returns:
+        (|PathResolver|, |PathResolver|, tuple): The tile and annotation resolvers and the matching group names.
+
+    Raises:
+        ValueError: If the provided tile path pattern is degenerate.
+        ValueError: If the provided tile path pattern have no named group in common with the provided annotation
+            path pattern.
+
+    """
+    tile_resolver = PathResolver(tile_pattern)
+    annotation_resolver = PathResolver(annotation_pattern, reserved=('degenerate', ))
+
+    # Degeneracy sanity checks
+    if tile_resolver.degenerate:
+        raise ValueError('Invalid tile path pattern: Tile pattern degeneracy is not supported.')
+    # +-> Compute groups found in both patterns (used to match files)
+    if annotation_resolver.degenerate:
+        matching_groups = tile_resolver.group_names
+    else:
+        matching_groups = tuple(OrderedSet(tile_resolver.group_names) & OrderedSet(annotation_resolver.group_names))
+    if not matching_groups:
+        raise ValueError('Invalid path pattern pair: No common group could be found in between patterns.')
+
+    return tile_resolver, annotation_resolver, matching_groups
+
+
 class PatternDataset(SizedDataset):
     """A |SizedDataset| of which tile/annotation pairs are globed from a pair of matching dataset path patterns.
 
@@ -105,9 +143,18 @@ class PatternDataset(SizedDataset):
                     **filesystem dependent** which is no better than random.
 
         strict (bool): If ``False``, solitary tiles or annotations will be silently dropped instead of raising.
-        cache (bool): If ``True``, the dataset will be looked-up in the user's cache directory and if found loaded from
-            there instead of walking the file-system. Note that although this could speedup dataset loading multiple
-            fold for big datasets, one may load stale data when using the cache.
+        cache (bool): If ``True``, the dataset walk snapshot will be looked-up in the user's cache directory and if
+            found used to only list directories modified since the dataset was last loaded, others being validated
+            with a single ``stat`` call. This could speedup dataset loading multiple fold for big datasets, in
+            particular when new folders are regularly added to a dataset.
+        shared (bool): Optional. Default to ``False``. If ``True``, the dataset index is stored in read-only
+            memory-mapped files (in ``/dev/shm`` if available) whose pages are shared by all processes using the
+            dataset. Data loading workers then attach to the index when unpickling the dataset instead of each
+            deserializing a private copy.
+        tile_key (callable): Optional. Default to ``None``. If provided, a function of one tile |Path|, holding its
+            ``match`` dictionary, which returns a key used to sort the tile paths of each data-point once, when the
+            dataset is indexed. Otherwise, tile paths are fed to the tile driver in an order which is **filesystem
+            dependent**.
 
     Raises:
         ValueError: If the provided tile path pattern is degenerate.
@@ -121,153 +168,429 @@ class PatternDataset(SizedDataset):
     _cache = DatasetCache('pattern')  # For easy subclass prefix selection.
 
     def __init__(self, tile_pattern, annotation_pattern, tile_driver, annotation_driver, path=None, sort_key=None,
-                 strict=True, cache=False):
+                 strict=True, cache=False, shared=False, tile_key=None):
         # Handle PathLike path
         path = Path(path) if path is not None else None
 
         # Initialize resolvers
-        self._tile_resolver = PathResolver(tile_pattern)
+        self._tile_resolver, self._annotation_resolver, self._matching_groups = \
+            _make_resolvers(tile_pattern, annotation_pattern)
         _check_driver(tile_driver, 'Tile')
         self._tile_driver = tile_driver
-        self._annotation_resolver = PathResolver(annotation_pattern, reserved=('degenerate', ))
         _check_driver(annotation_driver, 'Annotation')
         self._annotation_driver = annotation_driver
         # +-> Cache key parameters
         self._keys = (tile_pattern, annotation_pattern, '' if path is None else str(path))
 
-        # Degeneracy sanity checks
-        if self._tile_resolver.degenerate:
-            raise ValueError('Invalid tile path pattern: Tile pattern degeneracy is not supported.')
-        # +-> Compute groups found in both patterns (used to match files)
-        if self._annotation_resolver.degenerate:
-            self._matching_groups = self._tile_resolver.group_names
-        else:
-            self._matching_groups = \
-                tuple(OrderedSet(self._tile_resolver.group_names) & OrderedSet(self._annotation_resolver.group_names))
-        if not self._matching_groups:
-            raise ValueError('Invalid path pattern pair: No common group could be found in between patterns.')
-
         # Cache init sequence branching
+        snapshots = {'tile': {}, 'annotation': {}}
         if cache:
             try:
-                # Retrieve entry from cache
+                # Retrieve walk snapshots from cache
                 data = self._cache.retrieve(*self._keys)
             except NotInCacheError:
                 # If not in cache, continue startup sequence normally
                 data = None
 
-            if data is not None:
-                # If in cache, load from cached data and exit.
-                self._deserialize(data)
-                return
+            if isinstance(data, dict) and isinstance(data.get('snapshot'), dict):
+                snapshots.update(data['snapshot'])
 
         # Glob and resolve paths
-        # +-> Initialise attributes
-        self._tiles_index = {}
-        self._tiles_database = defaultdict(tuple)
-        self._annotations_index = {}
-        self._annotations_database = defaultdict(tuple)
-        # +-> Glob
-        tile_generator = self._tile_resolver.find(path=path)
-        annotation_generator = self._annotation_resolver.find(path=path)
-        # +-> Compute databases
-        for tile_path in tile_generator:
-            group = tuple(tile_path.match[key] for key in self._matching_groups)
-            self._tiles_index[tile_path] = group
-            self._tiles_database[group] += (tile_path, )
-
-        for annotation_path in annotation_generator:
-            if self._annotation_resolver.degenerate:
-                group = ()
-            else:
-                group = tuple(annotation_path.match[key] for key in self._matching_groups)
-            self._annotations_index[annotation_path] = group
-            self._annotations_database[group] += (annotation_path, )
+        # +-> Glob, only listing directories modified since the snapshots were taken
+        tile_generator = self._tile_resolver.find(path=path, snapshot=snapshots['tile'])
+        annotation_generator = self._annotation_resolver.find(path=path, snapshot=snapshots['annotation'])
+        # +-> Compute compact databases
+        self._tiles_database = PathDatabase(
+            ((tuple(tile_path.match[key] for key in self._matching_groups), tile_path) for tile_path in tile_generator),
+            key=tile_key
+        )
+        if self._annotation_resolver.degenerate:
+            self._annotations_database = PathDatabase(((), annotation_path) for annotation_path in annotation_generator)
+        else:
+            self._annotations_database = PathDatabase(
+                (tuple(annotation_path.match[key] for key in self._matching_groups), annotation_path)
+                for annotation_path in annotation_generator
+            )
 
         # Compute index, assert matches, sort and compute length
-        self._group_index = []
-        for key, paths in self._tiles_database.items():
+        rows = []
+        for row, key in enumerate(self._tiles_database):
             if not self._annotation_resolver.degenerate and key not in self._annotations_database:
                 if strict:
-                    raise ValueError('Invalid dataset: {} does not have a matching annotation.'.format(paths))
+                    raise ValueError('Invalid dataset: {} does not have a matching annotation.'
+                                     .format(self._tiles_database[key]))
                 continue
-            self._group_index.append(key)
-        if not self._group_index:
+            rows.append(row)
+        if not rows:
             raise ValueError('Invalid dataset: No matches where found between tiles and annotation.')
 
         if sort_key is not None:
-            self._group_index = sorted(self._group_index, key=sort_key)
+            rows = sorted(rows, key=lambda row_: sort_key(self._tiles_database.group(row_)))
 
-        # Store dataset index in cache.
-        self._cache.cache(self._serialize(), *self._keys)
+        # Move databases to memory-mapped files if requested
+        if shared:
+            self._tiles_database = self._tiles_database.share()
+            self._annotations_database = self._annotations_database.share()
 
-    def __getitem__(self, item):
-        """Read and return the i-th |DataPoint| of the |PatternDataset|.
+        self._group_index = GroupIndex(self._tiles_database, rows)
+
+        # Store walk snapshots in cache.
+        self._cache.cache({'snapshot': snapshots}, *self._keys)
+
+    def _make_data_point(self, tiles, annotation, match):
+        """Construct a |DataPoint| from the outputs of the drivers.
+
+        Args:
+            tiles (|TileCollection|): The tile driver output.
+            annotation (|Annotation|): The annotation driver output.
+            match (dict): The data-point named-group match.
+
+        Returns:
+            DataPoint: The data-point.
+
+        """
+        return DataPoint(tiles, annotation)
+
+    def _locate(self, item):
+        """Locate the files of the i-th |DataPoint| of the |PatternDataset|.
 
         Args:
             item (int): The |DataPoint| index in the dataset.
 
         Returns:
-            DataPoint: The dataset i-th entry.
+            (dict, tuple, tuple): The named-group match, the tile paths and the annotation paths of the data-point.
 
         """
         # Fetch group
         group = self._group_index[item]
         match = {name: value for name, value in zip(self._matching_groups, group)}
 
+        annotation_path_tuple = self._annotations_database[group] \
+            if not self._annotation_resolver.degenerate else self._annotations_database[()]
+
+        return match, self._tiles_database[group], annotation_path_tuple
+
+    def _open(self, item):
+        """Return the i-th |DataPoint| of the |PatternDataset| with lazily opened tiles, *e.g.* to pack it.
+
+        If the tile driver provides an ``open(path_tuple, **matched_groups)`` method, it is used to open the tiles
+        without decoding them. Otherwise, this is equivalent to ``dataset[item]``.
+
+        Args:
+            item (int): The |DataPoint| index in the dataset.
+
+        Returns:
+            DataPoint: The dataset i-th entry.
+
+        """
+        open_tiles = getattr(self._tile_driver, 'open', None)
+        if open_tiles is None:
+            return self[item]
+
+        match, tile_path_tuple, annotation_path_tuple = self._locate(item)
+        tiles = open_tiles(tile_path_tuple, **match)
+        annotation = \
+            self._annotation_driver(annotation_path_tuple, degenerate=self._annotation_resolver.degenerate, **match)
+
+        return self._make_data_point(tiles, annotation, match)
+
+    def __getitem__(self, item):
+        """Read and return the i-th |DataPoint| of the |PatternDataset|.
+
+        Args:
+            item (int): The |DataPoint| index in the dataset.
+
+        Returns:
+            DataPoint: The dataset i-th entry.
+
+        """
+        match, tile_path_tuple, annotation_path_tuple = self._locate(item)
+
         # Fetch tiles through driver
-        tiles = self._tile_driver(self._tiles_database[group], **match)
+        tiles = self._tile_driver(tile_path_tuple, **match)
 
         # Fetch annotation through driver
-        annotation_path_tuple = self._annotations_database[group] \
-            if not self._annotation_resolver.degenerate else self._annotations_database[()]
         annotation = \
             self._annotation_driver(annotation_path_tuple, degenerate=self._annotation_resolver.degenerate, **match)
 
         # Return DataPoint
-        return DataPoint(tiles, annotation)
+        return self._make_data_point(tiles, annotation, match)
+
+    def get_many(self, indices):
+        """Read and return several |DataPoint| of the |PatternDataset| at once.
+
+        Data-points are read in the order their files were discovered on disk, regardless of the dataset sort order
+        and of the requested order, so that data-points lying in the same directories are read one after the other
+        and drivers may take advantage of their locality (*e.g.* warm caches).
+
+        Args:
+            indices (Iterable[int]): The |DataPoint| indices in the dataset.
+
+        Returns:
+            list: The dataset entries, in the ``indices`` order.
+
+        """
+        indices = np.fromiter(indices, dtype=np.int64)
+        rows = self._group_index.rows[indices]
+
+        data_points = [None] * len(indices)
+        for position in np.argsort(rows, kind='stable').tolist():
+            data_points[position] = self[int(indices[position])]
+
+        return data_points
+
+    async def aget(self, item, executor=None):
+        """Read and return the i-th |DataPoint| of the |PatternDataset| without blocking the event loop.
+
+        The tile and annotation drivers are run concurrently in an executor, so that the tiles and annotation files
+        reads overlap with each other and with the event loop.
+
+        Args:
+            item (int): The |DataPoint| index in the dataset.
+            executor (:class:`~concurrent.futures.Executor`): Optional. Default to ``None``. The executor in which the
+                drivers are run. If ``None``, the event loop default executor is used.
+
+        Returns:
+            DataPoint: The dataset i-th entry.
+
+        """
+        match, tile_path_tuple, annotation_path_tuple = self._locate(item)
+
+        loop = asyncio.get_event_loop()
+        tiles, annotation = await asyncio.gather(
+            loop.run_in_executor(executor, partial(self._tile_driver, tile_path_tuple, **match)),
+            loop.run_in_executor(executor, partial(self._annotation_driver, annotation_path_tuple,
+                                                   degenerate=self._annotation_resolver.degenerate, **match))
+        )
+
+        return self._make_data_point(tiles, annotation, match)
+
+    async def aiter(self, indices=None, in_flight=8, executor=None):
+        """Asynchronously iterate over |DataPoint| of the |PatternDataset|, reading several of them concurrently.
+
+        Up to ``in_flight`` data-points are read ahead of time with :meth:`aget`, and yielded in order, *e.g.*::
+
+            async for data_point in dataset.aiter(in_flight=16):
+                ...
+
+        Args:
+            indices (Iterable[int]): Optional. Default to ``None``. The indices of the data-points to read, in order.
+                If ``None``, every data-point is read.
+            in_flight (int): Optional. Default to ``8``. The maximum number of data-points read concurrently.
+            executor (:class:`~concurrent.futures.Executor`): Optional. Default to ``None``. The executor in which the
+                drivers are run. If ``None``, the event loop default executor is used.
+
+        Yields:
+            DataPoint: The dataset entries, in the ``indices`` order.
+
+        Raises:
+            ValueError: If ``in_flight`` is not strictly positive.
+
+        """
+        if in_flight < 1:
+            raise ValueError('Invalid number of requests in flight: '
+                             'Expected a strictly positive integer, got {}.'.format(in_flight))
+
+        indices = range(len(self)) if indices is None else indices
+
+        pending = deque()
+        try:
+            for item in indices:
+                pending.append(asyncio.ensure_future(self.aget(item, executor=executor)))
+                if len(pending) >= in_flight:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
 
     def __len__(self):
         """Return the dataset's number of tile/annotation pair groups."""
         return len(self._group_index)
 
-    def _serialize(self):
-        """Construct a JSON serializable version of the dataset."""
-        tile_database = {str(group): {'group': group,
-                                      'paths': tuple({'path': str(path),
-                                                      'match': path.match} for path in paths)}
-                         for group, paths in self._tiles_database.items()}
-        annotations_database = {str(group): {'group': group,
-                                             'paths': tuple({'path': str(path),
-                                                             'match': getattr(path, 'match', {})} for path in paths)}
-                                for group, paths in self._annotations_database.items()}
-        return {'tile': tile_database, 'annotation': annotations_database, 'group_index': self._group_index}
-
-    def _deserialize(self, data):
-        """Update internals from a JSON serialized data dictionary."""
-        # Initialize structures
-        self._tiles_index = {}
-        self._tiles_database = defaultdict(tuple)
-        self._annotations_index = {}
-        self._annotations_database = defaultdict(tuple)
-
-        # Deserialize tiles database and index
-        for path_dict in data['tile'].values():
-            group = tuple(path_dict['group'])
-            for path in path_dict['paths']:
-                tile_path = Path(path['path'])
-                tile_path.match = path['match']
-                self._tiles_index[tile_path] = group
-                self._tiles_database[group] += (tile_path, )
-
-        # Deserialize annotation database and index
-        for path_dict in data['annotation'].values():
-            group = tuple(path_dict['group'])
-            for path in path_dict['paths']:
-                annotation_path = Path(path['path'])
-                annotation_path.match = path['match']
-                self._annotations_index[annotation_path] = group
-                self._annotations_database[group] += (annotation_path, )
-
-        # Deserialize group index
-        self._group_index = [tuple(group) for group in data['group_index']]
+
+class IterablePatternDataset(IterableDataset):
+    """An |IterableDataset| which yields tile/annotation pairs as soon as they are discovered on the file-system.
+
+    Unlike the |PatternDataset|, which must walk the whole file-system to match and sort every tile/annotation pair
+    before any could be read, the |IterablePatternDataset| walks the tile and annotation path patterns alongside each
+    other and yields a |DataPoint| as soon as a tile group and its annotations were both found. Data-points are thus
+    yielded in discovery order, with a memory footprint bounded by the number of groups waiting for their counterpart.
+
+    Path patterns and drivers follow the same rules as the |PatternDataset| ones. A group of tiles (or annotations) is
+    considered complete once the walk left the deepest directory it lies in which is designated by components and
+    matching groups only, *e.g.* once all the ``{image_id}`` folders of a Playground zone were walked.
+
+    .. hint::
+        To split the dataset in between data loading workers, each worker may be given a distinct ``shard``, *e.g.* by
+        setting the :attr:`shard` and :attr:`num_shards` attributes in a worker initialization function. Groups are
+        assigned to shards from a hash of their match, so that shards are disjoint, although each worker still walks
+        the whole file-system.
+
+    Args:
+        tile_pattern (str): The path pattern corresponding to the dataset tiles.
+        annotation_pattern (str): The path pattern corresponding to the dataset annotations.
+        tile_driver (callable): A ``function(path_tuple, **matched_groups)`` callable which return a
+            |TileCollection|-like object.
+        annotation_driver (callable): A ``function(path_tuple, **matched_groups)`` callable which return an
+            |Annotation|-like object.
+        path (PathLike): If the tile and annotation path pattern a relative, a folder from which to start discovering
+            tile/annotation file pairs.
+        strict (bool): If ``False``, solitary tiles will be silently dropped instead of raising.
+        lookahead (int): Optional. Default to ``None``. If provided, the maximum number of complete tile (or
+            annotation) groups waiting for their counterpart. When exceeded, the oldest waiting group is considered
+            solitary.
+        shard (int): Optional. Default to ``0``. The shard of the dataset to yield data-points from.
+        num_shards (int): Optional. Default to ``1``. The number of shards the dataset is split into.
+
+    Raises:
+        ValueError: If the provided tile path pattern is degenerate.
+        ValueError: If the provided tile path pattern have no named group in common with the provided annotation
+            path pattern.
+        ValueError: If ``lookahead`` is not a positive integer or ``shard`` is not in ``[0, num_shards)``.
+
+    Attributes:
+        shard (int): The shard of the dataset to yield data-points from.
+        num_shards (int): The number of shards the dataset is split into.
+
+    """
+
+    def __init__(self, tile_pattern, annotation_pattern, tile_driver, annotation_driver, path=None, strict=True,
+                 lookahead=None, shard=0, num_shards=1):
+        # Initialize resolvers
+        self._path = Path(path) if path is not None else None
+        self._tile_resolver, self._annotation_resolver, self._matching_groups = \
+            _make_resolvers(tile_pattern, annotation_pattern)
+        _check_driver(tile_driver, 'Tile')
+        self._tile_driver = tile_driver
+        _check_driver(annotation_driver, 'Annotation')
+        self._annotation_driver = annotation_driver
+
+        # Sanity checks
+        if lookahead is not None and lookahead < 1:
+            raise ValueError('Invalid look-ahead: Expected a positive integer, got {}.'.format(lookahead))
+        if not 0 <= shard < num_shards:
+            raise ValueError('Invalid shard: Expected a shard in [0, {}), got {}.'.format(num_shards, shard))
+
+        self._strict = strict
+        self._lookahead = lookahead
+        self.shard = shard
+        self.num_shards = num_shards
+
+    def _in_shard(self, group):
+        """Return whether a group belongs to the dataset shard."""
+        if self.num_shards == 1:
+            return True
+        return zlib.crc32('/'.join(group).encode('utf8', 'surrogateescape')) % self.num_shards == self.shard
+
+    def _groups(self, resolver):
+        """Walk a resolver and yield its groups as soon as they are complete.
+
+        Args:
+            resolver (|PathResolver|): The resolver to walk.
+
+        Yields:
+            (tuple, tuple): A group and its paths tuple.
+
+        """
+        scope = resolver.scope(self._matching_groups)
+        current = None
+        pending = OrderedDict()
+        for path in resolver.find(path=self._path):
+            group = tuple(path.match[key] for key in self._matching_groups)
+            if not self._in_shard(group):
+                continue
+
+            # The walk left the previous scope directory: its groups are complete
+            key = tuple(path.match[name] for name in scope)
+            if key != current:
+                for group_, paths in pending.items():
+                    yield group_, tuple(paths)
+                pending = OrderedDict()
+                current = key
+
+            pending.setdefault(group, []).append(path)
+
+        for group, paths in pending.items():
+            yield group, tuple(paths)
+
+    def _solitary(self, paths):
+        """Handle a tile group which could not be matched to its annotations."""
+        if self._strict:
+            raise ValueError('Invalid dataset: {} does not have a matching annotation.'.format(paths))
+
+    def _load(self, group, tile_paths, annotation_paths):
+        """Load a |DataPoint| through the dataset drivers.
+
+        Args:
+            group (tuple): The data-point group.
+            tile_paths (tuple): The data-point tile paths.
+            annotation_paths (tuple): The data-point annotation paths.
+
+        Returns:
+            DataPoint: The data-point.
+
+        """
+        match = {name: value for name, value in zip(self._matching_groups, group)}
+
+        tiles = self._tile_driver(tile_paths, **match)
+        annotation = \
+            self._annotation_driver(annotation_paths, degenerate=self._annotation_resolver.degenerate, **match)
+
+        return DataPoint(tiles, annotation)
+
+    def __iter__(self):
+        """Walk the file-system and yield |DataPoint| as soon as their tiles and annotations were discovered.
+
+        Yields:
+            DataPoint: The discovered data-points.
+
+        Raises:
+            ValueError: If tile could not be matched to an annotation and ``strict`` is ``True``.
+
+        """
+        tiles = self._groups(self._tile_resolver)
+
+        # Degenerate annotations match every tile group
+        if self._annotation_resolver.degenerate:
+            annotation_paths = tuple(self._annotation_resolver.find(path=self._path))
+            for group, tile_paths in tiles:
+                yield self._load(group, tile_paths, annotation_paths)
+            return
+
+        annotations = self._groups(self._annotation_resolver)
+        waiting = {'tile': OrderedDict(), 'annotation': OrderedDict()}
+        while tiles is not None or annotations is not None:
+            # Walk the side whose counterpart has the most groups waiting
+            if annotations is None or tiles is not None and len(waiting['tile']) <= len(waiting['annotation']):
+                side, other = 'tile', 'annotation'
+                try:
+                    group, paths = next(tiles)
+                except StopIteration:
+                    tiles = None
+                    continue
+            else:
+                side, other = 'annotation', 'tile'
+                try:
+                    group, paths = next(annotations)
+                except StopIteration:
+                    annotations = None
+                    continue
+
+            # Match or wait for the counterpart
+            if group in waiting[other]:
+                counterpart = waiting[other].pop(group)
+                yield self._load(group, *((paths, counterpart) if side == 'tile' else (counterpart, paths)))
+            else:
+                waiting[side][group] = paths
+
+            # Enforce look-ahead
+            if self._lookahead is not None:
+                while len(waiting['tile']) > self._lookahead:
+                    self._solitary(waiting['tile'].popitem(last=False)[1])
+                while len(waiting['annotation']) > self._lookahead:
+                    waiting['annotation'].popitem(last=False)
+
+        for paths in waiting['tile'].values():
+            self._solitary(paths)
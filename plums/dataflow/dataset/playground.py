@@ -1,3 +1,4 @@
+from copy import copy
 from warnings import warn
 
 import numpy as np
@@ -9,14 +10,16 @@ from plums.commons.data import (
     MaskCollection,
     VectorMask,
     RecordCollection,
+    ArrayRecordCollection,
     Record,
     Taxonomy,
     Label,
     DataPoint
 )
 from .pattern import PatternDataset
-from ..utils.cache import DatasetCache
+from ..utils.cache import DatasetCache, MemoryCache
 from ..io import Tile, RGB, load
+from ..io.tile._backend import Image
 from ..utils.path import PathResolver
 
 
@@ -31,6 +34,12 @@ class TileDriver:
         ptype (|ptype|): Optional. Default to ``RGB``. The image pixel-type (e.g. RGB, BGR or Grey).
         dtype (:class:`~numpy.dtype`): Optional. Default to :class:`~numpy.uint8`.
             The internal :class:`~numpy.ndarray` storage data type.
+        scale (tuple): Optional. Default to ``None``. A ``(numerator, denominator)`` scaling factor applied to the
+            tiles when read, *e.g.* ``(1, 4)`` reads quarter-resolution tiles (see |TileIO|).
+        fast_dct (bool): Optional. Default to ``False``. If ``True``, use a faster but less accurate *JPEG* DCT
+            algorithm when decoding (*TurboJPEG* only).
+        fast_upsample (bool): Optional. Default to ``False``. If ``True``, use a faster but less accurate *JPEG*
+            chrominance upsampling algorithm when decoding (*TurboJPEG* only).
         fetch_ordering (bool): If ``True``, tiles will be ordered using the information stored in the dataset summary
             provided as a *JSON* file alongside each exports.
 
@@ -39,87 +48,201 @@ class TileDriver:
                     If ``False`` the |TileCollection| ordering will be entirely **filesystem dependent** which is no
                     better than random.
 
+        workers (int): Optional. Default to ``1``. The maximum number of threads used to decode the tiles of a single
+            data point. If ``None``, the :class:`~concurrent.futures.ThreadPoolExecutor` default is used.
+        cache (|TileCache|): Optional. Default to ``None``. If provided, decoded tiles are read from (or stored in) this
+            on-disk cache, which skips decoding altogether in later epochs.
+        memcache (|MemoryCache|): Optional. Default to ``None``. If provided, constructed |TileCollection| are cached in
+            this bounded in-memory cache, which may be shared with an |AnnotationDriver|. Cached collections are
+            returned as-is and must therefore not be modified in-place.
+
+    Attributes:
+        presorted (bool): If ``True``, the tiles are expected to be provided in the dataset summary order and are not
+            reordered when called. A |PlaygroundDataset| sorts tiles once and for all when indexing them and sets it on
+            its own copy of the provided driver.
+
     .. _Intelligence Playground: https://playground.intelligence-airbusds.com/
 
     """
 
-    def __init__(self, *names, ptype=RGB, dtype=np.dtype('u1'), fetch_ordering=True):
+    def __init__(self, *names, ptype=RGB, dtype=np.dtype('u1'), scale=None, fast_dct=False, fast_upsample=False,
+                 fetch_ordering=True, workers=1, cache=None, memcache=None):
         # Tile format configuration
         self._names = names
         self._explicit = bool(names)
         self._ptype = ptype
         self._dtype = dtype
 
+        # Tile decoding configuration
+        self._decoding_options = {'scale': scale, 'fast_dct': fast_dct, 'fast_upsample': fast_upsample}
+        self._workers = workers
+        self._cache = cache
+        self._memcache = memcache
+
         # Tile ordering configuration
+        self.presorted = False
         self._summaries = None
         self._summary_resolver = None
         if fetch_ordering:
             self._summary_resolver = PathResolver('{dataset_id}/dataset_summary.json')
 
-    def __call__(self, path_tuple, **matched_groups):
-        """Open a set of tiles in a |TileCollection|.
+    @property
+    def fetch_ordering(self):
+        """bool: ``True`` if tiles are ordered using the information stored in the dataset summaries."""
+        return self._summary_resolver is not None
 
-        Args:
-            path_tuple (Tuple[PathLike]): A tuple of paths pointing to the tiles to open.
-            **matched_groups (str): A  ``group_name: value`` mapping of the *path pattern* group match in the paths.
+    def load_summaries(self, root):
+        """Load the dataset summaries found in a *Playground* datasets root directory.
 
-        Returns:
-            |TileCollection|: A |TileCollection| with the opened tiles. If names where provided in the constructor,
-            they are used as key in the collection, otherwise, the default applies.
+        Summaries are loaded once, as ``image_id: rank`` mappings for each zone, and are used by :meth:`rank`.
+
+        Args:
+            root (PathLike): The directory holding the datasets.
 
         Raises:
-            ValueError: If the number of names provided in the constructor and the number of retrieved tiles mismatch.
+            FileNotFoundError: If no dataset summary could be found in ``root``.
 
         """
-        # If need be resolve and load summaries
-        if self._summaries is None and self._summary_resolver is not None:
-            root = path_tuple[0].root_to_anchor(matched_groups['dataset_id'])
+        def _make_order_index(path):
+            """Construct a ``zone_id: {image_id: rank}`` mapping from a dataset summary.
+
+            Args:
+                path (Path): A path to a *JSON* dataset summary file.
 
-            def _make_order_index(path):
-                """Construct a ``zone_id: (image_id, )`` mapping from a dataset summary.
+            Returns:
+                dict: A ``zone_id: {image_id: rank}`` mapping where ``rank`` is the image position in the zone.
 
-                Args:
-                    path (Path): A path to a *JSON* dataset summary file.
+            """
+            summary = load(path)
+            return {zone_id: {image_id: i for i, image_id in enumerate(image_ids)}
+                    for zone_id, image_ids in zip(summary['zoneIds'], summary['imageIds'])}
 
-                Returns:
-                    dict: A ``zone_id: (image_id, )`` mapping where ``(image_id, )`` is an **ordered** tuple of image
-                    identifiers.
+        summaries = {path.match['dataset_id']: _make_order_index(path)
+                     for path in self._summary_resolver.find(Path(root))}
 
-                """
-                summary = load(path)
-                return {zone_id: tile_ids for zone_id, tile_ids in zip(summary['zoneIds'], summary['imageIds'])}
+        if not summaries:
+            raise FileNotFoundError('Invalid dataset: No file summaries could be found.')
 
-            self._summaries = \
-                {path.match['dataset_id']: _make_order_index(path) for path in self._summary_resolver.find(root)}
+        self._summaries = summaries
 
-            if not self._summaries:
-                raise FileNotFoundError('Invalid dataset: No file summaries could be found.')
+    def rank(self, dataset_id, zone_id, image_id):
+        """Return the position of an image in its zone, as stored in the loaded dataset summaries.
+
+        Args:
+            dataset_id (str): The image dataset identifier.
+            zone_id (str): The image zone identifier.
+            image_id (str): The image identifier.
 
-        # Reorder path tuple if need be
-        if self._summaries is not None:
+        Returns:
+            int: The image position in the zone.
+
+        Raises:
+            ValueError: If the dataset, the zone or the image is missing from the summaries.
+
+        """
+        try:
+            order = self._summaries[dataset_id][zone_id]
+        except KeyError:
+            raise ValueError('Invalid dataset: Some zones or datasets seem to be missing from the summaries.')
+
+        try:
+            return order[image_id]
+        except KeyError:
+            raise ValueError('Invalid dataset: Some images seem to be missing from the summaries.')
+
+    def _order(self, path_tuple, matched_groups):
+        """Reorder a tuple of tile paths in the dataset summary order if need be."""
+        if self._summary_resolver is not None and not self.presorted:
             dataset_id = matched_groups['dataset_id']
             zone_id = matched_groups['zone_id']
 
-            try:
-                order = {image_id: i for i, image_id in enumerate(self._summaries[dataset_id][zone_id])}
-            except KeyError:
-                raise ValueError('Invalid dataset: Some zones or datasets seem to be missing from the summaries.')
+            # +-> If need be resolve and load summaries
+            if self._summaries is None:
+                self.load_summaries(path_tuple[0].root_to_anchor(dataset_id))
 
-            try:
-                path_tuple = tuple(sorted(path_tuple, key=lambda path: order[path[-2]]))
-            except KeyError:
-                raise ValueError('Invalid dataset: Some images seem to be missing from the summaries.')
+            path_tuple = tuple(sorted(path_tuple, key=lambda path: self.rank(dataset_id, zone_id, path[-2])))
 
-        # Load tiles
-        tiles = [Tile(path, ptype=self._ptype, dtype=self._dtype, **getattr(path, 'match', {})) for path in path_tuple]
+        return path_tuple
+
+    def _collect(self, tiles):
+        """Gather tiles in a |TileCollection|, named after the names provided in the constructor if any.
+
+        Raises:
+            ValueError: If the number of names provided in the constructor and the number of tiles mismatch.
+
+        """
         if self._explicit:
             if len(tiles) != len(self._names):
                 raise ValueError('The number of tiles is incompatible with the provided number '
                                  'of names: {} != {}.'.format(len(tiles), len(self._names)))
             return TileCollection(*((name, tile) for name, tile in zip(self._names, tiles)))
-
         return TileCollection(*tiles)
 
+    def open(self, path_tuple, **matched_groups):
+        """Open a set of tiles in a |TileCollection| without decoding them.
+
+        Only the tiles file headers are read and tiles are decoded the first time their data is accessed (see
+        :meth:`TileIO.probe <plums.dataflow.io.tile.tile.Tile.probe>`). Neither the decoded tiles cache nor the
+        in-memory cache are used.
+
+        Args:
+            path_tuple (Tuple[PathLike]): A tuple of paths pointing to the tiles to open.
+            **matched_groups (str): A  ``group_name: value`` mapping of the *path pattern* group match in the paths.
+
+        Returns:
+            |TileCollection|: A |TileCollection| with the lazily opened tiles, named as in :meth:`__call__`.
+
+        Raises:
+            ValueError: If the number of names provided in the constructor and the number of retrieved tiles mismatch.
+
+        """
+        path_tuple = self._order(path_tuple, matched_groups)
+        return self._collect([Tile.probe(path, ptype=self._ptype, dtype=self._dtype, **self._decoding_options,
+                                         **getattr(path, 'match', {}))
+                              for path in path_tuple])
+
+    def __call__(self, path_tuple, **matched_groups):
+        """Open a set of tiles in a |TileCollection|.
+
+        Args:
+            path_tuple (Tuple[PathLike]): A tuple of paths pointing to the tiles to open.
+            **matched_groups (str): A  ``group_name: value`` mapping of the *path pattern* group match in the paths.
+
+        Returns:
+            |TileCollection|: A |TileCollection| with the opened tiles. If names where provided in the constructor,
+            they are used as key in the collection, otherwise, the default applies.
+
+        Raises:
+            ValueError: If the number of names provided in the constructor and the number of retrieved tiles mismatch.
+
+        """
+        path_tuple = self._order(path_tuple, matched_groups)
+
+        # If need be, try retrieving from the in-memory cache
+        if self._memcache is not None:
+            key = (path_tuple, repr(self._ptype), np.dtype(self._dtype).str, tuple(self._decoding_options.items()))
+            tiles = self._memcache.get(key)
+            if tiles is not None:
+                return tiles
+
+        # Load tiles
+        if self._cache is not None:
+            tiles = [Tile(path, ptype=self._ptype, dtype=self._dtype, cache=self._cache, **self._decoding_options,
+                          **getattr(path, 'match', {}))
+                     for path in path_tuple]
+        else:
+            images = Image.load_many(path_tuple, workers=self._workers, **self._decoding_options)
+            tiles = [Tile(path, ptype=self._ptype, dtype=self._dtype,
+                          __array__=np.asarray(image), **getattr(path, 'match', {}))
+                     for path, image in zip(path_tuple, images)]
+        tiles = self._collect(tiles)
+
+        # If need be, store tiles in the in-memory cache
+        if self._memcache is not None:
+            self._memcache.put(key, tiles)
+
+        return tiles
+
 
 class AnnotationDriver:
     """A basic driver to open `Intelligence Playground`_ annotation GeoJSON **FeatureCollection**  as |Annotation|.
@@ -131,60 +254,141 @@ class AnnotationDriver:
         record_id_key (str): The key used to find a record's unique identifier in its ``properties`` mapping.
         confidence_key (str): The key used to find a record's confidence score in its ``properties`` mapping.
         taxonomy (Taxonomy): If provided, a |Taxonomy| against which all records' labels will be validated.
-        cache (bool): Optional. Default to ``False``. If ``True``, all constructed |Annotation| will be cached in
-            memory to speed up future retrieval.
+        cache (bool, |MemoryCache|): Optional. Default to ``False``. If ``True``, all constructed |Annotation| will be
+            cached in memory to speed up future retrieval. A |MemoryCache| may be provided instead to bound the cache
+            size or to share it with a |TileDriver|.
+        columnar (bool): Optional. Default to ``True``. If ``True``, features are parsed straight into an
+            |ArrayRecordCollection| whose |Record| are only constructed when accessed. Otherwise, or if the features
+            coordinates could not be stored in arrays, a |Record| is constructed for each feature in a
+            |RecordCollection|.
 
 
     .. _Intelligence Playground: https://playground.intelligence-airbusds.com/
 
     """
 
-    def __init__(self, record_id_key='record_id', confidence_key='confidence', taxonomy=None, cache=False):
+    def __init__(self, record_id_key='record_id', confidence_key='confidence', taxonomy=None, cache=False,
+                 columnar=True):
         self.taxonomy = taxonomy
+        self._columnar = columnar
         self._record_id_key = record_id_key
         self._confidence_key = confidence_key
-        self._cache = cache
-        self._memcache = {}
+        if isinstance(cache, MemoryCache):
+            self._cache = True
+            self._memcache = cache
+        else:
+            self._cache = bool(cache)
+            self._memcache = MemoryCache()
 
     @staticmethod
     def _cleanup(feature, key):
         if key in feature['properties']:  # Cleanup properties
             feature['properties'].pop(key)
 
-    def __call__(self, path_tuple, **matched_groups):
-        """Open a *Playground* annotation GeoJSON file as an |Annotation|.
+    def _parse(self, features):
+        """Parse GeoJSON features straight into an |ArrayRecordCollection|, without constructing any |Record|.
 
         Args:
-            path_tuple (Tuple[PathLike]): A tuple containing a single path pointing to a valid GeoJSON file.
-            **matched_groups (str): A  ``group_name: value`` mapping of the *path pattern* group match in the paths.
+            features (list): The GeoJSON features of a *Playground* annotation **FeatureCollection**.
 
         Returns:
-            |Annotation|: An |Annotation| with |Record| in the tile and a |VectorMask| corresponding to the *zone*
-            footprint in the tile.
+            (|ArrayRecordCollection|, |VectorMask|): The record collection and the *zone* footprint mask, or
+            ``(None, None)`` if the features could not be stored in arrays, *e.g.* if their coordinates do not share the
+            same dimension.
 
         Raises:
-            ValueError: If no valid |Annotation| could be constructed from the opened JSON file.
-            ValueError: If more than one path was provided.
+            ValueError: If some records have no label or if their labels are incompatible with :attr:`taxonomy`.
 
         """
-        if len(path_tuple) >= 2:
-            raise ValueError('More than one annotation file was provided.')
+        reserved = {'tags', self._confidence_key, self._record_id_key,
+                    'coordinates', 'labels', 'confidence', 'id', 'taxonomy'}
 
-        # If cache is enabled, try retrieving from cache
-        if self._cache:
-            annotation = self._memcache.get(path_tuple, None)
-            if annotation is not None:
-                return annotation
+        # +-> Prepare defaults values
+        data_mask = VectorMask([[[0, 0], [0, 0], [0, 0], [0, 0], [0, 0]]], 'zone_footprint', mask=True)
+        vertices = []
+        ring_offsets = [0]
+        geometry_offsets = [0]
+        points = []
+        label_indices = []
+        label_offsets = [0]
+        label_names = {}
+        confidences = []
+        ids = []
+        properties = []
 
-        # Load annotation
-        feature_collection = load(path_tuple[0])
+        # +-> Iterate over features
+        for feature in features:
+            feature_properties = feature['properties']
+
+            # +-> If found, retrieve zone footprint mask
+            if feature_properties.get('mask') is not None:
+                data_mask = VectorMask(feature['geometry']['coordinates'], 'zone_footprint', mask=True)
+                continue
 
+            # +-> Get record coordinates
+            coordinates = feature['geometry']['coordinates']
+            if coordinates and isinstance(coordinates[0], (list, tuple)):
+                for ring in coordinates:
+                    vertices.extend(ring)
+                    ring_offsets.append(len(vertices))
+                points.append(False)
+            else:
+                vertices.append(coordinates)
+                ring_offsets.append(len(vertices))
+                points.append(True)
+            geometry_offsets.append(len(ring_offsets) - 1)
+
+            # +-> Get record labels as indices in the label names table
+            for tag in feature_properties['tags']:
+                label_indices.append(label_names.setdefault(tag, len(label_names)))
+            label_offsets.append(len(label_indices))
+
+            # +-> Get record confidence, identifier and additional properties
+            confidences.append(feature_properties.get(self._confidence_key))
+            ids.append(feature_properties.get(self._record_id_key))
+            properties.append({key: value for key, value in feature_properties.items() if key not in reserved})
+
+        # +-> Make arrays
+        # +-> Integer coordinates and confidences are kept as integers if they all are, as in the source file
+        try:
+            vertices = np.array(vertices) if vertices else np.zeros((0, 2))
+            if any(confidence is None for confidence in confidences):
+                confidences = np.array([np.nan if confidence is None else confidence for confidence in confidences],
+                                       dtype=np.float64)
+            else:
+                confidences = np.array(confidences)
+                confidences = confidences.astype(np.int64 if confidences.dtype.kind in 'iu' else np.float64)
+        except (ValueError, TypeError):
+            return None, None
+        if vertices.ndim != 2 or vertices.dtype.kind not in 'iuf':
+            return None, None
+
+        record_collection = ArrayRecordCollection.from_arrays(vertices, ring_offsets, geometry_offsets,
+                                                              label_indices, label_offsets, label_names,
+                                                              confidences=confidences, ids=ids, properties=properties,
+                                                              points=points, taxonomy=self.taxonomy)
+
+        return record_collection, data_mask
+
+    def _parse_records(self, features):
+        """Parse GeoJSON features into a |RecordCollection|, one |Record| at a time.
+
+        Args:
+            features (list): The GeoJSON features of a *Playground* annotation **FeatureCollection**.
+
+        Returns:
+            (|RecordCollection|, |VectorMask|): The record collection and the *zone* footprint mask.
+
+        Raises:
+            ValueError: If no valid |Record| could be constructed from the features.
+
+        """
         # +-> Prepare defaults values
         data_mask = VectorMask([[[0, 0], [0, 0], [0, 0], [0, 0], [0, 0]]], 'zone_footprint', mask=True)
         record_collection = RecordCollection(taxonomy=self.taxonomy)
 
         # +-> Iterate over features
-        for feature in feature_collection['features']:
+        for feature in features:
             # +-> If found, retrieve zone footprint mask
             if feature['properties'].get('mask') is not None:
                 data_mask = VectorMask(feature['geometry']['coordinates'], 'zone_footprint', mask=True)
@@ -211,11 +415,48 @@ class AnnotationDriver:
 
             record_collection.append(Record(coordinates, labels, confidence, id_, **feature['properties']))
 
+        return record_collection, data_mask
+
+    def __call__(self, path_tuple, **matched_groups):
+        """Open a *Playground* annotation GeoJSON file as an |Annotation|.
+
+        Args:
+            path_tuple (Tuple[PathLike]): A tuple containing a single path pointing to a valid GeoJSON file.
+            **matched_groups (str): A  ``group_name: value`` mapping of the *path pattern* group match in the paths.
+
+        Returns:
+            |Annotation|: An |Annotation| with |Record| in the tile and a |VectorMask| corresponding to the *zone*
+            footprint in the tile.
+
+        Raises:
+            ValueError: If no valid |Annotation| could be constructed from the opened JSON file.
+            ValueError: If more than one path was provided.
+
+        """
+        if len(path_tuple) >= 2:
+            raise ValueError('More than one annotation file was provided.')
+
+        # If cache is enabled, try retrieving from cache
+        if self._cache:
+            annotation = self._memcache.get(path_tuple, None)
+            if annotation is not None:
+                return annotation
+
+        # Load annotation
+        feature_collection = load(path_tuple[0])
+
+        # +-> Parse features
+        record_collection, data_mask = None, None
+        if self._columnar:
+            record_collection, data_mask = self._parse(feature_collection['features'])
+        if record_collection is None:
+            record_collection, data_mask = self._parse_records(feature_collection['features'])
+
         annotation = Annotation(record_collection, mask_collection=MaskCollection(data_mask), filename=path_tuple[0])
 
         # If cache is enabled, store annotation in cache
         if self._cache:
-            self._memcache[path_tuple] = annotation
+            self._memcache.put(path_tuple, annotation)
 
         return annotation
 
@@ -329,9 +570,10 @@ class PlaygroundDataset(PatternDataset):
         use_taxonomy (bool): Optional. Default to ``True``. If ``False``, the global taxonomy will not be passed to
             the annotation driver and implicit taxonomies for each annotation files, with no interplay guarantee.
         strict (bool): If ``False``, solitary tiles or annotations will be silently dropped instead of raising.
-        cache (bool): If ``True``, the dataset will be looked-up in the user's cache directory and if found loaded from
-            there instead of walking the file-system. Note that although this could speedup dataset loading multiple
-            fold for big datasets, one may load stale data when using the cache.
+        cache (bool): If ``True``, the dataset walk snapshot will be looked-up in the user's cache directory and if
+            found used to only list directories modified since the dataset was last loaded (see |PatternDataset|).
+        shared (bool): Optional. Default to ``False``. If ``True``, the dataset index is stored in read-only
+            memory-mapped files shared by all processes using the dataset (see |PatternDataset|).
 
     Warnings:
         If providing a custom annotation driver, the ``use_taxonomy`` flag is not guaranteed to work and it is up to the
@@ -355,7 +597,7 @@ class PlaygroundDataset(PatternDataset):
 
     def __init__(self, path, select_datasets=(), select_zones=(), select_images=(), select_tiles=(),
                  exclude_datasets=(), exclude_zones=(), exclude_images=(), exclude_tiles=(), tile_driver=None,
-                 annotation_driver=None, use_taxonomy=True, strict=True, cache=False):
+                 annotation_driver=None, use_taxonomy=True, strict=True, cache=False, shared=False):
         # Build eventual regular expressions from include and exclude sequences
         # +-> Dataset:
         dataset_regex = r'[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}'
@@ -413,12 +655,35 @@ class PlaygroundDataset(PatternDataset):
                                                                     zone_regex=zone_regex,
                                                                     tile_regex=tile_regex)
 
+        # Order tiles once and for all from the dataset summaries, if need be
+        # +-> If summaries are missing or incomplete, ordering (and raising) is left to the driver when called
+        # +-> A provided driver is copied so that its summaries and ordering state are left untouched
+        tile_driver = TileDriver() if tile_driver is None else tile_driver
+        presorted = isinstance(tile_driver, TileDriver) and tile_driver.fetch_ordering
+        if presorted:
+            tile_driver = copy(tile_driver)
+            try:
+                tile_driver.load_summaries(path)
+            except FileNotFoundError:
+                presorted = False
+
+        def tile_key(tile_path):
+            nonlocal presorted
+            try:
+                return tile_driver.rank(tile_path.match['dataset_id'], tile_path.match['zone_id'], tile_path[-2])
+            except ValueError:
+                presorted = False
+                return -1
+
         # Initialize dataset
         super(PlaygroundDataset, self).__init__(tile_pattern=tile_pattern, annotation_pattern=annotation_pattern,
-                                                tile_driver=TileDriver() if tile_driver is None else tile_driver,
+                                                tile_driver=tile_driver,
                                                 annotation_driver=AnnotationDriver()
                                                 if annotation_driver is None else annotation_driver,
-                                                path=path, strict=strict, sort_key=lambda group: group, cache=cache)
+                                                path=path, strict=strict, sort_key=lambda group: group, cache=cache,
+                                                shared=shared, tile_key=tile_key if presorted else None)
+        if presorted:
+            tile_driver.presorted = True
 
         # Load taxonomies and attach it to the annotation driver if needed
         path = Path(path)
@@ -454,22 +719,19 @@ class PlaygroundDataset(PatternDataset):
         if use_taxonomy:
             self._annotation_driver.taxonomy = reference_taxonomy
 
-    def __getitem__(self, item):
-        """Read and return the i-th |DataPoint| of the |PlaygroundDataset|.
+    def _make_data_point(self, tiles, annotation, match):
+        """Construct a |DataPoint| from the outputs of the drivers, along with its identifiers.
 
         Args:
-            item (int): The |DataPoint| index in the dataset.
+            tiles (|TileCollection|): The tile driver output.
+            annotation (|Annotation|): The annotation driver output.
+            match (dict): The data-point named-group match.
 
         Returns:
-            DataPoint: The dataset i-th entry.
+            DataPoint: The data-point, with its ``dataset_id``, ``zone_id`` and ``tile_id`` properties.
 
         """
-        # Fetch match
-        group = self._group_index[item]
-        match = {name: value for name, value in zip(self._matching_groups, group)}
-
-        # Fetch data point
-        data_point = super(PlaygroundDataset, self).__getitem__(item)
+        data_point = super(PlaygroundDataset, self)._make_data_point(tiles, annotation, match)
         data_point.dataset_id = match['dataset_id']
         data_point.zone_id = match['zone_id']
         data_point.tile_id = match['tile_id']
@@ -0,0 +1,261 @@
+import os
+import pickle
+import weakref
+from threading import Lock
+
+import numpy as np
+
+from plums.commons.path import Path
+from plums.commons.data import TileCollection
+from .base import SizedDataset
+from ..io import Tile, RGB
+
+
+def _close_descriptors(descriptors):
+    """Close and forget all file descriptors of a ``shard: descriptor`` mapping."""
+    for descriptor in descriptors.values():
+        os.close(descriptor)
+    descriptors.clear()
+
+
+class ShardedDataset(SizedDataset):
+    """A |Dataset| which reads |DataPoint| packed in a few large shard files instead of many small files.
+
+    Reading thousands of tiny tiles and annotation files is dominated by per-file overhead (*i.e.* ``open`` and ``stat``
+    calls) on network or parallel filesystems. A |ShardedDataset| stores each |DataPoint| as a single contiguous record
+    made of its pickled metadata and pre-parsed |Annotation| followed by its tiles' encoded file contents. Records are
+    appended into sequential shard files and located through an offset index, so that each |DataPoint| is read with a
+    single ``pread`` call and tiles are decoded from memory.
+
+    A packed dataset directory has the following file structure:
+
+    ::
+
+        ├── index.npy
+        ├── shard_00000.bin
+        ├── shard_00001.bin
+        └── ...
+
+    Use :meth:`pack` to convert any |SizedDataset| of |DataPoint| (*e.g.* a |PlaygroundDataset|) into a packed dataset.
+
+    Args:
+        path (PathLike): The path to the packed dataset directory.
+        ptype (|ptype|): Optional. Default to ``RGB``. The tiles pixel-type (e.g. RGB, BGR or Grey).
+        dtype (:class:`~numpy.dtype`): Optional. Default to :class:`~numpy.uint8`.
+            The tiles internal :class:`~numpy.ndarray` storage data type.
+        scale (tuple): Optional. Default to ``None``. A ``(numerator, denominator)`` scaling factor applied to the
+            tiles when decoded (see |TileIO|).
+        fast_dct (bool): Optional. Default to ``False``. If ``True``, use a faster but less accurate *JPEG* DCT
+            algorithm when decoding (*TurboJPEG* only).
+        fast_upsample (bool): Optional. Default to ``False``. If ``True``, use a faster but less accurate *JPEG*
+            chrominance upsampling algorithm when decoding (*TurboJPEG* only).
+
+    Raises:
+        FileNotFoundError: If no shard index could be found in ``path``.
+
+    Attributes:
+        path (|Path|): The path to the packed dataset directory.
+
+    """
+
+    _index_dtype = np.dtype([('shard', '<u4'), ('offset', '<u8'), ('length', '<u8'), ('header', '<u8')])
+
+    def __init__(self, path, ptype=RGB, dtype=np.dtype('u1'), scale=None, fast_dct=False, fast_upsample=False):
+        self.path = Path(path)
+
+        try:
+            self._index = np.load(str(self.path / 'index.npy'))
+        except FileNotFoundError:
+            raise FileNotFoundError('Invalid dataset: No shard index could be found in {}.'.format(self.path))
+
+        # Tile format configuration
+        self._ptype = ptype
+        self._dtype = dtype
+        self._decoding_options = {'scale': scale, 'fast_dct': fast_dct, 'fast_upsample': fast_upsample}
+
+        # Shard file descriptors are opened lazily, e.g. once in each worker process.
+        self._open_descriptors()
+
+    def _open_descriptors(self):
+        """Reset the lazily opened shard file descriptors, which are closed along with the dataset."""
+        self._descriptors = {}
+        self._lock = Lock()
+        self._finalizer = weakref.finalize(self, _close_descriptors, self._descriptors)
+
+    @staticmethod
+    def _shard_name(shard):
+        return 'shard_{:05d}.bin'.format(shard)
+
+    @classmethod
+    def pack(cls, dataset, path, shard_size=1 << 30, **kwargs):
+        """Pack a |Dataset| of |DataPoint| into shard files and return the corresponding |ShardedDataset|.
+
+        Tiles are stored with their original encoded file content (no re-encoding takes place) and annotations are
+        stored pre-parsed, so that neither image re-compression nor *JSON* parsing happens when reading. Tiles of a
+        |PatternDataset| whose tile driver can open tiles lazily (*e.g.* a |PlaygroundDataset|) are not decoded while
+        packing.
+
+        Args:
+            dataset (SizedDataset): A |Dataset| of |DataPoint| whose tiles were read from files (*i.e.* |TileIO|).
+            path (PathLike): The path to the packed dataset directory to create.
+            shard_size (int): Optional. Default to 1 GiB. The size, in bytes, above which a new shard file is started.
+            **kwargs (Any): Additional arguments passed to the |ShardedDataset| constructor.
+
+        Returns:
+            |ShardedDataset|: The packed dataset.
+
+        Raises:
+            ValueError: If a |DataPoint| tile was not read from a file.
+
+        """
+        path = Path(path)
+        os.makedirs(str(path), exist_ok=True)
+
+        index = np.zeros((len(dataset), ), dtype=cls._index_dtype)
+        shard = -1
+        f = None
+        try:
+            # Tiles are only read as raw file contents, avoid decoding them if the dataset allows it
+            get = getattr(dataset, '_open', dataset.__getitem__)
+            for i in range(len(dataset)):
+                header, buffers = cls._pack_data_point(get(i))
+                length = len(header) + sum(len(buffer) for buffer in buffers)
+
+                # Start a new shard if the current one is full
+                if f is None or (f.tell() > 0 and f.tell() + length > shard_size):
+                    if f is not None:
+                        f.close()
+                    shard += 1
+                    f = open(str(path / cls._shard_name(shard)), 'wb')
+
+                index[i] = (shard, f.tell(), length, len(header))
+                f.write(header)
+                for buffer in buffers:
+                    f.write(buffer)
+        finally:
+            if f is not None:
+                f.close()
+
+        np.save(str(path / 'index.npy'), index)
+
+        return cls(path, **kwargs)
+
+    @staticmethod
+    def _pack_data_point(data_point):
+        """Serialize a |DataPoint| as a pickled header and a sequence of tile file contents.
+
+        Args:
+            data_point (|DataPoint|): The |DataPoint| to serialize.
+
+        Returns:
+            (bytes, [bytes]): The pickled header and the tiles encoded file contents.
+
+        """
+        tiles = []
+        buffers = []
+        for name, tile in data_point.tiles.items():
+            filename = getattr(tile, 'filename', None)
+            if filename is None:
+                raise ValueError('Invalid tile: Expected a tile read from a file, got {}.'.format(tile))
+
+            with open(str(filename), 'rb') as f:
+                buffer = f.read()
+
+            tiles.append((name, Path(str(filename)), dict(tile.properties), len(buffer)))
+            buffers.append(buffer)
+
+        state = data_point.__getstate__()
+        state['tiles'] = tuple(tiles)
+
+        return pickle.dumps((type(data_point), state), protocol=pickle.HIGHEST_PROTOCOL), buffers
+
+    def _read(self, shard, offset, length):
+        """Read a record from a shard file.
+
+        Args:
+            shard (int): The shard number.
+            offset (int): The record offset in the shard file.
+            length (int): The record length.
+
+        Returns:
+            bytes: The record content.
+
+        """
+        descriptor = self._descriptors.get(shard)
+        if descriptor is None:
+            with self._lock:
+                descriptor = self._descriptors.get(shard)
+                if descriptor is None:
+                    descriptor = os.open(str(self.path / self._shard_name(shard)), os.O_RDONLY)
+                    self._descriptors[shard] = descriptor
+
+        # pread does not share the file position and is safe to use concurrently (and after a fork).
+        if hasattr(os, 'pread'):
+            chunks = []
+            while length > 0:
+                chunk = os.pread(descriptor, length, offset)
+                if not chunk:
+                    raise EOFError('Invalid dataset: Shard {} is truncated.'.format(shard))
+                chunks.append(chunk)
+                length -= len(chunk)
+                offset += len(chunk)
+            return chunks[0] if len(chunks) == 1 else b''.join(chunks)
+
+        with self._lock:
+            os.lseek(descriptor, offset, os.SEEK_SET)
+            return os.read(descriptor, length)
+
+    def close(self):
+        """Close all opened shard files.
+
+        Shard files are also closed when the dataset is garbage collected, and are reopened if read afterward.
+
+        """
+        with self._lock:
+            _close_descriptors(self._descriptors)
+
+    def __getstate__(self):
+        """Return the dataset state without opened file descriptors, *e.g.* to send it to worker processes."""
+        state = self.__dict__.copy()
+        del state['_descriptors']
+        del state['_lock']
+        del state['_finalizer']
+        return state
+
+    def __setstate__(self, state):
+        """Restore the dataset state, shard files being reopened when read."""
+        self.__dict__.update(state)
+        self._open_descriptors()
+
+    def __getitem__(self, item):
+        """Read and return the i-th |DataPoint| of the |ShardedDataset|.
+
+        Args:
+            item (int): The |DataPoint| index in the dataset.
+
+        Returns:
+            DataPoint: The dataset i-th entry.
+
+        """
+        shard, offset, length, header = (int(value) for value in self._index[item])
+        record = memoryview(self._read(shard, offset, length))
+
+        cls, state = pickle.loads(record[:header])
+
+        tiles = []
+        position = header
+        for name, filename, properties, size in state['tiles']:
+            tile = Tile.from_bytes(record[position:position + size], ptype=self._ptype, dtype=self._dtype,
+                                   filename=filename, **self._decoding_options, **properties)
+            tiles.append((name, tile))
+            position += size
+        state['tiles'] = TileCollection(*tiles)
+
+        data_point = cls.__new__(cls)
+        data_point.__setstate__(state)
+
+        return data_point
+
+    def __len__(self):
+        """Return the dataset's number of data-points."""
+        return len(self._index)
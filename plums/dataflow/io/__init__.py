@@ -1,2 +1,2 @@
-from .tile import Tile, rgb, RGB, rgba, RGBA, bgr, BGR, bgra, BGRA, grey, GREY, y, Y, ptype
+from .tile import Tile, BufferPool, TileCache, rgb, RGB, rgba, RGBA, bgr, BGR, bgra, BGRA, grey, GREY, y, Y, ptype
 from .json import load, dump
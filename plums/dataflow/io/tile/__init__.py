@@ -1 +1 @@
-from .tile import Tile, rgb, RGB, rgba, RGBA, bgr, BGR, bgra, BGRA, grey, GREY, y, Y, ptype
+from .tile import Tile, BufferPool, TileCache, rgb, RGB, rgba, RGBA, bgr, BGR, bgra, BGRA, grey, GREY, y, Y, ptype
@@ -1,4 +1,10 @@
-import imghdr
+import struct
+from io import BytesIO
+from functools import partial
+from threading import Lock
+from contextlib import contextmanager
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -27,6 +33,7 @@ except ImportError:
 
 try:
     import cv2
+    _CV2_REDUCED_FLAGS = {2: cv2.IMREAD_REDUCED_COLOR_2, 4: cv2.IMREAD_REDUCED_COLOR_4, 8: cv2.IMREAD_REDUCED_COLOR_8}
     _HAS_CV2 = True
 except ImportError:
     _HAS_CV2 = False
@@ -37,32 +44,283 @@ if not _HAS_TURBO_JPEG and not _HAS_LYCON and not _HAS_CV2 and not _HAS_PILLOW:
                       'For more information, please refer to the documentation.')
 
 
-# Image IO operation per type
-def _load_jpg(filepath):
-    """Open a JPG image as an RGB :class:`~numpy.ndarray`.
+# Image scaling helpers
+def _scaled_size(height, width, scale):
+    """Compute the size of an image once scaled by a rational factor, rounding up as *libjpeg* does.
 
     Args:
-        filepath (|Path|): The path to the image file on disk.
+        height (int): The original image height.
+        width (int): The original image width.
+        scale (tuple): A ``(numerator, denominator)`` scaling factor.
 
     Returns:
-        :class:`~numpy.ndarray`: The image an HWC array of value.
+        (int, int): The scaled ``(height, width)``.
 
     """
+    num, denom = scale
+    return (height * num + denom - 1) // denom, (width * num + denom - 1) // denom
+
+
+def _resize(data, height, width):
+    """Resize an HWC :class:`~numpy.ndarray` to a given size with an area-averaging interpolation.
+
+    Args:
+        data (:class:`~numpy.ndarray`): The image an HWC array of value.
+        height (int): The requested image height.
+        width (int): The requested image width.
+
+    Returns:
+        :class:`~numpy.ndarray`: The resized image an HWC array of value.
+
+    """
+    if data.shape[:2] == (height, width):
+        return data
+
     # Backend selection (Fastest to slowest).
-    if _HAS_TURBO_JPEG:
-        with open(str(filepath), 'rb') as f:
-            data = turbo_jpeg_handler.decode(f.read(), pixel_format=TJPF.RGB)
+    if _HAS_LYCON:
+        return lycon.resize(data, width=width, height=height, interpolation=lycon.Interpolation.AREA)
+    elif _HAS_CV2:
+        return cv2.resize(data, (width, height), interpolation=cv2.INTER_AREA).reshape((height, width, -1))
+    elif _HAS_PILLOW:
+        return np.asarray(PIL.Image.fromarray(data).resize((width, height), PIL.Image.BOX))
+    else:
+        raise RuntimeError('No backend available to resize image.')
+
+
+def _check_scale(scale):
+    """Validate a scaling factor and return it as a ``(numerator, denominator)`` tuple.
+
+    Args:
+        scale (tuple): A ``(numerator, denominator)`` scaling factor or ``None``.
+
+    Returns:
+        tuple: The validated ``(numerator, denominator)`` scaling factor or ``None`` if no scaling is needed.
+
+    Raises:
+        ValueError: If ``scale`` is not a pair of strictly positive integers.
+
+    """
+    if scale is None:
+        return None
+
+    try:
+        num, denom = (int(value) for value in scale)
+    except (TypeError, ValueError):
+        raise ValueError('Invalid scale: Expected a (numerator, denominator) tuple, got {}.'.format(scale))
+
+    if num <= 0 or denom <= 0:
+        raise ValueError('Invalid scale: Expected strictly positive integers, got {}.'.format(scale))
+
+    if num == denom:
+        return None
+
+    return num, denom
+
+
+def _match_out(data, out):
+    """Return ``out`` if it can directly hold ``data`` (same shape and data-type), ``None`` otherwise.
+
+    Args:
+        data (:class:`~numpy.ndarray`): The image an HWC array of value.
+        out (:class:`~numpy.ndarray`): A preallocated output array or ``None``.
+
+    Returns:
+        :class:`~numpy.ndarray`: ``out`` or ``None``.
+
+    """
+    if out is not None and out.shape == data.shape and out.dtype == data.dtype:
+        return out
+    return None
+
+
+def _to_out(data, out):
+    """Store an image array in a preallocated output array if one is provided.
+
+    Args:
+        data (:class:`~numpy.ndarray`): The image an HWC array of value.
+        out (:class:`~numpy.ndarray`): A preallocated output array or ``None``.
+
+    Returns:
+        :class:`~numpy.ndarray`: ``out`` filled with ``data`` if ``out`` is provided, ``data`` otherwise.
+
+    Raises:
+        ValueError: If ``out`` does not have the same shape and data-type as ``data``.
+
+    """
+    if out is None or data is out:
         return data
-    elif _HAS_LYCON:
-        return lycon.load(str(filepath))
+
+    if out.shape != data.shape or out.dtype != data.dtype:
+        raise ValueError('Invalid output buffer: Expected a {} array of shape {}, '
+                         'got a {} array of shape {}.'.format(data.dtype, data.shape, out.dtype, out.shape))
+
+    np.copyto(out, data)
+    return out
+
+
+# Image format sniffing
+_JPEG_SIGNATURE = b'\xff\xd8\xff'
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def _sniff(header):
+    """Guess an image format from the magic bytes at the beginning of its file.
+
+    Args:
+        header (bytes): The first bytes (at least 8) of an image file, or any object exposing the buffer protocol.
+
+    Returns:
+        str: The image format (``'jpeg'`` or ``'png'``) or ``None`` if it is not supported.
+
+    """
+    header = bytes(memoryview(header)[:8])
+    if header[:3] == _JPEG_SIGNATURE:
+        return 'jpeg'
+    if header[:8] == _PNG_SIGNATURE:
+        return 'png'
+    return None
+
+
+# Image header probing per type
+ImageInfo = namedtuple('ImageInfo', ('format', 'width', 'height', 'channels'))
+ImageInfo.__doc__ = """Image metadata read from an image file header.
+
+Attributes:
+    format (str): The image file format (*e.g.* ``'jpeg'`` or ``'png'``).
+    width (int): The image width in pixels.
+    height (int): The image height in pixels.
+    channels (int): The number of channels stored in the image file.
+
+"""
+
+# JPEG Start-Of-Frame markers (i.e. all 0xC0 to 0xCF markers except DHT, JPG and DAC).
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# JPEG markers which are not followed by a segment length.
+_JPEG_STANDALONE_MARKERS = frozenset(range(0xD0, 0xDA)) | {0x01}
+# PNG colour-type to number of channels.
+_PNG_CHANNELS = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}
+
+
+def _probe_jpg(file):
+    """Read a JPG image size and number of channels by walking its header segments, without decoding pixels.
+
+    Args:
+        file (BinaryIO): A binary file object positioned at the beginning of a JPG file.
+
+    Returns:
+        (int, int, int): The image ``(width, height, channels)``.
+
+    Raises:
+        ValueError: If no valid frame header could be found in the file or if the header is truncated.
+
+    """
+    if file.read(2) != b'\xff\xd8':
+        raise ValueError('Invalid JPG file: Missing start of image marker.')
+
+    while True:
+        byte = file.read(1)
+        # Skip to the next marker, ignoring fill bytes.
+        while byte and byte != b'\xff':
+            byte = file.read(1)
+        while byte == b'\xff':
+            byte = file.read(1)
+        if not byte:
+            raise ValueError('Invalid JPG file: No frame header found.')
+
+        marker = byte[0]
+        if marker in _JPEG_STANDALONE_MARKERS:
+            continue
+
+        segment = file.read(8 if marker in _JPEG_SOF_MARKERS else 2)
+        if len(segment) < (8 if marker in _JPEG_SOF_MARKERS else 2):
+            raise ValueError('Invalid JPG file: Truncated segment header.')
+
+        length, = struct.unpack('>H', segment[:2])
+        if marker in _JPEG_SOF_MARKERS:
+            _, height, width, channels = struct.unpack('>BHHB', segment[2:])
+            return width, height, channels
+
+        file.seek(length - 2, 1)
+
+
+def _probe_png(file):
+    """Read a PNG image size and number of channels from its ``IHDR`` chunk, without decoding pixels.
+
+    Args:
+        file (BinaryIO): A binary file object positioned at the beginning of a PNG file.
+
+    Returns:
+        (int, int, int): The image ``(width, height, channels)``.
+
+    Raises:
+        ValueError: If the file does not start with a valid ``IHDR`` chunk.
+
+    """
+    header = file.read(26)
+    if len(header) != 26 or header[12:16] != b'IHDR':
+        raise ValueError('Invalid PNG file: Missing IHDR chunk.')
+
+    width, height, _, colour_type = struct.unpack('>IIBB', header[16:26])
+    return width, height, _PNG_CHANNELS.get(colour_type, 3)
+
+
+# Image IO operation per type
+def _load_jpg(buffer, scale=None, fast_dct=False, fast_upsample=False, out=None, filepath=None):
+    """Decode a JPG image file content as an RGB :class:`~numpy.ndarray`.
+
+    If a ``scale`` is provided, backends which support it (*TurboJPEG*, *OpenCV* and *Pillow*) downscale the image in
+    the DCT domain while decoding, which is significantly faster than decoding the full image. Other backends resize
+    the image after decoding.
+
+    Args:
+        buffer (bytes): The JPG file content.
+        scale (tuple): Optional. Default to ``None``. A ``(numerator, denominator)`` scaling factor to apply.
+        fast_dct (bool): Optional. Default to ``False``. If ``True`` and *TurboJPEG* is used, a faster but less
+            accurate DCT/IDCT algorithm is used.
+        fast_upsample (bool): Optional. Default to ``False``. If ``True`` and *TurboJPEG* is used, a faster but less
+            accurate chrominance upsampling algorithm is used.
+        out (:class:`~numpy.ndarray`): Optional. Default to ``None``. A preallocated uint8 HWC array into which the
+            image is decoded. *TurboJPEG* and *OpenCV* write directly into it, other backends copy into it.
+        filepath (|Path|): Optional. Default to ``None``. The path to the image file on disk, if the image was read
+            from disk. It is only used by backends which decode from disk (*i.e.* *lycon*), which are skipped otherwise.
+
+    Returns:
+        :class:`~numpy.ndarray`: The image an HWC array of value (``out`` if provided).
+
+    Raises:
+        ValueError: If ``out`` does not match the decoded image shape and data-type.
+
+    """
+    scale = _check_scale(scale)
+
+    # Backend selection (Fastest to slowest, lycon being skipped if the image was not read from disk).
+    if _HAS_TURBO_JPEG:
+        return turbo_jpeg_handler.decode(buffer, pixel_format=TJPF.RGB, scaling_factor=scale,
+                                         fast_dct=fast_dct, fast_upsample=fast_upsample, dst=out)
+    elif _HAS_LYCON and filepath is not None:
+        data = lycon.load(str(filepath))
     elif _HAS_CV2:
-        return cv2.cvtColor(cv2.imread(str(filepath)), cv2.COLOR_BGR2RGB)
+        buffer = np.frombuffer(buffer, dtype=np.uint8)
+        if scale is not None and scale[0] == 1 and scale[1] in _CV2_REDUCED_FLAGS:
+            data = cv2.imdecode(buffer, _CV2_REDUCED_FLAGS[scale[1]])
+            return _to_out(cv2.cvtColor(data, cv2.COLOR_BGR2RGB, dst=_match_out(data, out)), out)
+        data = cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+        data = cv2.cvtColor(data, cv2.COLOR_BGR2RGB, dst=_match_out(data, out) if scale is None else None)
     elif _HAS_PILLOW:
-        with PIL.Image.open(str(filepath)) as image:
-            return np.asarray(image)
+        with PIL.Image.open(BytesIO(buffer)) as image:
+            if scale is not None:
+                height, width = _scaled_size(image.height, image.width, scale)
+                image.draft('RGB', (width, height))
+                return _to_out(_resize(np.asarray(image), height, width), out)
+            return _to_out(np.asarray(image), out)
     else:
         raise RuntimeError('No backend available to open JPG image.')
 
+    if scale is not None:
+        data = _resize(data, *_scaled_size(data.shape[0], data.shape[1], scale))
+
+    return _to_out(data, out)
+
 
 def _dump_jpg(filepath, data):
     """Save a JPG image from an RGB :class:`~numpy.ndarray`.
@@ -86,27 +344,44 @@ def _dump_jpg(filepath, data):
         raise RuntimeError('No backend available to save JPG image.')
 
 
-def _load_png(filepath):
-    """Open a PNG image as an RGB :class:`~numpy.ndarray`.
+def _load_png(buffer, scale=None, out=None, filepath=None):
+    """Decode a PNG image file content as an RGB :class:`~numpy.ndarray`.
 
     Args:
-        filepath (|Path|): The path to the image file on disk.
+        buffer (bytes): The PNG file content.
+        scale (tuple): Optional. Default to ``None``. A ``(numerator, denominator)`` scaling factor to apply after
+            decoding.
+        out (:class:`~numpy.ndarray`): Optional. Default to ``None``. A preallocated uint8 HWC array into which the
+            image is stored.
+        filepath (|Path|): Optional. Default to ``None``. The path to the image file on disk, if the image was read
+            from disk. It is only used by backends which decode from disk (*i.e.* *lycon*), which are skipped otherwise.
 
     Returns:
-        :class:`~numpy.ndarray`: The image an HWC array of value.
+        :class:`~numpy.ndarray`: The image an HWC array of value (``out`` if provided).
+
+    Raises:
+        ValueError: If ``out`` does not match the decoded image shape and data-type.
 
     """
-    # Backend selection (Fastest to slowest).
-    if _HAS_LYCON:
-        return lycon.load(str(filepath))
+    scale = _check_scale(scale)
+
+    # Backend selection (Fastest to slowest, lycon being skipped if the image was not read from disk).
+    if _HAS_LYCON and filepath is not None:
+        data = lycon.load(str(filepath))
     elif _HAS_CV2:
-        return cv2.cvtColor(cv2.imread(str(filepath)), cv2.COLOR_BGR2RGB)
+        data = cv2.imdecode(np.frombuffer(buffer, dtype=np.uint8), cv2.IMREAD_COLOR)
+        data = cv2.cvtColor(data, cv2.COLOR_BGR2RGB, dst=_match_out(data, out) if scale is None else None)
     elif _HAS_PILLOW:
-        with PIL.Image.open(str(filepath)) as image:
-            return np.asarray(image)
+        with PIL.Image.open(BytesIO(buffer)) as image:
+            data = np.asarray(image)
     else:
         raise RuntimeError('No backend available to open PNG image.')
 
+    if scale is not None:
+        data = _resize(data, *_scaled_size(data.shape[0], data.shape[1], scale))
+
+    return _to_out(data, out)
+
 
 def _dump_png(filepath, data):
     """Save a PNG image from an RGB :class:`~numpy.ndarray`.
@@ -127,6 +402,125 @@ def _dump_png(filepath, data):
         raise RuntimeError('No backend available to save PNG image.')
 
 
+def _decode(buffer, scale=None, fast_dct=False, fast_upsample=False, out=None, filepath=None):
+    """Decode an image file content as an RGB :class:`~numpy.ndarray`, dispatching on its sniffed format.
+
+    Args:
+        buffer (bytes): The image file content.
+        scale (tuple): Optional. Default to ``None``. A ``(numerator, denominator)`` scaling factor to apply.
+        fast_dct (bool): Optional. Default to ``False``. See :func:`_load_jpg`.
+        fast_upsample (bool): Optional. Default to ``False``. See :func:`_load_jpg`.
+        out (:class:`~numpy.ndarray`): Optional. Default to ``None``. A preallocated uint8 HWC output array.
+        filepath (|Path|): Optional. Default to ``None``. The path the buffer was read from, if any.
+
+    Returns:
+        :class:`~numpy.ndarray`: The image an HWC array of value (``out`` if provided).
+
+    Raises:
+        TypeError: If the image type is not supported.
+
+    """
+    image_type = _sniff(buffer)
+
+    if image_type == 'jpeg':
+        return _load_jpg(buffer, scale=scale, fast_dct=fast_dct, fast_upsample=fast_upsample, out=out,
+                         filepath=filepath)
+    elif image_type == 'png':
+        return _load_png(buffer, scale=scale, out=out, filepath=filepath)
+    else:
+        raise TypeError('Unsupported image type: {}.'.format(image_type))
+
+
+class BufferPool(object):
+    """A thread-safe pool of reusable :class:`~numpy.ndarray` buffers keyed by shape and data-type.
+
+    Decoding large tiles in a training loop allocates (and frees) the same buffers over and over again. A |BufferPool|
+    hands out previously released buffers instead so that images can be decoded straight into recycled memory through
+    the ``out`` argument of the loading functions.
+
+    Examples:
+        >>> pool = BufferPool()
+        >>> with pool.buffer((8, 512, 512, 3)) as batch:
+        ...     images = Image.load_many(paths, out=batch)
+
+    Args:
+        max_buffers (int): Optional. Default to ``None``. If provided, the maximum number of idle buffers kept for a
+            given shape and data-type, additional released buffers are left to the garbage collector.
+
+    """
+
+    def __init__(self, max_buffers=None):
+        self._max_buffers = max_buffers
+        self._buffers = defaultdict(list)
+        self._lock = Lock()
+
+    def __len__(self):
+        """Return the number of idle buffers stored in the pool."""
+        with self._lock:
+            return sum(len(buffers) for buffers in self._buffers.values())
+
+    def acquire(self, shape, dtype=np.dtype('u1')):
+        """Get a buffer from the pool, or allocate a new one if no idle buffer matches.
+
+        Args:
+            shape (tuple): The requested buffer shape, *e.g.* ``(H, W, C)`` or ``(N, H, W, C)``.
+            dtype (:class:`~numpy.dtype`): Optional. Default to :class:`~numpy.uint8`. The requested buffer data-type.
+
+        Returns:
+            :class:`~numpy.ndarray`: An uninitialized buffer of the requested shape and data-type.
+
+        """
+        key = (tuple(shape), np.dtype(dtype))
+        with self._lock:
+            buffers = self._buffers.get(key)
+            if buffers:
+                return buffers.pop()
+
+        return np.empty(key[0], dtype=key[1])
+
+    def release(self, buffer):
+        """Give a buffer back to the pool for later reuse.
+
+        Args:
+            buffer (:class:`~numpy.ndarray`): A buffer previously obtained with :meth:`acquire`.
+
+        Raises:
+            ValueError: If ``buffer`` is a view on another array and therefore can not be safely reused.
+
+        """
+        if buffer.base is not None:
+            raise ValueError('Invalid buffer: Only arrays owning their memory can be released in the pool.')
+
+        key = (buffer.shape, buffer.dtype)
+        with self._lock:
+            buffers = self._buffers[key]
+            if self._max_buffers is None or len(buffers) < self._max_buffers:
+                buffers.append(buffer)
+
+    @contextmanager
+    def buffer(self, shape, dtype=np.dtype('u1')):
+        """Acquire a buffer for the duration of a ``with`` block and release it afterward.
+
+        Args:
+            shape (tuple): The requested buffer shape.
+            dtype (:class:`~numpy.dtype`): Optional. Default to :class:`~numpy.uint8`. The requested buffer data-type.
+
+        Yields:
+            :class:`~numpy.ndarray`: An uninitialized buffer of the requested shape and data-type.
+
+        """
+        buffer = self.acquire(shape, dtype=dtype)
+        try:
+            yield buffer
+        finally:
+            self.release(buffer)
+
+    def clear(self):
+        """Drop all idle buffers stored in the pool."""
+        with self._lock:
+            self._buffers.clear()
+
+
 class Image(object):
     """A wrapper class around a loaded image data stored as an interfaced exposed RGB HWC :class:`~numpy.ndarray`.
 
@@ -146,25 +540,140 @@ class Image(object):
         return self._array_data.__array_interface__
 
     @classmethod
-    def load(cls, filepath):
+    def load(cls, filepath, scale=None, fast_dct=False, fast_upsample=False, out=None):
         """Load an image as an RGB :class:`~numpy.ndarray`.
 
         Args:
             filepath (PathLike): The path to the image file on disk.
+            scale (tuple): Optional. Default to ``None``. A ``(numerator, denominator)`` scaling factor to apply to the
+                image. *JPEG* images are downscaled while decoding whenever the backend supports it.
+            fast_dct (bool): Optional. Default to ``False``. If ``True``, use a faster but less accurate *JPEG* DCT
+                algorithm (*TurboJPEG* only).
+            fast_upsample (bool): Optional. Default to ``False``. If ``True``, use a faster but less accurate *JPEG*
+                chrominance upsampling algorithm (*TurboJPEG* only).
+            out (:class:`~numpy.ndarray`): Optional. Default to ``None``. A preallocated uint8 HWC array (*e.g.* from a
+                |BufferPool| or a slice of a batch array) into which the image is decoded.
 
         Returns:
             (|Image|): An |Image| instance wrapping an HWC :class:`~numpy.ndarray`.
 
+        Raises:
+            TypeError: If the image type is not supported.
+            ValueError: If ``scale`` is not a valid scaling factor.
+            ValueError: If ``out`` does not match the decoded image shape and data-type.
+
         """
         filepath = Path(filepath)
-        image_type = imghdr.what(str(filepath))
 
-        if image_type == 'jpeg':
-            return cls(_load_jpg(filepath))
-        elif image_type == 'png':
-            return cls(_load_png(filepath))
+        # The file is read once, sniffed from its magic bytes and decoded from memory.
+        with open(str(filepath), 'rb') as f:
+            buffer = f.read()
+
+        return cls(_decode(buffer, scale=scale, fast_dct=fast_dct, fast_upsample=fast_upsample, out=out,
+                           filepath=filepath))
+
+    @classmethod
+    def decode(cls, buffer, scale=None, fast_dct=False, fast_upsample=False, out=None):
+        """Decode an in-memory image file content as an RGB :class:`~numpy.ndarray`.
+
+        This allows images to be loaded from archives, shards, network responses or caches without touching the disk.
+
+        Args:
+            buffer (bytes): The image file content, or any object exposing the buffer protocol (*e.g.* a
+                :class:`memoryview` or an :class:`~mmap.mmap`).
+            scale (tuple): Optional. Default to ``None``. A ``(numerator, denominator)`` scaling factor to apply to the
+                image. *JPEG* images are downscaled while decoding whenever the backend supports it.
+            fast_dct (bool): Optional. Default to ``False``. If ``True``, use a faster but less accurate *JPEG* DCT
+                algorithm (*TurboJPEG* only).
+            fast_upsample (bool): Optional. Default to ``False``. If ``True``, use a faster but less accurate *JPEG*
+                chrominance upsampling algorithm (*TurboJPEG* only).
+            out (:class:`~numpy.ndarray`): Optional. Default to ``None``. A preallocated uint8 HWC array into which
+                the image is decoded.
+
+        Returns:
+            (|Image|): An |Image| instance wrapping an HWC :class:`~numpy.ndarray`.
+
+        Raises:
+            TypeError: If the image type is not supported.
+            ValueError: If ``scale`` is not a valid scaling factor.
+            ValueError: If ``out`` does not match the decoded image shape and data-type.
+            RuntimeError: If no available backend can decode images from memory.
+
+        """
+        return cls(_decode(buffer, scale=scale, fast_dct=fast_dct, fast_upsample=fast_upsample, out=out))
+
+    @classmethod
+    def load_many(cls, filepaths, workers=None, out=None, **kwargs):
+        """Load multiple images as RGB :class:`~numpy.ndarray` concurrently.
+
+        Images are decoded on a pool of threads as all supported backends release the GIL while decoding.
+
+        Args:
+            filepaths (Iterable[PathLike]): The paths to the image files on disk.
+            workers (int): Optional. Default to ``None``. The maximum number of threads used to decode images. If
+                ``None``, the :class:`~concurrent.futures.ThreadPoolExecutor` default is used. If ``1``, images are
+                decoded sequentially on the calling thread.
+            out (:class:`~numpy.ndarray`): Optional. Default to ``None``. A preallocated uint8 NHWC array (or a
+                sequence of HWC arrays) into which the images are decoded, the i-th image being decoded in ``out[i]``.
+            **kwargs (Any): Additional decoding options passed to :meth:`load`.
+
+        Returns:
+            (|Image|, ): A tuple of |Image| instances, in the same order as ``filepaths``.
+
+        Raises:
+            ValueError: If ``workers`` is not a strictly positive integer.
+            ValueError: If ``out`` length does not match the number of images.
+
+        """
+        filepaths = tuple(filepaths)
+        load = partial(cls.load, **kwargs)
+
+        if workers is not None and workers <= 0:
+            raise ValueError('Invalid number of workers: Expected a strictly positive integer, got {}.'.format(workers))
+
+        if out is None:
+            outs = (None, ) * len(filepaths)
         else:
-            raise TypeError('Unsupported image type: {}.'.format(image_type))
+            if len(out) != len(filepaths):
+                raise ValueError('Invalid output buffer: Expected {} images, got {}.'.format(len(filepaths), len(out)))
+            outs = tuple(out[i] for i in range(len(filepaths)))
+
+        if len(filepaths) <= 1 or workers == 1:
+            return tuple(load(filepath, out=buffer) for filepath, buffer in zip(filepaths, outs))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return tuple(executor.map(lambda args: load(args[0], out=args[1]), zip(filepaths, outs)))
+
+    @staticmethod
+    def probe(filepath):
+        """Read an image format, size and number of channels from its file header without decoding it.
+
+        Only the few header bytes needed are read from disk, which makes probing orders of magnitude cheaper than
+        loading the image.
+
+        Args:
+            filepath (PathLike): The path to the image file on disk.
+
+        Returns:
+            (|ImageInfo|): The image format, width, height and number of channels.
+
+        Raises:
+            TypeError: If the image type is not supported.
+            ValueError: If the image header is invalid.
+
+        """
+        filepath = Path(filepath)
+
+        with open(str(filepath), 'rb') as f:
+            image_type = _sniff(f.read(8))
+            f.seek(0)
+
+            if image_type == 'jpeg':
+                return ImageInfo(image_type, *_probe_jpg(f))
+            elif image_type == 'png':
+                return ImageInfo(image_type, *_probe_png(f))
+            else:
+                raise TypeError('Unsupported image type: {}.'.format(image_type))
 
     def save(self, filepath):
         """Save an |Image| instance wrapping an HWC :class:`~numpy.ndarray`.
@@ -181,3 +690,61 @@ class Image(object):
             _dump_png(filepath, self._array_data)
         else:
             raise ValueError('Unsupported image type: {}.'.format(filepath.ext))
+
+
+class LazyImage(object):
+    """A placeholder for an |Image| which is only decoded when its data is first needed.
+
+    The image header is probed on construction so that its size is known without decoding any pixel.
+
+    Args:
+        filepath (PathLike): The path to the image file on disk.
+        **options (Any): Decoding options passed to :meth:`Image.load` (*e.g.* ``scale``).
+
+    Attributes:
+        info (|ImageInfo|): The image format, size and number of channels as read from the file header.
+        shape (tuple): The ``(height, width)`` of the image once decoded (*i.e.* after scaling).
+
+    """
+
+    __slots__ = 'filepath', 'info', 'shape', 'options'
+
+    def __init__(self, filepath, **options):
+        self.filepath = filepath
+        self.options = options
+        self.info = Image.probe(filepath)
+
+        scale = _check_scale(options.get('scale'))
+        if scale is None:
+            self.shape = (self.info.height, self.info.width)
+        else:
+            self.shape = _scaled_size(self.info.height, self.info.width, scale)
+
+    @property
+    def __array_interface__(self):  # noqa: D401
+        """dict: The decoded image :data:`__array_interface__` property."""
+        return self.load().__array_interface__
+
+    def load(self):
+        """Decode the image.
+
+        Returns:
+            :class:`~numpy.ndarray`: The decoded image as an RGB HWC array.
+
+        """
+        return np.asarray(Image.load(self.filepath, **self.options))
+
+    def copy(self):
+        """Copy the placeholder without probing the file header again.
+
+        The copy does not share the ``out`` preallocated decoding array, if any, so that both placeholders are decoded
+        in distinct arrays.
+
+        Returns:
+            |LazyImage|: A new placeholder for the same image file.
+
+        """
+        lazy_image = LazyImage.__new__(LazyImage)
+        lazy_image.filepath, lazy_image.info, lazy_image.shape = self.filepath, self.info, self.shape
+        lazy_image.options = {key: value for key, value in self.options.items() if key != 'out'}
+        return lazy_image
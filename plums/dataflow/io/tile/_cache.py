@@ -0,0 +1,107 @@
+import os
+from hashlib import sha256
+from tempfile import NamedTemporaryFile
+
+import numpy as np
+from appdirs import user_cache_dir
+
+from plums.commons.path import Path
+from ._format import RGB
+from ._backend import Image
+
+
+class TileCache(object):
+    """An on-disk cache of decoded tiles stored as memory-mapped :class:`~numpy.ndarray`.
+
+    The first time a tile is loaded through the cache, it is decoded, converted to the requested *pixel-type* and
+    *data-type* and stored as a ``.npy`` file. Later loads skip decoding altogether and return a copy-on-write
+    :class:`~numpy.memmap` on the stored file, whose pages are shared by all processes (*e.g.* data loading workers)
+    reading the same tile.
+
+    Entries are keyed by the tile absolute path, modification time and size, as well as by the requested
+    *pixel-type*, *data-type* and decoding options, so that a modified image file is transparently decoded again.
+
+    Warnings:
+        Stale entries are never evicted, one must call :meth:`clear` to reclaim disk space.
+
+    Args:
+        path (PathLike): Optional. Default to the ``tiles`` folder in the user's *Plums* cache directory. The
+            directory where decoded tiles are stored. A fast local disk should be preferred.
+
+    """
+
+    def __init__(self, path=None):
+        self._path = Path(user_cache_dir(appname='plums')) / 'tiles' if path is None else Path(path)
+
+        # Create cache directory if it does not exist
+        self._path.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def path(self):
+        """|Path|: The directory where decoded tiles are stored."""
+        return self._path
+
+    @staticmethod
+    def hash(filepath, ptype=RGB, dtype=np.dtype('u1'), **options):
+        """Compute the cache key of a tile.
+
+        Args:
+            filepath (PathLike): The path to the image file on disk.
+            ptype (|ptype|): Optional. Default to ``RGB``. The tile pixel-type.
+            dtype (:class:`~numpy.dtype`): Optional. Default to :class:`~numpy.uint8`. The tile data type.
+            **options (Any): Decoding options passed to :meth:`Image.load`.
+
+        Returns:
+            str: A SHA256 digest identifying the decoded tile.
+
+        Raises:
+            FileNotFoundError: If ``filepath`` does not exist.
+
+        """
+        filepath = os.path.abspath(str(filepath))
+        stat = os.stat(filepath)
+        keys = (filepath, stat.st_mtime_ns, stat.st_size, repr(ptype), np.dtype(dtype).str,
+                sorted(options.items()))
+        return sha256(repr(keys).encode('utf8')).hexdigest()
+
+    def load(self, filepath, ptype=RGB, dtype=np.dtype('u1'), **options):
+        """Load a decoded tile from the cache, decoding and storing it first if need be.
+
+        Args:
+            filepath (PathLike): The path to the image file on disk.
+            ptype (|ptype|): Optional. Default to ``RGB``. The tile pixel-type.
+            dtype (:class:`~numpy.dtype`): Optional. Default to :class:`~numpy.uint8`. The tile data type.
+            **options (Any): Decoding options passed to :meth:`Image.load` (*e.g.* ``scale``).
+
+        Returns:
+            :class:`~numpy.memmap`: A copy-on-write memory-mapped HWC array of the decoded tile.
+
+        """
+        entry = self._path / '{}.npy'.format(self.hash(filepath, ptype=ptype, dtype=dtype, **options))
+
+        try:
+            return np.load(str(entry), mmap_mode='c')
+        except (FileNotFoundError, ValueError):
+            pass
+
+        # Cache miss: Decode, convert and store
+        array = np.asarray(Image.load(filepath, **options))
+        if ptype != RGB:
+            array = RGB.get_conversion_fn_to(ptype)(array, dtype=dtype)
+        array = array.astype(dtype, copy=False)
+
+        # Write in a temporary file first so that concurrent readers never see a partial entry.
+        with NamedTemporaryFile(dir=str(self._path), suffix='.tmp', delete=False) as f:
+            try:
+                np.save(f, array)
+            except BaseException:
+                os.unlink(f.name)
+                raise
+        os.replace(f.name, str(entry))
+
+        return np.load(str(entry), mmap_mode='c')
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        for entry in self._path.glob('*.npy'):
+            os.unlink(str(entry))
@@ -56,6 +56,10 @@ def linear_combination_factory(*factors):
         """
         return array.dot(vector).squeeze(axis=-1)
 
+    # Expose factors so that conversion plans may accumulate linear combinations per channel, in cache-sized blocks of
+    # rows, instead of calling each combination on the whole image (see ConversionFunction._combine).
+    linear_combination.factors = vector[:, 0]
+
     return linear_combination
 
 
@@ -104,28 +108,49 @@ class Channel(Registered):
     def __init__(self, conversions=None):
         self.__conversion__ = conversions if conversions is not None else {}
 
-    def get_conversion_fn_from(self, pixel_type):
-        """Return a conversion function on a slice in the channel dimension to make self from a given |ptype|.
+    def get_conversion_source(self, pixel_type):
+        """Return the channel indices and the conversion function used to make self from a given |ptype|.
 
         Args:
             pixel_type (|ptype|): A |ptype| from which to construct self.
 
         Returns:
-            callable: A conversion function which acts on a channel slice.
+            (tuple, callable): The indices in the |ptype| |Channel| vector of the channels used to make self (or
+            ``None`` if self can not be made from the |ptype| channels) and the conversion function to apply on them.
 
         """
         if self in pixel_type:
-            return on_slice(pixel_type.slice(self), identity)
+            return tuple(range(*pixel_type.slice(self))), identity
 
         for channels, conversion_fn in self.__conversion__.items():
             if channels in pixel_type:
                 # If sub-vector, use conversion function
-                return on_slice(pixel_type.slice(channels), conversion_fn)
+                return tuple(range(*pixel_type.slice(channels))), conversion_fn
             if pixel_type.contains(channels):
-                # If sub-set, define a new function which reorders then uses the real conversion function
-                return on_index(pixel_type.index(channels), conversion_fn)
+                # If sub-set, the conversion function is applied on reordered channels
+                return pixel_type.index(channels), conversion_fn
+
+        return None, new_channel
+
+    def get_conversion_fn_from(self, pixel_type):
+        """Return a conversion function on a slice in the channel dimension to make self from a given |ptype|.
+
+        Args:
+            pixel_type (|ptype|): A |ptype| from which to construct self.
+
+        Returns:
+            callable: A conversion function which acts on a channel slice.
+
+        """
+        indices, conversion_fn = self.get_conversion_source(pixel_type)
+
+        if indices is None:
+            return new_channel
+
+        if indices == tuple(range(indices[0], indices[-1] + 1)):
+            return on_slice((indices[0], indices[-1] + 1), conversion_fn)
 
-        return new_channel
+        return on_index(indices, conversion_fn)
 
     def __str__(self):
         """Return a human readable representation of a |Channel|."""
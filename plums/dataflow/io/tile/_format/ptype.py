@@ -111,10 +111,12 @@ class ptype(object):  # noqa: N801
         except ValueError:
             return None
 
-    @lru_cache(maxsize=10)
+    @lru_cache(maxsize=128)
     def get_conversion_fn_to(self, destination_ptype):
         """Compute the conversion function from self to another ptype.
 
+        Conversion functions are compiled once into a conversion plan and cached for each pair of *pixel-type*.
+
         Args:
             destination_ptype (|ptype|): The destination ptype object.
 
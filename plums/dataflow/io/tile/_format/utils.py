@@ -67,15 +67,54 @@ def on_index(channel_index, function):
 class ConversionFunction(object):
     """Make a *pixel-type* conversion function.
 
+    On construction, the conversion is compiled once into a plan which is then applied on whole channel frames,
+    written directly into a single output array, without any per-call channel resolution or intermediate stacking:
+
+    * Destination channels which are origin channels (*e.g.* ``RGB`` to ``BGR``) are copied.
+    * Destination channels which are linear combinations of origin channels (*e.g.* ``RGB`` to ``GREY``) are
+      accumulated in place.
+    * Destination channels which can not be made from origin channels (*e.g.* the alpha channel in ``RGB`` to
+      ``RGBA``) are filled with the maximum value allowed by the input data-type.
+
+    Channels relying on any other conversion function fall back to a channel-by-channel conversion.
+
     Args:
         origin_ptype (|ptype|): The *pixel-type* from which to convert the |TileIO|.
         destination_ptype (|ptype|): The *pixel-type* into which to convert the |TileIO|.
 
     """
 
+    # Number of pixels in a block of rows on which linear combinations are accumulated
+    _block_size = 1 << 14
+
     def __init__(self, origin_ptype, destination_ptype):
         self._origin = origin_ptype
         self._destination = destination_ptype
+        self._compile()
+
+    def _compile(self):
+        """Compile the conversion plan from the destination channels conversion sources."""
+        from .channels import identity, new_channel
+
+        self._copies = []
+        self._linears = []
+        self._constants = []
+        self._generic = False
+
+        for i, channel in enumerate(self._destination):
+            indices, conversion_fn = channel.get_conversion_source(self._origin)
+            if conversion_fn is new_channel:
+                self._constants.append(i)
+            elif conversion_fn is identity and len(indices) == 1:
+                self._copies.append((i, indices[0]))
+            elif hasattr(conversion_fn, 'factors') and len(indices) == len(conversion_fn.factors):
+                self._linears.append((i, tuple(zip(indices, conversion_fn.factors))))
+            else:
+                self._generic = True
+
+        self._factors_dtype = None
+        if self._linears:
+            self._factors_dtype = np.result_type(*(factor for _, terms in self._linears for _, factor in terms))
 
     def __repr__(self):
         """Return a human readable name from the conversion function."""
@@ -83,24 +122,78 @@ class ConversionFunction(object):
 
     __str__ = __repr__
 
-    def __call__(self, image_array):
+    def __call__(self, image_array, out=None, dtype=None):
         """Convert a given HWC :class:`~numpy.ndarray` from one *pixel-type* to another.
 
         Args:
             image_array (:class:`~numpy.ndarray`): A HWC image array in the original |ptype|.
+            out (:class:`~numpy.ndarray`): Optional. Default to ``None``. If provided, a preallocated HWC array, with
+                the destination |ptype| number of channels, to write the converted image array in.
+            dtype (:class:`~numpy.dtype`): Optional. Default to ``None``. If provided and no output array is given, the
+                data-type of the converted image array, which is then written in a single pass without any full-size
+                intermediate array.
 
         Returns:
             image_array (:class:`~numpy.ndarray`): A converted HWC image array in the destination |ptype|.
 
         Raises:
             ValueError: If the input image array channel dimension shape is inconsistent with the assumed original
-                |ptype|.
+                |ptype|, or if the provided output array shape is inconsistent with the converted image array.
 
         """
         if image_array.shape[2] != len(self._origin):
             raise ValueError('Inconsistent shape: '
                              'Expected {} channels but got {}.'.format(len(self._origin), image_array.shape[2]))
 
+        shape = image_array.shape[:2] + (len(self._destination), )
+        if out is not None and out.shape != shape:
+            raise ValueError('Invalid output array: Expected shape {} but got {}.'.format(shape, out.shape))
+
+        if self._generic:
+            result = self._convert_by_channel(image_array)
+            if out is None:
+                return result if dtype is None else result.astype(dtype, copy=False)
+            out[...] = result
+            return out
+
+        if out is None:
+            if dtype is None:
+                dtype = image_array.dtype
+                if self._factors_dtype is not None:
+                    dtype = np.result_type(dtype, self._factors_dtype)
+            out = np.empty(shape, dtype=dtype)
+
+        for i, index in self._copies:
+            out[..., i] = image_array[..., index]
+
+        if self._linears:
+            self._combine(image_array, out)
+
+        if self._constants:
+            out[..., self._constants] = max_value(image_array.dtype)
+
+        return out
+
+    def _combine(self, image_array, out):
+        """Accumulate linear combination channels in blocks of rows small enough to stay in cache."""
+        dtype = np.result_type(image_array.dtype, self._factors_dtype)
+        rows = max(1, self._block_size // max(1, image_array.shape[1]))
+        buffer = np.empty((rows, image_array.shape[1]), dtype=dtype)
+        scratch = np.empty_like(buffer)
+
+        for start in range(0, image_array.shape[0], rows):
+            block = image_array[start:start + rows]
+            accumulator, product = buffer[:len(block)], scratch[:len(block)]
+            for i, terms in self._linears:
+                (index, factor), terms = terms[0], terms[1:]
+                np.multiply(block[..., index], factor, out=accumulator)
+                for index, factor in terms:
+                    np.multiply(block[..., index], factor, out=product)
+                    accumulator += product
+                out[start:start + rows, :, i] = accumulator
+
+    def _convert_by_channel(self, image_array):
+        """Convert a given HWC :class:`~numpy.ndarray` channel by channel."""
         out_array = [None] * len(self._destination)
         for i, channel in enumerate(self._destination):
             out_array[i] = channel.get_conversion_fn_from(self._origin)(image_array)
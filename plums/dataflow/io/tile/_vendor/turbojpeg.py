@@ -186,8 +186,9 @@ class TurboJPEG(object):
                fast_upsample=False,
                fast_dct=False,
                accurate_dct=False,
-               bottomup=False):
-        """Decode JPEG buffer to numpy array."""
+               bottomup=False,
+               dst=None):
+        """Decode JPEG buffer to numpy array, optionally into a preallocated C-contiguous uint8 dst array."""
         with self._decode_handle() as handle:
             if scaling_factor is not None and scaling_factor not in self.__scaling_factors:
                 raise ValueError('supported scaling factors are ' + str(self.__scaling_factors))
@@ -195,7 +196,7 @@ class TurboJPEG(object):
             # Decompress header
             width, height, jpeg_subsample, jpeg_colorspace, jpeg_array, src_addr = self._info(jpeg_buf)
 
-            # Allocate destination memory (we should allow to customize this)
+            # Allocate destination memory (unless provided by the caller)
             scaled_width = width.value
             scaled_height = height.value
             if scaling_factor is not None:
@@ -205,9 +206,13 @@ class TurboJPEG(object):
                     scaled_width, scaling_factor[0], scaling_factor[1])
                 scaled_height = get_scaled_value(
                     scaled_height, scaling_factor[0], scaling_factor[1])
-            img_array = np.empty(
-                [scaled_height, scaled_width, pixel_format.pixel_size],
-                dtype=np.uint8)
+            shape = (scaled_height, scaled_width, pixel_format.pixel_size)
+            if dst is None:
+                img_array = np.empty(shape, dtype=np.uint8)
+            else:
+                if dst.shape != shape or dst.dtype != np.uint8 or not dst.flags.c_contiguous:
+                    raise ValueError('dst must be a C-contiguous uint8 array of shape {}'.format(shape))
+                img_array = dst
             dest_addr = img_array.ctypes.data_as(POINTER(c_ubyte))
 
             # Apply flags
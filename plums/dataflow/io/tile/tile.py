@@ -3,7 +3,8 @@ import numpy as np
 from plums.commons.data import Tile as CommonsTile
 from plums.commons.data import PropertyContainer
 from ._format import rgb, RGB, rgba, RGBA, bgr, BGR, bgra, BGRA, grey, GREY, y, Y, ptype
-from ._backend import Image
+from ._backend import Image, BufferPool, LazyImage
+from ._cache import TileCache
 
 
 class Tile(PropertyContainer, CommonsTile):
@@ -24,6 +25,22 @@ class Tile(PropertyContainer, CommonsTile):
         ptype (|ptype|): Optional. Default to ``RGB``. The image pixel-type (e.g. RGB, BGR or Grey).
         dtype (:class:`~numpy.dtype`): Optional. Default to :class:`~numpy.uint8`.
             The internal :class:`~numpy.ndarray` storage data type.
+        scale (tuple): Optional. Default to ``None``. A ``(numerator, denominator)`` scaling factor applied to the
+            image when read, *e.g.* ``(1, 4)`` reads a quarter-resolution image. *JPEG* images are downscaled while
+            decoding whenever the backend supports it, which is much faster than a full decode.
+        fast_dct (bool): Optional. Default to ``False``. If ``True``, use a faster but less accurate *JPEG* DCT
+            algorithm when decoding (*TurboJPEG* only).
+        fast_upsample (bool): Optional. Default to ``False``. If ``True``, use a faster but less accurate *JPEG*
+            chrominance upsampling algorithm when decoding (*TurboJPEG* only).
+        out (:class:`~numpy.ndarray`): Optional. Default to ``None``. A preallocated uint8 HWC array (*e.g.* from a
+            |BufferPool| or a slice of a batch array) into which the image is decoded. If no *pixel-type* or
+            *data-type* conversion is needed, the |TileIO| data is a view on ``out``.
+        lazy (bool): Optional. Default to ``False``. If ``True``, only the image header is read on construction and
+            pixels are decoded the first time the |TileIO| data is accessed. Its :attr:`shape`, :attr:`size`,
+            :attr:`dtype` and :attr:`ptype` are nonetheless available right away.
+        cache (|TileCache|): Optional. Default to ``None``. If provided, the decoded and converted tile is read from
+            (or stored in) the cache, in which case the |TileIO| data is a copy-on-write :class:`~numpy.memmap` and
+            ``out`` and ``lazy`` are ignored.
         **properties (Any): Additional properties to store alongside the image.
 
     Attributes:
@@ -31,11 +48,21 @@ class Tile(PropertyContainer, CommonsTile):
 
     """
 
-    def __init__(self, filename, ptype=RGB, dtype=np.dtype('u1'), **properties):
+    def __init__(self, filename, ptype=RGB, dtype=np.dtype('u1'), scale=None, fast_dct=False, fast_upsample=False,
+                 out=None, lazy=False, cache=None, **properties):
+        # Decoded tile cache
+        if cache is not None and properties.get('__array__', None) is None:
+            properties['__array__'] = cache.load(filename, ptype=ptype, dtype=dtype, scale=scale, fast_dct=fast_dct,
+                                                 fast_upsample=fast_upsample)
+            properties['__ptype__'] = ptype
+
         # Developer pass-through to allow seamless tile copy without reading from disk every time.
         # +-> For array data (and dtype)
-        if properties.get('__array__', None) is None:
-            array = np.asarray(Image.load(filename))
+        if properties.get('__array__', None) is None and lazy:
+            array = LazyImage(filename, scale=scale, fast_dct=fast_dct, fast_upsample=fast_upsample, out=out)
+        elif properties.get('__array__', None) is None:
+            array = np.asarray(Image.load(filename, scale=scale, fast_dct=fast_dct, fast_upsample=fast_upsample,
+                                          out=out))
         else:
             array = properties.pop('__array__')
 
@@ -48,9 +75,111 @@ class Tile(PropertyContainer, CommonsTile):
         # Actual __init__ is beginning here.
         super(Tile, self).__init__(array, **properties)
         self._ptype = RGB if initial_ptype is None else initial_ptype
+        self._pending_dtype = np.dtype('u1')
         self.filename = filename
         self.totype(ptype=ptype, dtype=dtype)
 
+    @classmethod
+    def load_many(cls, filenames, ptype=RGB, dtype=np.dtype('u1'), scale=None, fast_dct=False, fast_upsample=False,
+                  workers=None, out=None, **properties):
+        """Load multiple |TileIO| at once, decoding images concurrently on a pool of threads.
+
+        Args:
+            filenames (Iterable[PathLike]): The filenames from where the images will be read.
+            ptype (|ptype|): Optional. Default to ``RGB``. The images pixel-type (e.g. RGB, BGR or Grey).
+            dtype (:class:`~numpy.dtype`): Optional. Default to :class:`~numpy.uint8`.
+                The internal :class:`~numpy.ndarray` storage data type.
+            scale (tuple): Optional. Default to ``None``. A ``(numerator, denominator)`` scaling factor applied to the
+                images when read.
+            fast_dct (bool): Optional. Default to ``False``. If ``True``, use a faster but less accurate *JPEG* DCT
+                algorithm when decoding (*TurboJPEG* only).
+            fast_upsample (bool): Optional. Default to ``False``. If ``True``, use a faster but less accurate *JPEG*
+                chrominance upsampling algorithm when decoding (*TurboJPEG* only).
+            workers (int): Optional. Default to ``None``. The maximum number of threads used to decode images (see
+                :meth:`Image.load_many <plums.dataflow.io.tile._backend.Image.load_many>`).
+            out (:class:`~numpy.ndarray`): Optional. Default to ``None``. A preallocated uint8 NHWC array into which
+                the images are decoded, the i-th image being decoded in ``out[i]``.
+            **properties (Any): Additional properties to store alongside each image.
+
+        Returns:
+            (|TileIO|, ): A tuple of |TileIO|, in the same order as ``filenames``.
+
+        """
+        filenames = tuple(filenames)
+        images = Image.load_many(filenames, workers=workers, out=out, scale=scale, fast_dct=fast_dct,
+                                 fast_upsample=fast_upsample)
+        return tuple(cls(filename, ptype=ptype, dtype=dtype, __array__=np.asarray(image), **properties)
+                     for filename, image in zip(filenames, images))
+
+    @classmethod
+    def from_bytes(cls, buffer, ptype=RGB, dtype=np.dtype('u1'), filename=None, scale=None, fast_dct=False,
+                   fast_upsample=False, out=None, **properties):
+        """Construct a |TileIO| from an in-memory image file content (*e.g.* read from an archive or a shard).
+
+        Args:
+            buffer (bytes): The image file content, or any object exposing the buffer protocol.
+            ptype (|ptype|): Optional. Default to ``RGB``. The image pixel-type (e.g. RGB, BGR or Grey).
+            dtype (:class:`~numpy.dtype`): Optional. Default to :class:`~numpy.uint8`.
+                The internal :class:`~numpy.ndarray` storage data type.
+            filename (PathLike): Optional. Default to ``None``. A filename to store alongside the image, *e.g.* the
+                name of the image in the archive it was read from.
+            scale (tuple): Optional. Default to ``None``. A ``(numerator, denominator)`` scaling factor applied to the
+                image when decoded.
+            fast_dct (bool): Optional. Default to ``False``. If ``True``, use a faster but less accurate *JPEG* DCT
+                algorithm when decoding (*TurboJPEG* only).
+            fast_upsample (bool): Optional. Default to ``False``. If ``True``, use a faster but less accurate *JPEG*
+                chrominance upsampling algorithm when decoding (*TurboJPEG* only).
+            out (:class:`~numpy.ndarray`): Optional. Default to ``None``. A preallocated uint8 HWC array into which the
+                image is decoded.
+            **properties (Any): Additional properties to store alongside the image.
+
+        Returns:
+            |TileIO|: The decoded |TileIO|.
+
+        """
+        array = np.asarray(Image.decode(buffer, scale=scale, fast_dct=fast_dct, fast_upsample=fast_upsample, out=out))
+        return cls(filename, ptype=ptype, dtype=dtype, __array__=array, **properties)
+
+    @classmethod
+    def probe(cls, filename, ptype=RGB, dtype=np.dtype('u1'), **kwargs):
+        """Construct a lazy |TileIO| by only reading the image file header.
+
+        This is a shorthand for ``Tile(filename, ptype=ptype, dtype=dtype, lazy=True, **kwargs)``: The image size is
+        known right away, *e.g.* to plan a layout or allocate buffers, but pixels are decoded only when needed.
+
+        Args:
+            filename (PathLike): The filename from where the image will be read.
+            ptype (|ptype|): Optional. Default to ``RGB``. The image pixel-type (e.g. RGB, BGR or Grey).
+            dtype (:class:`~numpy.dtype`): Optional. Default to :class:`~numpy.uint8`.
+                The internal :class:`~numpy.ndarray` storage data type.
+            **kwargs (Any): Additional decoding options and properties passed to the |TileIO| constructor.
+
+        Returns:
+            |TileIO|: A lazy |TileIO|.
+
+        """
+        return cls(filename, ptype=ptype, dtype=dtype, lazy=True, **kwargs)
+
+    @property
+    def _array_data(self):
+        array = self._array
+        if isinstance(array, LazyImage):
+            # Decode and apply the pending conversions to the RGB uint8 decoded array.
+            ptype, dtype = self._ptype, self._pending_dtype
+            self._array, self._ptype = array.load(), RGB
+            self.totype(ptype=ptype, dtype=dtype)
+            array = self._array
+        return array
+
+    @_array_data.setter
+    def _array_data(self, array):
+        self._array = array
+
+    @property
+    def loaded(self):
+        """bool: Whether the image pixels were decoded, which is always the case unless the |TileIO| is lazy."""
+        return not isinstance(self._array, LazyImage)
+
     @property
     def ptype(self):  # noqa: F811
         """|ptype|: The image pixel-type.
@@ -76,6 +205,8 @@ class Tile(PropertyContainer, CommonsTile):
             between 0 and 255.
 
         """
+        if not self.loaded:
+            return self._pending_dtype
         return self._array_data.dtype
 
     @dtype.setter
@@ -85,22 +216,24 @@ class Tile(PropertyContainer, CommonsTile):
     @property
     def shape(self):
         """tuple: The internal :class:`~numpy.ndarray` storage shape."""
+        if not self.loaded:
+            return self._array.shape + (len(self._ptype), )
         return self._array_data.shape
 
     @property
     def size(self):
         """tuple: The stored image size as a ``(width, height)`` tuple."""
-        return tuple(reversed(self._array_data.shape[:2]))
+        return tuple(reversed(self.shape[:2]))
 
     @property
     def width(self):
         """float: The stored image width."""
-        return self._array_data.shape[1]
+        return self.shape[1]
 
     @property
     def height(self):
         """float: The stored image height."""
-        return self._array_data.shape[0]
+        return self.shape[0]
 
     @property
     def info(self):  # noqa: D401
@@ -131,10 +264,15 @@ class Tile(PropertyContainer, CommonsTile):
     def clone(self):
         """Create a copy of the |TileIO| in a new memory location.
 
+        A lazy |TileIO| is cloned without being decoded, and the clone is decoded in its own array.
+
         Returns:
             |TileIO|: A new |TileIO| instance.
 
         """
+        if not self.loaded:
+            return Tile(self.filename, ptype=self.ptype, dtype=self.dtype, __array__=self._array.copy())
+
         array_data = np.array(self._array_data, copy=True, dtype=self.dtype)
         return Tile(self.filename, ptype=self.ptype, dtype=self.dtype, __array__=array_data, __ptype__=self.ptype)
 
@@ -147,12 +285,41 @@ class Tile(PropertyContainer, CommonsTile):
                 :class:`~numpy.ndarray` storage will be converted.
 
         """
+        if not self.loaded:
+            # Conversions are deferred until the image is decoded.
+            if ptype is not None:
+                self._ptype = ptype
+            if dtype is not None:
+                self._pending_dtype = np.dtype(dtype)
+            return
+
+        array_data = self._convert(ptype=ptype, dtype=dtype)
+        if array_data is not None:
+            self._array_data = array_data
+            self._ptype = ptype if ptype is not None else self._ptype
+
+    def _convert(self, ptype=None, dtype=None):
+        """Convert the |TileIO| internal storage to a new pixel-type and data-type in a single pass.
+
+        Args:
+            ptype (|ptype|): If provided, the |ptype| into which to convert the |TileIO|.
+            dtype (:class:`~numpy.dtype`): If provided, the data-type into which to convert the |TileIO|.
+
+        Returns:
+            :class:`~numpy.ndarray`: A newly allocated converted array, or ``None`` if no conversion is needed.
+
+        """
+        array_data = self._array_data
+        dtype = np.dtype(dtype) if dtype is not None else None
+
         if ptype is not None and ptype != self.ptype:
-            self._array_data = self._ptype.get_conversion_fn_to(ptype)(self._array_data)
-            self._ptype = ptype
+            # The destination pixel-type is directly written in the requested data-type, if any
+            return self._ptype.get_conversion_fn_to(ptype)(array_data, dtype=dtype)
 
-        if dtype is not None and dtype != self.dtype:
-            self._array_data = self._array_data.astype(dtype)
+        if dtype is not None and dtype != array_data.dtype:
+            return array_data.astype(dtype)
+
+        return None
 
     def astype(self, ptype=None, dtype=None):
         """Convert the |TileIO| to a new pixel-type or a new data-type in a new |TileIO|.
@@ -166,6 +333,14 @@ class Tile(PropertyContainer, CommonsTile):
             |TileIO|: A new converted |TileIO|.
 
         """
+        if self.loaded:
+            # A conversion already allocates a new array, so the tile needs not be copied beforehand
+            array_data = self._convert(ptype=ptype, dtype=dtype)
+            if array_data is not None:
+                ptype = ptype if ptype is not None else self.ptype
+                return Tile(self.filename, ptype=ptype, dtype=array_data.dtype,
+                            __array__=array_data, __ptype__=ptype)
+
         tile = self.clone()
         tile.totype(ptype=ptype, dtype=dtype)
         return tile
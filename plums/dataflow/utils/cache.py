@@ -1,10 +1,19 @@
+import os
+import sys
+import pickle
 from hashlib import sha256
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from collections import OrderedDict
+from collections.abc import Mapping
 
 from appdirs import user_cache_dir
 
 from plums.commons.path import Path
-from .path import PathResolver
-from ..io.json import load, dump
+from plums.commons.data import Annotation, RecordCollection
+
+# A rough estimate of a single Record footprint, i.e. its properties dictionary, labels, identifier and coordinates.
+_RECORD_SIZE = 2048
 
 
 class NotInCacheError(Exception):
@@ -25,6 +34,9 @@ class NotInCacheError(Exception):
 class DatasetCache(object):
     """A wrapper class around a dataset cache folder.
 
+    Entries are stored as pickled files named after the hash of their keys, so that an entry is looked-up with a single
+    file open, whatever the number of entries in the cache.
+
     Args:
         prefix (str): A cache prefix to cluster all related entry together and avoid eventual collisions.
 
@@ -33,7 +45,6 @@ class DatasetCache(object):
     def __init__(self, prefix):
         # Store parameters
         self._path = Path(user_cache_dir(appname='plums')) / prefix
-        self._resolver = PathResolver('{key}.json')
 
         # Create prefix if it does not exist
         self._path.mkdir(parents=True, exist_ok=True)
@@ -51,34 +62,230 @@ class DatasetCache(object):
         """
         return sha256((''.join(keys)).encode('utf8')).hexdigest()
 
+    def _entry(self, *keys):
+        """Return the path of the file storing the entry corresponding to the provided keys."""
+        return self._path / '{}.pkl'.format(self.hash(*keys))
+
     def retrieve(self, *keys):
-        """Retrieve a JSON-stored dataset from the cache prefixed folder.
+        """Retrieve a stored dataset from the cache prefixed folder.
 
         Args:
             *keys (str): The requested dataset string keys.
 
         Returns:
-            Any: The deserialized JSON-stored dataset object corresponding to the provided keys.
+            Any: The deserialized dataset object corresponding to the provided keys.
 
         Raises:
-            NotInCacheError: If the provided keys does not match any entry in the cache prefixed folder.
+            NotInCacheError: If the provided keys does not match any valid entry in the cache prefixed folder.
 
         """
-        key = self.hash(*keys)
-        index = {path.match['key']: path for path in self._resolver.find(self._path)}
-
-        if key not in index:
-            raise NotInCacheError(self._path[-1], key)
-
-        return load(index[key])
+        try:
+            with open(str(self._entry(*keys)), 'rb') as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            raise NotInCacheError(self._path[-1], self.hash(*keys))
 
     def cache(self, data, *keys):
-        """Store a JSON-stored dataset in the cache prefixed folder.
+        """Store a dataset in the cache prefixed folder.
 
         Args:
-            data (Any): A JSON-serializable object to store in the cache.
+            data (Any): A picklable object to store in the cache.
             *keys (str): The requested dataset string keys.
 
         """
-        # Dump cache
-        dump(data, self._path / '{}.json'.format(self.hash(*keys)))
+        # Write in a temporary file first so that concurrent readers never see a partial entry.
+        with NamedTemporaryFile(dir=str(self._path), suffix='.tmp', delete=False) as f:
+            try:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except BaseException:
+                os.unlink(f.name)
+                raise
+        os.replace(f.name, str(self._entry(*keys)))
+
+
+def _sizeof(value):
+    """Cheaply estimate the memory footprint of a cached value in bytes.
+
+    Arrays (and array-like objects, *e.g.* tiles or |ArrayRecordCollection|) are measured by their buffer size,
+    mappings and sequences by the sum of their items footprint, |Annotation| by their records footprint, other
+    |RecordCollection| by a rough per-record estimate and any other object by its shallow size.
+
+    Args:
+        value (Any): The value to measure.
+
+    Returns:
+        int: The estimated value footprint in bytes.
+
+    """
+    nbytes = getattr(value, 'nbytes', None)
+    if nbytes is not None:
+        return int(nbytes)
+
+    data = getattr(value, 'data', None)
+    if getattr(data, 'nbytes', None) is not None:
+        return int(data.nbytes)
+
+    if isinstance(value, Mapping):
+        return sum(_sizeof(item) for item in value.values())
+
+    if isinstance(value, (list, tuple)):
+        return sum(_sizeof(item) for item in value)
+
+    if isinstance(value, Annotation):
+        return _sizeof(value.record_collection)
+
+    if isinstance(value, RecordCollection):
+        return len(value) * _RECORD_SIZE
+
+    return sys.getsizeof(value)
+
+
+class MemoryCache(object):
+    """A thread-safe bounded in-memory cache with *LRU* or *LFU* eviction.
+
+    The cache may be bounded by a number of entries, by an estimated memory footprint or both. Whenever a new entry
+    exceeds a budget, entries are evicted, either the least recently used (``'lru'``) or the least frequently used
+    (``'lfu'``, ties being broken by recency) first.
+
+    A single |MemoryCache| may be shared by multiple drivers (*e.g.* a |TileDriver| and an |AnnotationDriver|) to put
+    a single budget on all cached data.
+
+    Args:
+        max_entries (int): Optional. Default to ``None``. If provided, the maximum number of entries in the cache.
+        max_size (int): Optional. Default to ``None``. If provided, the maximum estimated memory footprint of all
+            entries in the cache, in bytes.
+        policy (str): Optional. Default to ``'lru'``. The eviction policy, either ``'lru'`` or ``'lfu'``.
+        sizeof (callable): Optional. Default to a generic estimator. A ``function(value)`` returning the memory
+            footprint in bytes of a value. It is only called if ``max_size`` is provided.
+
+    Raises:
+        ValueError: If ``policy`` is not a valid eviction policy.
+
+    Attributes:
+        hits (int): The number of successful lookups.
+        misses (int): The number of failed lookups.
+        evictions (int): The number of evicted entries.
+
+    """
+
+    def __init__(self, max_entries=None, max_size=None, policy='lru', sizeof=None):
+        if policy not in ('lru', 'lfu'):
+            raise ValueError('Invalid policy: Expected "lru" or "lfu", got {}.'.format(policy))
+
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.policy = policy
+        self._sizeof = _sizeof if sizeof is None else sizeof
+
+        self._entries = OrderedDict()  # key: (value, size, frequency) in recency order.
+        self._size = 0
+        self._lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        """Return the number of entries in the cache."""
+        return len(self._entries)
+
+    def __contains__(self, key):
+        """Return whether a key is in the cache, without counting as a lookup."""
+        return key in self._entries
+
+    def __getitem__(self, key):
+        """Return a cached value, without counting as a lookup nor updating its recency."""
+        return self._entries[key][0]
+
+    def __setitem__(self, key, value):
+        """Store a value in the cache (see :meth:`put`)."""
+        self.put(key, value)
+
+    @property
+    def size(self):
+        """int: The estimated memory footprint of all entries in the cache in bytes, ``0`` if unbounded in size."""
+        return self._size
+
+    def get(self, key, default=None):
+        """Lookup a value in the cache.
+
+        Args:
+            key (Hashable): The entry key.
+            default (Any): Optional. Default to ``None``. The value returned if ``key`` is not in the cache.
+
+        Returns:
+            Any: The cached value or ``default``.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            value, size, frequency = entry
+            self._entries[key] = (value, size, frequency + 1)
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        """Store a value in the cache, evicting entries if a budget is exceeded.
+
+        A value larger than the whole memory budget is not stored.
+
+        Args:
+            key (Hashable): The entry key.
+            value (Any): The value to store.
+
+        """
+        # Values are only measured if the cache is bounded by a memory footprint
+        size = self._sizeof(value) if self.max_size is not None else 0
+        if self.max_size is not None and size > self.max_size:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+
+            while self._entries and ((self.max_entries is not None and len(self._entries) >= self.max_entries)
+                                     or (self.max_size is not None and self._size + size > self.max_size)):
+                self._evict()
+
+            if self.max_entries is not None and self.max_entries <= 0:
+                return
+
+            self._entries[key] = (value, size, 1 if previous is None else previous[2])
+            self._size += size
+
+    def _evict(self):
+        if self.policy == 'lru':
+            key = next(iter(self._entries))
+        else:
+            # The first least frequent key is also the least recently used among them.
+            key = min(self._entries, key=lambda k: self._entries[k][2])
+
+        _, size, _ = self._entries.pop(key)
+        self._size -= size
+        self.evictions += 1
+
+    def clear(self):
+        """Remove all entries from the cache and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __getstate__(self):
+        """Return the cache state without its lock, *e.g.* to send it to worker processes."""
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        """Restore the cache state."""
+        self.__dict__.update(state)
+        self._lock = Lock()
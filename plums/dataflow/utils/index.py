@@ -0,0 +1,422 @@
+import os
+import pickle
+import weakref
+from bisect import bisect_left
+from tempfile import mkstemp, gettempdir
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+
+from plums.commons.path import Path
+
+
+_NONE = np.iinfo(np.uint32).max  # Code of missing match values.
+_ALIGNMENT = 64
+
+
+def _encode(strings):
+    """Encode a sequence of strings in a single UTF-8 buffer delimited by offsets.
+
+    Args:
+        strings (Sequence[str]): The strings to encode.
+
+    Returns:
+        (:class:`~numpy.ndarray`, :class:`~numpy.ndarray`): The ``uint8`` buffer and the ``int64`` string offsets.
+
+    """
+    encoded = [string.encode('utf8', 'surrogateescape') for string in strings]
+    offsets = np.zeros((len(encoded) + 1, ), dtype=np.int64)
+    np.cumsum([len(string) for string in encoded], out=offsets[1:])
+    return np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets
+
+
+class _StringTable(Sequence):
+    """A read-only sequence of strings stored in a single UTF-8 buffer.
+
+    Args:
+        buffer (:class:`~numpy.ndarray`): The ``uint8`` buffer.
+        offsets (:class:`~numpy.ndarray`): The ``int64`` string offsets.
+
+    """
+
+    def __init__(self, buffer, offsets):
+        self._buffer = buffer
+        self._offsets = offsets
+
+    def __getitem__(self, item):
+        """Decode and return the i-th string of the table."""
+        if not 0 <= item < len(self):
+            raise IndexError('Invalid index: {} is out of range.'.format(item))
+        start, stop = self._offsets[item:item + 2].tolist()
+        return self._buffer[start:stop].tobytes().decode('utf8', 'surrogateescape')
+
+    def __len__(self):
+        """Return the number of strings in the table."""
+        return len(self._offsets) - 1
+
+
+def _unlink_shared(filename, pid):
+    """Remove a shared database file, only from the process which created it (*i.e.* not from forked workers)."""
+    if os.getpid() == pid:
+        os.unlink(filename)
+
+
+class PathDatabase(Mapping):
+    """A compact, read-only mapping of match groups to the tuple of |Path| which matched them.
+
+    Storing millions of |Path| objects (each holding its own components list, ``stat`` result and match dictionary)
+    quickly uses gigabytes of memory, which is duplicated in every data loading worker. A |PathDatabase| rather stores
+    its content in a few columnar arrays:
+
+    * Group values are interned per group column in sorted string tables and groups are stored as a 2D array of value
+      codes.
+    * The paths of each group are stored contiguously, delimited by an array of offsets.
+    * Paths are stored as a single encoded buffer of paths relative to the longest common directory prefix.
+    * Path pattern matches (*i.e.* the ``match`` attribute set by |PathResolver|) are interned per group name and
+      stored as a 2D array of value codes.
+
+    |Path| objects, and their ``match`` dictionary, are only materialised when a group is looked-up.
+
+    Because its storage is only made of arrays, a |PathDatabase| may be moved to a memory-mapped file with
+    :meth:`share`, which other processes attach to when unpickling it instead of deserializing a copy.
+
+    Args:
+        items (Iterable): An iterable of ``(group, path)`` pairs, where ``group`` is a tuple of strings. Unless a
+            ``key`` is provided, paths keep their insertion order in their group. Groups are iterated on in their first
+            insertion order.
+        key (callable): Optional. Default to ``None``. If provided, a function of one |Path| which returns a key used
+            to sort paths in their group once and for all.
+
+    """
+
+    def __init__(self, items=(), key=None):
+        # Transient structures
+        group_ids = {}
+        members = []
+        paths = []
+        matches = []
+        keys = []
+        for group, path in items:
+            group_id = group_ids.get(group)
+            if group_id is None:
+                group_id = group_ids[group] = len(group_ids)
+            members.append(group_id)
+            paths.append(str(path))
+            matches.append(getattr(path, 'match', None))
+            if key is not None:
+                keys.append(key(path))
+
+        arrays = {}
+
+        # Intern group values in sorted tables, so that codes may be looked-up by binary search
+        # +-> Codes are stored as big-endian bytes so that group keys compare lexicographically, whatever the platform.
+        width = len(next(iter(group_ids), ()))
+        codes = np.empty((len(group_ids), width), dtype='>u4')
+        for column in range(width):
+            values = sorted({group[column] for group in group_ids})
+            interned = {value: code for code, value in enumerate(values)}
+            codes[:, column] = [interned[group[column]] for group in group_ids]
+            arrays['values_{}'.format(column)], arrays['values_offsets_{}'.format(column)] = _encode(values)
+        arrays['codes'] = codes.view(np.uint8)
+        # +-> Sort group keys for binary search lookups
+        arrays['order'] = np.argsort(codes.view('V{}'.format(4 * width)).ravel(), kind='stable') \
+            if width else np.zeros((0, ), dtype=np.int64)
+
+        # Group paths together, preserving their insertion order unless sorted by key
+        if key is not None:
+            order = np.array(sorted(range(len(members)), key=lambda i: (members[i], keys[i])), dtype=np.int64)
+        else:
+            order = np.argsort(np.asarray(members, dtype=np.int64), kind='stable')
+        members = np.asarray(members, dtype=np.int64)
+        arrays['offsets'] = np.zeros((len(group_ids) + 1, ), dtype=np.int64)
+        np.cumsum(np.bincount(members, minlength=len(group_ids)), out=arrays['offsets'][1:])
+
+        # Intern path matches
+        match_names = tuple(matches[0]) if matches and matches[0] is not None else None
+        interned = [{} for _ in match_names or ()]
+        arrays['match_codes'] = np.empty((len(matches), len(interned)), dtype=np.uint32)
+        for row, i in enumerate(order.tolist()):
+            match = matches[i] or {}
+            arrays['match_codes'][row] = [values.setdefault(match[name], len(values)) if match.get(name) is not None
+                                          else _NONE for values, name in zip(interned, match_names or ())]
+        for column, values in enumerate(interned):
+            arrays['match_values_{}'.format(column)], arrays['match_values_offsets_{}'.format(column)] = \
+                _encode(list(values))
+
+        # Store paths relative to their common directory prefix in a single buffer
+        prefix = os.path.commonprefix(paths) if paths else ''
+        prefix = prefix[:prefix.rfind(os.sep) + 1]
+        arrays['paths'], arrays['paths_offsets'] = _encode([paths[i][len(prefix):] for i in order])
+
+        self._setup(arrays, {'width': width, 'match_names': match_names,
+                             'prefix': Path(prefix).parts if prefix else ()})
+        self._filename = None
+
+    def _setup(self, arrays, metadata):
+        """Initialise the database internals from its storage arrays and metadata."""
+        self._arrays = arrays
+        self._metadata = metadata
+
+        width = metadata['width']
+        self._codes = arrays['codes'].view('>u4')
+        self._offsets = arrays['offsets']
+        self._paths = (arrays['paths'], arrays['paths_offsets'])
+        self._match_codes = arrays['match_codes']
+        self._match_names = metadata['match_names']
+        self._prefix = metadata['prefix']
+        self._values = tuple(_StringTable(arrays['values_{}'.format(column)],
+                                          arrays['values_offsets_{}'.format(column)]) for column in range(width))
+        self._match_values = tuple(_StringTable(arrays['match_values_{}'.format(column)],
+                                                arrays['match_values_offsets_{}'.format(column)])
+                                   for column in range(len(self._match_names or ())))
+
+        self._keys = arrays['codes'].view('V{}'.format(4 * width)).ravel() if width else None
+        self._order = arrays['order']
+
+    def _find(self, group):
+        """Return the row of a group in the database or ``None`` if it could not be found.
+
+        Args:
+            group (tuple): The group to look-up.
+
+        Returns:
+            int: The group row.
+
+        """
+        if not isinstance(group, tuple) or len(group) != self._codes.shape[1]:
+            return None
+
+        if self._keys is None:
+            return 0 if len(self._codes) else None
+
+        codes = []
+        for values, value in zip(self._values, group):
+            try:
+                code = bisect_left(values, value)
+            except TypeError:
+                return None
+            if code == len(values) or values[code] != value:
+                return None
+            codes.append(code)
+
+        key = np.array([codes], dtype='>u4').view(self._keys.dtype).ravel()
+        position = int(np.searchsorted(self._keys, key, sorter=self._order)[0])
+        if position < len(self._order) and self._keys[self._order[position]] == key[0]:
+            return int(self._order[position])
+        return None
+
+    def group(self, row):
+        """Return the group stored at a given row, *i.e.* in first insertion order.
+
+        Args:
+            row (int): The group row.
+
+        Returns:
+            tuple: The group.
+
+        """
+        return tuple(values[code] for values, code in zip(self._values, self._codes[row].tolist()))
+
+    def __getitem__(self, group):
+        """Return the tuple of |Path| matching a group.
+
+        Args:
+            group (tuple): The group to look-up.
+
+        Returns:
+            tuple: The |Path| matching the group.
+
+        Raises:
+            KeyError: If the group is not in the database.
+
+        """
+        row = self._find(group)
+        if row is None:
+            raise KeyError(group)
+
+        buffer, offsets = self._paths
+        start, stop = self._offsets[row:row + 2].tolist()
+        offsets = offsets[start:stop + 1].tolist()
+        paths = []
+        for i in range(stop - start):
+            relative = buffer[offsets[i]:offsets[i + 1]].tobytes().decode('utf8', 'surrogateescape')
+            path = Path.from_parts(self._prefix + tuple(relative.split(os.sep)))
+            if self._match_names is not None:
+                path.match = {name: None if code == _NONE else values[code] for name, values, code
+                              in zip(self._match_names, self._match_values, self._match_codes[start + i].tolist())}
+            paths.append(path)
+
+        return tuple(paths)
+
+    def __contains__(self, group):
+        """Return whether a group is in the database."""
+        return self._find(group) is not None
+
+    def __iter__(self):
+        """Iterate over groups in their first insertion order."""
+        for row in range(len(self)):
+            yield self.group(row)
+
+    def __len__(self):
+        """Return the number of groups in the database."""
+        return len(self._codes)
+
+    def count(self, group):
+        """Return the number of paths matching a group, without materialising them.
+
+        Args:
+            group (tuple): The group to look-up.
+
+        Returns:
+            int: The number of |Path| matching the group (``0`` if the group is not in the database).
+
+        """
+        row = self._find(group)
+        return 0 if row is None else int(self._offsets[row + 1] - self._offsets[row])
+
+    @property
+    def nbytes(self):
+        """int: The memory footprint of the database storage arrays, in bytes."""
+        return sum(array.nbytes for array in self._arrays.values())
+
+    @property
+    def shared(self):
+        """bool: Whether the database storage is a memory-mapped file shared by all processes using it."""
+        return self._filename is not None
+
+    def share(self, directory=None):
+        """Move the database storage to a read-only memory-mapped file.
+
+        The returned database pages are shared by all processes using it, *e.g.* data loading workers, which attach to
+        the file when unpickling the database instead of deserializing a copy of its content. The file is removed when
+        the returned database is garbage collected in the current process, but not in forked processes.
+
+        Args:
+            directory (PathLike): Optional. Default to ``/dev/shm`` if it exists and to the system temporary directory
+                otherwise. The directory in which to create the memory-mapped file.
+
+        Returns:
+            |PathDatabase|: A database with the same content, stored in a memory-mapped file.
+
+        """
+        if directory is None:
+            directory = '/dev/shm' if os.path.isdir('/dev/shm') else gettempdir()
+
+        descriptor, filename = mkstemp(prefix='plums-', suffix='.index', dir=str(directory))
+        try:
+            with os.fdopen(descriptor, 'wb') as f:
+                self._dump(f)
+            database = self._attach(filename)
+        except BaseException:
+            os.unlink(filename)
+            raise
+
+        weakref.finalize(database, _unlink_shared, filename, os.getpid())
+        return database
+
+    def _dump(self, f):
+        """Write the database storage in a file, with each array aligned on a cache line.
+
+        The file starts with the 8 bytes length of a pickled header holding the database metadata and arrays layout.
+
+        Args:
+            f (BinaryIO): A file opened for writing.
+
+        """
+        layout = {}
+        position = 0
+        for name, array in self._arrays.items():
+            layout[name] = (array.dtype.str, array.shape, position)
+            position += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+        header = pickle.dumps((self._metadata, layout), protocol=pickle.HIGHEST_PROTOCOL)
+        start = -(-(8 + len(header)) // _ALIGNMENT) * _ALIGNMENT
+
+        f.write(len(header).to_bytes(8, 'little'))
+        f.write(header)
+        for name, array in self._arrays.items():
+            f.seek(start + layout[name][2])
+            f.write(np.ascontiguousarray(array).tobytes())
+        f.truncate(start + position)
+
+    @classmethod
+    def _attach(cls, filename):
+        """Construct a |PathDatabase| from a memory-mapped database file.
+
+        Args:
+            filename (str): The path to the database file.
+
+        Returns:
+            |PathDatabase|: The memory-mapped database.
+
+        """
+        with open(filename, 'rb') as f:
+            length = int.from_bytes(f.read(8), 'little')
+            metadata, layout = pickle.loads(f.read(length))
+        start = -(-(8 + length) // _ALIGNMENT) * _ALIGNMENT
+
+        storage = np.memmap(filename, dtype=np.uint8, mode='r')
+        arrays = {}
+        for name, (dtype, shape, offset) in layout.items():
+            dtype = np.dtype(dtype)
+            size = int(np.prod(shape)) * dtype.itemsize
+            arrays[name] = storage[start + offset:start + offset + size].view(dtype).reshape(shape)
+
+        database = cls.__new__(cls)
+        database._setup(arrays, metadata)
+        database._filename = filename
+        return database
+
+    def __getstate__(self):
+        """Return the database state, which is only its file name if it is shared."""
+        if self._filename is not None:
+            return {'filename': self._filename}
+        return {'arrays': self._arrays, 'metadata': self._metadata}
+
+    def __setstate__(self, state):
+        """Restore the database state, attaching to its memory-mapped file if it is shared."""
+        if 'filename' in state:
+            self.__dict__.update(self._attach(state['filename']).__dict__)
+        else:
+            self._setup(state['arrays'], state['metadata'])
+            self._filename = None
+
+
+class GroupIndex(Sequence):
+    """A read-only sequence of groups stored as rows of a |PathDatabase|.
+
+    Args:
+        database (|PathDatabase|): The database the groups are stored in.
+        rows (Sequence[int]): The database rows of the index groups.
+
+    """
+
+    def __init__(self, database, rows):
+        self._database = database
+        self._rows = np.asarray(rows, dtype=np.int64)
+
+    @property
+    def rows(self):
+        """:class:`~numpy.ndarray`: A read-only array of the database rows of the index groups."""
+        rows = self._rows.view()
+        rows.flags.writeable = False
+        return rows
+
+    def __getitem__(self, item):
+        """Return the i-th group of the index, or a list of groups if given a slice."""
+        if isinstance(item, slice):
+            return [self._database.group(row) for row in self._rows[item].tolist()]
+        return self._database.group(self._rows[item])
+
+    def __len__(self):
+        """Return the number of groups in the index."""
+        return len(self._rows)
+
+    def __eq__(self, other):
+        """Return whether the index holds the same groups as another sequence."""
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(group == other_group for group, other_group in zip(self, other))
+
+    def __repr__(self):
+        """Return the index representation."""
+        return '{}({})'.format(type(self).__name__, list(self))
@@ -1,9 +1,76 @@
+import os
 import re
-from copy import copy
+import time
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 
 from plums.commons.path import Path
 from .parser import Parser, ComponentResolver, GroupResolver
 
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover
+    import sre_parse
+
+# Directories modified less than this delay (in seconds) before a walk are listed again in the next walk, as
+# modification times may be too coarse to tell them apart from a modification occurring right after being listed.
+_RACY_DELAY = 2
+
+_SEPARATOR = ord('/')
+_NOT_CATEGORIES = ('CATEGORY_NOT_DIGIT', 'CATEGORY_NOT_SPACE', 'CATEGORY_NOT_WORD', 'CATEGORY_NOT_LINEBREAK')
+
+
+def _may_match_separator(regex):
+    """Return whether a *regular expression* may consume a path separator, *i.e.* span several path entities.
+
+    Args:
+        regex (str): A *regular expression*.
+
+    Returns:
+        bool: ``False`` if the *regular expression* may not match a forward-slash */*, ``True`` if it may or if it
+        could not be analysed.
+
+    """
+    def _in(items):
+        negate = any(str(op) == 'NEGATE' for op, _ in items)
+        for op, av in items:
+            op = str(op)
+            if op == 'LITERAL' and av == _SEPARATOR \
+                    or op == 'RANGE' and av[0] <= _SEPARATOR <= av[1] \
+                    or op == 'CATEGORY' and str(av) in _NOT_CATEGORIES:
+                return not negate
+        return negate
+
+    def _pattern(pattern):
+        for op, av in pattern:
+            op = str(op)
+            if op in ('AT', 'ASSERT', 'ASSERT_NOT', 'GROUPREF'):  # Zero-width or already analysed
+                continue
+            if op == 'LITERAL':
+                matches = av == _SEPARATOR
+            elif op == 'NOT_LITERAL':
+                matches = av != _SEPARATOR
+            elif op == 'IN':
+                matches = _in(av)
+            elif op == 'SUBPATTERN':
+                matches = _pattern(av[-1])
+            elif op == 'BRANCH':
+                matches = any(_pattern(branch) for branch in av[1])
+            elif op in ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT'):
+                matches = _pattern(av[-1])
+            elif op == 'ATOMIC_GROUP':
+                matches = _pattern(av)
+            else:  # Conservatively assume anything else may match
+                matches = True
+            if matches:
+                return True
+        return False
+
+    try:
+        return _pattern(sre_parse.parse(regex))
+    except Exception:  # noqa: B902
+        return True
+
 
 class PathResolver(object):
     """Search recursively for |Path| which match a dataset pattern.
@@ -34,6 +101,18 @@ class PathResolver(object):
             self._degenerate = True
             self._prefix = self._regex_path
 
+        # Compute per-depth walk properties once
+        # +-> Path entities are matched relative to the entry-point, i.e. after the prefix for absolute patterns
+        self._parts = self._regex_path.parts
+        self._anchor = len(self._prefix) if self._regex_path[0] == '/' else 0
+        # +-> Leading components which match exactly one path entity may be used to prune directories while walking
+        shallow = [not _may_match_separator(part) for part in self._parts[self._anchor:]]
+        self._prunable = shallow.index(False) if not all(shallow) else len(shallow)
+        # +-> If all components are shallow, files all lie at the same depth under the entry-point
+        self._max_depth = len(shallow) - 1 if all(shallow) else None
+        # +-> Compiled partial regexes, cached by depth
+        self._partial_regexes = {}
+
     @property
     def degenerate(self):
         """bool: ``True`` if the provided pattern is degenerate, *i.e.* it designate a single file."""
@@ -44,11 +123,47 @@ class PathResolver(object):
         """tuple: A tuple containing the names of the named groups found in the path pattern."""
         return tuple(resolver.name for resolver in self._resolvers if isinstance(resolver, GroupResolver))
 
-    def find(self, path=None):
+    def scope(self, group_names):
+        """Return the groups which, given a set of known groups, designate the directory where matches are found.
+
+        The scope is made of the groups in the longest leading sequence of directory components which are either
+        components or non-recursive groups in ``group_names``. All matches sharing the same scope group values lie in
+        the same directory sub-tree, which :meth:`find` walks in one go, *i.e.* those matches are yielded contiguously.
+
+        Args:
+            group_names (Sequence[str]): The names of the known groups.
+
+        Returns:
+            tuple: The names of the scope groups, in the pattern order.
+
+        """
+        scope = []
+        for resolver, part in zip(self._resolvers[:-1], self._parts[:-1]):
+            if isinstance(resolver, GroupResolver):
+                if resolver.name not in group_names or _may_match_separator(part):
+                    break
+                scope.append(resolver.name)
+        return tuple(scope)
+
+    def find(self, path=None, workers=None, snapshot=None):
         """Find all |Path| which satisfies the dataset pattern by walking on disk.
 
+        The walk relies on :func:`os.scandir` and works on plain strings, with partial regular expressions compiled
+        once per depth, until a match is found. Sub-directories are scanned concurrently with a thread pool, which
+        greatly speeds up discovery on network or parallel filesystems, while matches are still yielded in the same
+        top-down order as :func:`os.walk`.
+
+        If a walk ``snapshot`` is provided, the modification time and inode of each visited directory are recorded in
+        it alongside its matching files and candidate sub-directories. In a later walk with the same snapshot, a
+        directory which was not modified since is validated with a single ``stat`` call instead of being listed again,
+        so that only new or modified directories are actually scanned.
+
         Args:
             path (PathLike): For relative pattern, an entry-point must be provided to avoid walking from root.
+            workers (int): Optional. Default to ``None``. The number of threads used to scan directories. If ``None``,
+                the :class:`~concurrent.futures.ThreadPoolExecutor` default is used.
+            snapshot (dict): Optional. Default to ``None``. If provided, a JSON-serializable walk snapshot, either
+                empty or recorded by a previous walk with the same resolver and entry-point, which is updated in-place.
 
         Yields:
             Path: A valid |Path| with named group values stored in a ``match`` dictionary.
@@ -61,13 +176,15 @@ class PathResolver(object):
         if self._regex_path[0] != '/':
             if path is None:
                 raise ValueError('The dataset pattern to search for is relative but no search path was provided.')
-            entry_point = path
+            relative = ''
             if self._prefix != '.':  # Avoid dangling '.'
                 path = path / self._prefix
+                relative = str(self._prefix)
         else:
             if path is not None:
                 raise ValueError('The dataset pattern to search for is absolute but a search path was provided.')
             path = entry_point = self._prefix
+            relative = ''
             # Update internal full regex from actual entry-point
             self._regex = re.compile(str(self._regex_path.anchor_to_path(entry_point)))
 
@@ -75,60 +192,155 @@ class PathResolver(object):
         if self._degenerate:
             if (path[:-1] / str(path[-1]).replace(r'\.', '.')).exists():
                 yield path[:-1] / str(path[-1]).replace(r'\.', '.')
+                return
             else:
                 raise OSError('Degenerate path pattern points to a non-existing file.')
 
         # Regular branch
-        # Start search
-        # +-> Initialise partial pointers
-        partials = {}
-        partials.setdefault(str(path[:-1]), self._regex_path[:len(self._prefix) + 1])
-        # +-> Start walking
-        for root, directories, files in path.walk(followlinks=True):
-            # +-> Build partial regex for root if is does not exist already
-            partials.setdefault(str(root), partials[str(root[:-1])])
-            # +-> Fetch partial regex
-            partial = partials[str(root)]
-            relative_partial = partial.anchor_to_path(entry_point) if partial[0] == '/' else partial
-            regex = re.compile(str(relative_partial))
-            # +-> Are we still at a directory level ?
-            if not partial[-1].filename:
-                # +-> Prune non matching directory from walk to avoid visiting known false candidates
-                for i, directory in enumerate(copy(directories)):
-                    current = root / directory
-                    relative_current = current.anchor_to_path(entry_point)
-                    # If the current directory does not match partial regex
-                    if regex.fullmatch(str(relative_current)) is None:
-                        # If we stopped on a recursion, we must try the level under to check
-                        # we did not just reached the end of recursion
-                        if getattr(self._resolvers[len(partial) - 1], 'recursive', False):
-                            # Add a level
-                            partial_candidate = partial / self._regex_path[len(partial)]
-                            # If we didn't just pop it out
-                            if re.fullmatch(str(partial_candidate), str(relative_current)) is None:
-                                directories.remove(directory)
-                                continue
-                            else:  # Move partial regex forward
-                                new_partial = partial_candidate / self._regex_path[len(partial) + 1]
-                                partials.setdefault(str(current), new_partial)
-                        else:  # If we stopped on a non recursion, just pop it out
-                            directories.remove(directory)
-                            continue
-                    else:  # If the current directory match the partial regex
-                        # If we stopped on a non recursion, we must advance the partial regex
-                        if not getattr(self._resolvers[len(partial) - 1], 'recursive', False):
-                            partials.setdefault(str(current), partial / self._regex_path[len(partial)])
-
-            if partial[-1].filename \
-                    or (getattr(self._resolvers[len(partial) - 1], 'recursive', False)
-                        and self._regex_path[len(partial)].filename):
-                # We reached the file level ! \o/
-                for file in files:
-                    current = root / file
-                    relative_current = current.anchor_to_path(entry_point)
-                    match = self._regex.fullmatch(str(relative_current))
-                    # If the current file matches full regex
-                    if match is not None:
-                        # +-> Add matched groups to path and yield
-                        current.match = match.groupdict()
-                        yield current
+        scan = self._scan
+        if snapshot is not None:
+            previous = dict(snapshot)
+            snapshot.clear()
+            scan = partial(self._scan, previous=previous, snapshot=snapshot,
+                           racy=int((time.time() - _RACY_DELAY) * 1e9))
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        stack = [executor.submit(scan, path.parts, relative, len(relative.split('/')) if relative else 0)]
+        try:
+            while stack:
+                matches, directories = stack.pop().result()
+                for current in matches:
+                    yield current
+                # Depth-first consumption keeps the os.walk top-down order
+                stack.extend(reversed([executor.submit(scan, *directory) for directory in directories]))
+        finally:
+            for future in stack:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _partial_regex(self, depth):
+        """Return the compiled partial regex matching directories at a given depth under the entry-point.
+
+        Args:
+            depth (int): The directory depth under the entry-point.
+
+        Returns:
+            :class:`re.Pattern`: The compiled partial regex, or ``None`` if directories at this depth can not be pruned.
+
+        """
+        if depth > self._prunable:
+            return None
+
+        regex = self._partial_regexes.get(depth)
+        if regex is None:
+            regex = re.compile('/'.join(self._parts[self._anchor:self._anchor + depth]))
+            self._partial_regexes[depth] = regex
+        return regex
+
+    def _scan(self, root, relative, depth, previous=None, snapshot=None, racy=None):
+        """Scan a single directory for matching files and candidate sub-directories.
+
+        Args:
+            root (tuple): The components of the directory to scan.
+            relative (str): The directory path relative to the entry-point.
+            depth (int): The directory depth under the entry-point.
+            previous (dict): Optional. Default to ``None``. If provided, a previous walk snapshot from which the scan
+                results of unchanged directories are reused.
+            snapshot (dict): Optional. Default to ``None``. If provided, a walk snapshot in which to record the scan
+                results.
+            racy (int): Optional. Default to ``None``. The modification time, in nanoseconds, above which directory
+                scan results may not be trusted in a later walk.
+
+        Returns:
+            (list, list): The matching files as |Path| and the sub-directories to scan as ``(root, relative, depth)``
+            tuples.
+
+        """
+        directory_path = os.path.join(*root)
+        entry = None
+        if snapshot is not None:
+            try:
+                stat = os.stat(directory_path)
+            except OSError:
+                return [], []
+            # Any entry added, removed or renamed in a directory updates its modification time
+            signature = [stat.st_mtime_ns, stat.st_ino, stat.st_dev]
+            entry = previous.get(directory_path)
+            if entry is not None and entry[0] != signature:
+                entry = None
+
+        if entry is not None:
+            files, directories = entry[1], entry[2]
+        else:
+            try:
+                files, directories = self._filter(*self._list(directory_path), relative=relative, depth=depth)
+            except OSError:
+                return [], []
+
+        if snapshot is not None:
+            # Modification times too close to the walk are not reliable enough to detect later modifications
+            snapshot[directory_path] = [signature if signature[0] < racy else None, files, directories]
+
+        prefix = relative + '/' if relative else ''
+
+        matches = []
+        for file in files:
+            current = Path.from_parts(root + (file, ))
+            current.match = self._regex.fullmatch(prefix + file).groupdict()
+            matches.append(current)
+
+        return matches, [(root + (directory, ), prefix + directory, depth + 1) for directory in directories]
+
+    @staticmethod
+    def _list(directory_path):
+        """List the files and the sub-directories of a directory.
+
+        Args:
+            directory_path (str): The directory to list.
+
+        Returns:
+            (list, list): The names of the files and of the sub-directories found in the directory.
+
+        Raises:
+            OSError: If the directory could not be listed.
+
+        """
+        directories = []
+        files = []
+        with os.scandir(directory_path) as iterator:
+            for entry in iterator:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                (directories if is_dir else files).append(entry.name)
+
+        return files, directories
+
+    def _filter(self, files, directories, relative, depth):
+        """Select the matching files and the candidate sub-directories of a directory.
+
+        Args:
+            files (list): The names of the files found in the directory.
+            directories (list): The names of the sub-directories found in the directory.
+            relative (str): The directory path relative to the entry-point.
+            depth (int): The directory depth under the entry-point.
+
+        Returns:
+            (list, list): The names of the files matching the dataset pattern and of the sub-directories which may
+            contain matching files.
+
+        """
+        prefix = relative + '/' if relative else ''
+
+        files = [file for file in files if self._regex.fullmatch(prefix + file) is not None]
+
+        if self._max_depth is not None and depth >= self._max_depth:
+            return files, []
+
+        # Prune directories which do not match the partial regex at their depth
+        regex = self._partial_regex(depth + 1)
+        if regex is not None:
+            directories = [directory for directory in directories if regex.fullmatch(prefix + directory) is not None]
+
+        return files, directories
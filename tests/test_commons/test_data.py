@@ -71,10 +71,66 @@ class TestBase:
         p = plums.commons.data.mixin.PropertyContainer()
         mixin_suite(p)  # Base validity tests
 
+    def test_property_container_attributes(self):
+        class Container(plums.commons.data.mixin.PropertyContainer):
+            __slots__ = 'slot',
+
+            @property
+            def computed(self):
+                return 'computed'
+
+        container = Container(some_property='some property')
+        container.slot = 'slot'
+        container.attribute = 'attribute'
+
+        # Slots, attributes and descriptors resolve normally, properties are exposed as attributes
+        assert container.slot == 'slot'
+        assert container.attribute == 'attribute'
+        assert container.computed == 'computed'
+        assert container.some_property == 'some property'
+        assert 'attribute' not in container.properties
+
+        # Missing names raise an AttributeError naming the attribute
+        with pytest.raises(AttributeError, match="'Container' object has no attribute 'missing'"):
+            _ = container.missing
+        assert getattr(container, 'missing', None) is None
+
+        # Assignments round-trip either to the properties or to attributes
+        container.some_property = 'other property'
+        assert container.properties == {'some_property': 'other property'}
+        container.slot = 'other slot'
+        assert container.slot == 'other slot'
+        container.properties = {'attribute': 'property'}
+        assert container.attribute == 'attribute'
+        del container.attribute
+        assert container.properties == {}
+        assert container.attribute == 'attribute'
+
     def test_id_mixin(self):
         id_ = plums.commons.data.mixin.IdentifiedMixIn()
         mixin_suite(id_)  # Base validity tests
 
+    def test_lazy_id(self):
+        import pickle
+        from copy import copy, deepcopy
+
+        # Identifiers are generated on first access only
+        record = data.Record([0, 1], ['car'])
+        assert '_id' not in record.__dict__
+        assert record.id == record.id
+        assert plums.commons.data.mixin.IdentifiedMixIn(id='some-id').id == 'some-id'
+
+        # Copies and serialized instances share the identifier of the original
+        record = data.Record([0, 1], ['car'])
+        assert copy(record).id == record.id
+        for obj in (record, Label('car'), Taxonomy(Label('car'))):
+            for duplicate in (deepcopy(obj), pickle.loads(pickle.dumps(obj))):
+                assert duplicate.id == obj.id
+
+        record = data.Record([0, 1], ['car'])
+        record.id = 'other-id'
+        assert record.id == 'other-id'
+
 
 class TestRecord:
     def test_record(self):
@@ -154,7 +210,8 @@ class TestRecord:
                '"tags": "car,road vehicle"}, ' \
                '"type": "Feature"}'
 
-    def test_record_collection_with_taxonomy_init(self):  # noqa: R701
+    @pytest.mark.parametrize('collection_type', [data.RecordCollection, data.ArrayRecordCollection])
+    def test_record_collection_with_taxonomy_init(self, collection_type):  # noqa: R701
         import geojson
 
         taxonomy = Taxonomy(Label('road vehicle'), Label('car'))
@@ -165,15 +222,15 @@ class TestRecord:
         r = data.Record([0, 1, 2], ['car', 'road vehicle'], some_property='some property', another_property=45)
 
         with pytest.raises(ValueError, match='Expected at most'):
-            rc = data.RecordCollection(r, taxonomy=incomplete_taxonomy)
+            rc = collection_type(r, taxonomy=incomplete_taxonomy)
 
         with pytest.raises(ValueError, match='are not part of the taxonomy'):
-            rc = data.RecordCollection(r, taxonomy=different_taxonomy)
+            rc = collection_type(r, taxonomy=different_taxonomy)
 
         with pytest.raises(ValueError, match='Some labels are part of the same true-root subtree'):
-            rc = data.RecordCollection(r, taxonomy=invalid_taxonomy)
+            rc = collection_type(r, taxonomy=invalid_taxonomy)
 
-        rc = data.RecordCollection(r, taxonomy=taxonomy)
+        rc = collection_type(r, taxonomy=taxonomy)
         mixin_suite(rc)  # Base validity tests
 
         assert hasattr(rc, 'id')
@@ -241,7 +298,8 @@ class TestRecord:
                             some_property='some property', another_property=45)
         assert rc[1].labels == (Label('car'), )
 
-    def test_record_collection_with_taxonomy_add(self):  # noqa: R701
+    @pytest.mark.parametrize('collection_type', [data.RecordCollection, data.ArrayRecordCollection])
+    def test_record_collection_with_taxonomy_add(self, collection_type):  # noqa: R701
         import geojson
 
         taxonomy = Taxonomy(Label('road vehicle'), Label('car'))
@@ -250,7 +308,7 @@ class TestRecord:
         incomplete_taxonomy = Taxonomy(Label('road vehicle'))
 
         r = data.Record([0, 1, 2], ['car', 'road vehicle'], some_property='some property', another_property=45)
-        rc = data.RecordCollection(r)
+        rc = collection_type(r)
         mixin_suite(rc)  # Base validity tests
 
         assert hasattr(rc, 'id')
@@ -329,11 +387,12 @@ class TestRecord:
                             some_property='some property', another_property=45)
         assert rc[1].labels == (Label('car'), )
 
-    def test_record_collection_without_taxonomy(self):
+    @pytest.mark.parametrize('collection_type', [data.RecordCollection, data.ArrayRecordCollection])
+    def test_record_collection_without_taxonomy(self, collection_type):
         import geojson
 
         r = data.Record([0, 1, 2], ['car', 'road vehicle'], some_property='some property', another_property=45)
-        rc = data.RecordCollection(r)
+        rc = collection_type(r)
         mixin_suite(rc)  # Base validity tests
 
         assert hasattr(rc, 'id')
@@ -375,7 +434,138 @@ class TestRecord:
         assert 'trucks' in rc.taxonomy
         assert rc.taxonomy['trucks'].parent == rc.taxonomy.root
 
-        rc = data.RecordCollection(r)
+        rc = collection_type(r)
+
+    def test_array_record_collection(self):
+        import geojson
+
+        r = data.Record([0, 1, 2], ['car', 'road vehicle'], some_property='some property', another_property=45)
+        r2 = data.Record([[[0, 0], [0, 1], [1, 1], [0, 0]]], ['car', 'truck'],
+                         some_property='some property', another_property=45)
+        expected = data.RecordCollection(r, r2)
+
+        rc = data.ArrayRecordCollection.from_arrays(
+            [[0, 1, 2], [0, 0, 0], [0, 1, 0], [1, 1, 0], [0, 0, 0]], [0, 1, 5], [0, 1, 2], [0, 1, 0, 2], [0, 2, 4],
+            ['car', 'road vehicle', 'truck'], ids=[r.id, r2.id],
+            properties=[{'some_property': 'some property', 'another_property': 45}] * 2, points=[True, False])
+        mixin_suite(rc)  # Base validity tests
+
+        # Records are only constructed when accessed
+        assert rc._records == [None, None]
+        assert len(rc) == 2
+        assert 'car' in rc.taxonomy
+        assert rc.taxonomy['truck'].parent == rc.taxonomy.root
+        assert rc[1].labels == (Label('car'), Label('truck'))
+        assert rc[1].confidence is None
+        assert rc[1].another_property == 45
+        assert rc._records[0] is None
+        assert rc[-1] is rc[1]
+
+        assert rc[0].coordinates == [0, 1, 2]
+        assert rc[1].coordinates == [[[0, 0, 0], [0, 1, 0], [1, 1, 0], [0, 0, 0]]]
+        assert [record.id for record in rc] == [r.id, r2.id]
+
+        # Modifications to constructed records are kept
+        rc[0].confidence = 0.5
+        assert rc[0].confidence == 0.5
+
+        rc.append(data.Record([1, 1], ['bicycle']))
+        assert len(rc) == 3
+        assert 'bicycle' in rc.taxonomy
+
+        with pytest.raises(IndexError):
+            _ = rc[3]
+
+        rc = data.ArrayRecordCollection.from_arrays([[0, 1, 2]], [0, 1], [0, 1], [0, 1], [0, 2],
+                                                    ['car', 'road vehicle'], ids=[r.id], properties=[r.properties],
+                                                    points=[True])
+        assert geojson.dumps(rc, sort_keys=True) == geojson.dumps(data.RecordCollection(r), sort_keys=True)
+        assert geojson.dumps(data.ArrayRecordCollection(r, r2), sort_keys=True) \
+            == geojson.dumps(expected, sort_keys=True)
+
+        # Taxonomies are validated once per distinct label tuple
+        with pytest.raises(ValueError, match='are not part of the taxonomy'):
+            rc.taxonomy = Taxonomy(Label('road vehicle'), Label('other'))
+
+        rc.taxonomy = Taxonomy(Label('road vehicle'), Label('car'))
+        assert rc[0].taxonomy is rc.taxonomy
+        assert rc.get(max_depth=1)[0].labels == (Label('car'), Label('road vehicle'))
+
+        with pytest.raises(ValueError, match='Expected at least 1 label'):
+            data.ArrayRecordCollection.from_arrays([[0, 0]], [0, 1], [0, 1], [], [0, 0], [], points=[True])
+
+    def test_array_record_collection_arrays(self):
+        import geojson
+
+        taxonomy = Taxonomy(Label('road vehicle', children=(Label('truck'), )), Label('car'))
+        r = data.Record([0, 1], ['car', 'road vehicle'], some_property='some property')
+        r2 = data.Record([[[0, 0], [0, 2], [3, 2], [0, 0]], [[1, 1], [1, 2], [2, 1]]], ['car', 'truck'], 0.5)
+        expected = geojson.dumps(data.RecordCollection(r, r2, taxonomy=taxonomy), sort_keys=True)
+
+        rc = data.ArrayRecordCollection(r, taxonomy=taxonomy)
+        rc.append(r2)
+
+        # Kept records are encoded when arrays are accessed
+        assert rc.vertices.tolist() == [[0, 1], [0, 0], [0, 2], [3, 2], [0, 0], [1, 1], [1, 2], [2, 1]]
+        assert rc.ring_offsets.tolist() == [0, 1, 5, 8]
+        assert rc.geometry_offsets.tolist() == [0, 1, 3]
+        assert rc.points.tolist() == [True, False]
+        assert [rc.label_names[i] for i in rc.label_indices] == ['car', 'road vehicle', 'car', 'truck']
+        assert rc.label_offsets.tolist() == [0, 2, 4]
+        np.testing.assert_array_equal(rc.confidences, [np.nan, 0.5])
+        np.testing.assert_array_equal(rc.bounds, [[0, 1, 0, 1], [0, 0, 3, 2]])
+        assert rc.nbytes > 0
+        assert not rc.vertices.flags.writeable
+
+        # Modifications of kept records are reflected in the arrays
+        rc[0].confidence = 0.25
+        np.testing.assert_array_equal(rc.confidences, [0.25, 0.5])
+        rc[0].confidence = None
+
+        # Compacted records are converted and constructed from the arrays
+        rc.compact()
+        assert rc._records == [None, None]
+        assert geojson.dumps(rc, sort_keys=True) == expected
+        assert rc[0] is not r
+        assert rc[0].id == r.id
+        assert rc[1].labels == r2.labels
+        assert rc[1].taxonomy is taxonomy
+        assert rc[1].coordinates == r2.coordinates
+        assert rc.to_geojson(style='export-service')['features'][1]['properties'] == \
+            {'tags': 'car,truck', 'score': 0.5}
+
+        rc.compact()
+        assert rc.get(max_depth=1)[1].labels == (Label('car'), Label('road vehicle'))
+        assert rc.get(max_depth={'car': 0})[1].labels == (Label('car'), Label('truck'))
+        assert [record.labels for record in rc.get()[:]] == [r.labels, r2.labels]
+        assert rc._records == [None, None]
+
+        with pytest.raises(IndexError):
+            _ = rc.get()[2]
+
+        # Ids generated for records without one are stable
+        rc = data.ArrayRecordCollection.from_arrays([[0, 0]], [0, 1], [0, 1], [0], [0, 1], ['car'], points=[True])
+        assert rc.get()[0].id == rc[0].id
+
+        with pytest.raises(ValueError, match='Arrays lengths and offsets are inconsistent'):
+            data.ArrayRecordCollection.from_arrays([[0, 0]], [0, 1], [0, 1], [0], [0, 1], ['car'], points=[])
+
+        with pytest.raises(ValueError, match='No taxonomy exists for this record but a max_depth was provided'):
+            _ = rc.get(max_depth=1)[0]
+
+        # Integer confidence scores are kept as integers if they all are
+        rc = data.ArrayRecordCollection.from_arrays([[0, 0], [1, 1]], [0, 1, 2], [0, 1, 2], [0, 0], [0, 1, 2], ['car'],
+                                                    confidences=[64, 1], points=[True, True])
+        rc.append(data.Record([2, 2], ['car'], 3))
+        assert rc.confidences.dtype == np.int64
+        assert rc.get()[0].confidence == 64 and isinstance(rc.get()[0].confidence, int)
+        rc.append(data.Record([3, 3], ['car'], 0.5))
+        assert rc.confidences.dtype == np.float64
+        np.testing.assert_array_equal(rc.confidences, [64, 1, 3, 0.5])
+
+        rc.append(data.Record([0, 0, 0], ['car']))
+        with pytest.raises(ValueError, match='share the same dimension'):
+            rc.compact()
 
 
 class TestTile:
@@ -76,6 +76,10 @@ def test_subset():
     with pytest.raises(IndexError):
         _ = subset[3]
 
+    assert dataset.get_many([5, 0]) == [6, 1]
+    assert subset.get_many([2, 0, 0]) == [6, 2, 2]
+    assert Subset([1, 2, 3], [2, 1]).get_many([0, 1]) == [3, 2]
+
 
 class TestConcatDataset:
     def test_concat_two_singletons(self):
@@ -229,3 +233,29 @@ class TestConcatDataset:
 
         with pytest.raises(TypeError):
             _ = ConcreteDataset([0, 1]) + ConcreteSizedDataset([2, 3])
+
+    def test_get_many(self):
+        class RecordingDataset(ConcreteSizedDataset):
+            def __init__(self, array):
+                super(RecordingDataset, self).__init__(array)
+                self.requests = []
+
+            def get_many(self, indices):
+                self.requests.append(indices)
+                return super(RecordingDataset, self).get_many(indices)
+
+        dataset_1 = RecordingDataset([0, 1, 2])
+        dataset_2 = RecordingDataset([3, 4, 5])
+        result = ConcatDataset([dataset_1, [], dataset_2, [6, 7]])
+
+        assert result.get_many([4, 0, 7, -1, 2, 3, 5]) == [4, 0, 7, 7, 2, 3, 5]
+        assert result.get_many([]) == []
+        # Indices are fetched in a single batch per dataset
+        assert dataset_1.requests == [[0, 2]]
+        assert dataset_2.requests == [[1, 0, 2]]
+
+        with pytest.raises(IndexError):
+            _ = result.get_many([0, 8])
+
+        with pytest.raises(IndexError):
+            _ = result.get_many([-9])
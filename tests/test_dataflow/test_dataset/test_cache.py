@@ -0,0 +1,123 @@
+import pickle
+
+import pytest
+import numpy as np
+
+from plums.commons.data import Annotation, RecordCollection, ArrayRecordCollection, Record
+from plums.dataflow.utils.cache import MemoryCache, DatasetCache, NotInCacheError, _sizeof
+
+
+def test_dataset_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr('plums.dataflow.utils.cache.user_cache_dir', lambda appname: str(tmp_path))
+    cache = DatasetCache('prefix')
+    assert (tmp_path / 'prefix').is_dir()
+
+    with pytest.raises(NotInCacheError, match='prefix-{}'.format(DatasetCache.hash('a', 'b'))):
+        cache.retrieve('a', 'b')
+
+    data = {'snapshot': {'tile': {'/some/path': [[1, 2, 3], ['tile.jpg'], []]}}}
+    cache.cache(data, 'a', 'b')
+    assert cache.retrieve('a', 'b') == data
+    assert [path.name for path in (tmp_path / 'prefix').iterdir()] == ['{}.pkl'.format(DatasetCache.hash('a', 'b'))]
+
+    # Corrupted entries are treated as missing
+    (tmp_path / 'prefix' / '{}.pkl'.format(DatasetCache.hash('a', 'b'))).write_bytes(b'corrupted')
+    with pytest.raises(NotInCacheError):
+        cache.retrieve('a', 'b')
+
+
+def test_memory_cache():
+    cache = MemoryCache()
+    assert len(cache) == 0
+    assert cache.get('a') is None
+    assert cache.get('a', 5) == 5
+    assert cache.misses == 2
+
+    cache['a'] = 1
+    cache.put('b', 2)
+    assert len(cache) == 2
+    assert 'a' in cache
+    assert cache['a'] == 1
+    assert cache.get('b') == 2
+    assert cache.hits == 1
+    assert cache.evictions == 0
+
+    with pytest.raises(KeyError):
+        _ = cache['c']
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+    assert cache.hits == cache.misses == 0
+
+    with pytest.raises(ValueError, match='Invalid policy'):
+        MemoryCache(policy='fifo')
+
+
+def test_memory_cache_lru():
+    cache = MemoryCache(max_entries=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert 'b' not in cache
+    assert 'a' in cache and 'c' in cache
+    assert cache.evictions == 1
+
+    # Updating an entry does not evict
+    cache.put('c', 4)
+    assert len(cache) == 2
+    assert cache['c'] == 4
+    assert cache.evictions == 1
+
+
+def test_memory_cache_lfu():
+    cache = MemoryCache(max_entries=2, policy='lfu')
+    cache.put('a', 1)
+    cache.put('b', 2)
+    for _ in range(3):
+        cache.get('b')
+    cache.get('a')
+    cache.put('c', 3)
+    assert 'a' not in cache
+    assert 'b' in cache and 'c' in cache
+
+
+def test_memory_cache_size():
+    cache = MemoryCache(max_size=1000)
+    cache.put('a', np.zeros((400, ), dtype=np.uint8))
+    cache.put('b', np.zeros((400, ), dtype=np.uint8))
+    assert cache.size == 800
+    cache.put('c', np.zeros((400, ), dtype=np.uint8))
+    assert 'a' not in cache
+    assert cache.size == 800
+    assert cache.evictions == 1
+
+    # Too big to be cached
+    cache.put('d', np.zeros((2000, ), dtype=np.uint8))
+    assert 'd' not in cache
+    assert len(cache) == 2
+
+    cache = MemoryCache(max_size=10, sizeof=len)
+    cache.put('a', 'x' * 6)
+    cache.put('b', 'x' * 6)
+    assert len(cache) == 1
+    assert cache.size == 6
+
+    cache = pickle.loads(pickle.dumps(MemoryCache(max_size=1000)))
+    cache.put('a', {'some': np.zeros((10, ), dtype=np.uint8), 'other': np.zeros((10, ), dtype=np.uint8)})
+    assert cache.size == 20
+
+    # Values are not measured if the cache is not bounded in size
+    def sizeof(value):
+        raise AssertionError('Unexpected measure')
+
+    cache = MemoryCache(max_entries=1, sizeof=sizeof)
+    cache.put('a', np.zeros((10, ), dtype=np.uint8))
+    assert 'a' in cache
+    assert cache.size == 0
+
+    # Annotations are measured by their records footprint
+    records = ArrayRecordCollection.from_arrays(np.zeros((5, 2)), [0, 5], [0, 1], [0], [0, 1], ['car'])
+    assert _sizeof(Annotation(records)) == records.nbytes
+    assert _sizeof(Annotation(RecordCollection(Record([0, 0], ['car'])))) > 0
@@ -0,0 +1,129 @@
+import os
+import pickle
+
+import pytest
+
+from plums.commons.path import Path
+from plums.dataflow.utils.index import PathDatabase, GroupIndex
+
+
+def _path(path, **match):
+    path = Path(path)
+    path.match = match
+    return path
+
+
+def test_path_database():
+    items = [(('a', '0'), _path('/root/data/a/0/x.jpg', dataset='a', tile='0', image='x')),
+             (('b', '0'), _path('/root/data/b/0/x.jpg', dataset='b', tile='0', image='x')),
+             (('a', '0'), _path('/root/data/a/0/y.jpg', dataset='a', tile='0', image='y')),
+             (('a', '1'), _path('/root/other/a/1/x.jpg', dataset='a', tile='1', image='x'))]
+    database = PathDatabase(items)
+
+    assert len(database) == 3
+    assert list(database) == [('a', '0'), ('b', '0'), ('a', '1')]
+    assert ('a', '1') in database
+    assert ('b', '1') not in database
+    assert ('c', '0') not in database
+    assert ('a', ) not in database
+    assert database.count(('a', '0')) == 2
+    assert database.count(('c', '0')) == 0
+
+    # Paths are materialised in their insertion order with their matches
+    paths = database[('a', '0')]
+    assert paths == (Path('/root/data/a/0/x.jpg'), Path('/root/data/a/0/y.jpg'))
+    assert [path.match for path in paths] == [{'dataset': 'a', 'tile': '0', 'image': 'x'},
+                                              {'dataset': 'a', 'tile': '0', 'image': 'y'}]
+    assert database[('a', '1')] == (Path('/root/other/a/1/x.jpg'), )
+
+    with pytest.raises(KeyError):
+        _ = database[('c', '0')]
+
+    assert database == {group: tuple(path for key, path in items if key == group) for group, _ in items}
+    assert database.nbytes > 0
+
+    # Databases are picklable, e.g. to be sent to workers
+    unpickled = pickle.loads(pickle.dumps(database))
+    assert unpickled == database
+    assert [path.match for path in unpickled[('a', '0')]] == [path.match for path in paths]
+
+
+def test_path_database_key():
+    items = [(('a', ), _path('/root/a/2.jpg', rank='2')), (('b', ), _path('/root/b/1.jpg', rank='1')),
+             (('a', ), _path('/root/a/0.jpg', rank='0')), (('a', ), _path('/root/a/1.jpg', rank='1'))]
+    database = PathDatabase(items, key=lambda path: int(path.match['rank']))
+
+    # Paths are sorted in their group but groups keep their first insertion order
+    assert list(database) == [('a', ), ('b', )]
+    assert database[('a', )] == (Path('/root/a/0.jpg'), Path('/root/a/1.jpg'), Path('/root/a/2.jpg'))
+    assert [path.match['rank'] for path in database[('a', )]] == ['0', '1', '2']
+    assert database[('b', )] == (Path('/root/b/1.jpg'), )
+
+
+def test_path_database_degenerate():
+    database = PathDatabase([((), Path('data/labels.json'))])
+
+    assert len(database) == 1
+    assert () in database
+    assert database[()] == (Path('data/labels.json'), )
+    assert not hasattr(database[()][0], 'match')
+
+
+def test_path_database_empty():
+    database = PathDatabase()
+
+    assert len(database) == 0
+    assert list(database) == []
+    assert () not in database
+
+
+def test_path_database_share(tmp_path):
+    database = PathDatabase([(('a', '0'), _path('/root/a/0/x.jpg', tile='0', image=None)),
+                             (('b', '1'), _path('/root/b/1/x.jpg', tile='1', image='x'))])
+    shared = database.share(directory=tmp_path)
+    filename = shared._filename
+
+    assert not database.shared
+    assert shared.shared
+    assert shared == database
+    assert shared[('a', '0')][0].match == {'tile': '0', 'image': None}
+    assert shared.nbytes == database.nbytes
+
+    # Unpickling attaches to the shared file instead of copying the database content
+    state = pickle.dumps(shared)
+    assert len(state) < len(pickle.dumps(database))
+    unpickled = pickle.loads(state)
+    assert unpickled.shared
+    assert unpickled == database
+    assert [path.match for path in unpickled[('b', '1')]] == [{'tile': '1', 'image': 'x'}]
+
+    # The file is not removed by forked processes
+    if hasattr(os, 'fork'):
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            del shared
+            os._exit(0)
+        os.waitpid(pid, 0)
+        assert os.path.exists(filename)
+
+    # The file is removed along with the database which created it
+    del shared
+    assert not os.path.exists(filename)
+
+
+def test_group_index():
+    database = PathDatabase([(('a', '0'), Path('a/0.jpg')), (('b', '1'), Path('b/1.jpg')),
+                             (('c', '2'), Path('c/2.jpg'))])
+    index = GroupIndex(database, [2, 0])
+
+    assert len(index) == 2
+    assert index[0] == ('c', '2')
+    assert index[-1] == ('a', '0')
+    assert index[:1] == [('c', '2')]
+    assert list(index) == [('c', '2'), ('a', '0')]
+    assert index == [('c', '2'), ('a', '0')]
+    assert index != [('a', '0'), ('c', '2')]
+    assert set(index) == {('a', '0'), ('c', '2')}
+    assert pickle.loads(pickle.dumps(index)) == index
+    assert index.rows.tolist() == [2, 0]
+    assert not index.rows.flags.writeable
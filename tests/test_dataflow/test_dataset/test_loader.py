@@ -0,0 +1,154 @@
+import time
+from collections import OrderedDict
+
+import pytest
+import numpy as np
+
+from plums.commons.data import TileWrapper, TileCollection, DataPoint, Annotation, RecordCollection
+from plums.dataflow.dataset import SizedDataset, IterableDataset, DataLoader, collate
+
+
+class RangeDataset(SizedDataset):
+    def __init__(self, length, delays=None):
+        self.length = length
+        self.delays = delays or {}
+
+    def __getitem__(self, item):
+        if not 0 <= item < self.length:
+            raise IndexError('Dataset index is out of range')
+        time.sleep(self.delays.get(item, 0))
+        return item
+
+    def __len__(self):
+        return self.length
+
+
+class RangeStream(IterableDataset):
+    def __init__(self, length, fail=False):
+        self.length = length
+        self.fail = fail
+
+    def __iter__(self):
+        for item in range(self.length):
+            yield item
+        if self.fail:
+            raise RuntimeError('Stream failure')
+
+
+def _data_point(value):
+    tiles = TileCollection(('image', TileWrapper(np.full((12, 12, 3), value, dtype=np.uint8))),
+                           ('mask', TileWrapper(np.full((12, 12, 1), value, dtype=np.uint8))))
+    return DataPoint(tiles, Annotation(RecordCollection()))
+
+
+def test_collate():
+    tiles, annotations = collate([_data_point(0), _data_point(1)])
+
+    assert isinstance(tiles, OrderedDict)
+    assert tuple(tiles.keys()) == ('image', 'mask')
+    assert tiles['image'].shape == (2, 12, 12, 3)
+    assert tiles['mask'].shape == (2, 12, 12, 1)
+    np.testing.assert_array_equal(tiles['image'][1], np.ones((12, 12, 3)))
+    assert len(annotations) == 2
+    assert all(isinstance(annotation, Annotation) for annotation in annotations)
+
+    assert collate([np.zeros((4, 4)), np.ones((4, 4))]).shape == (2, 4, 4, 1)
+    assert collate([(1, 'a'), (2, 'b')]) == (pytest.approx(np.array([1, 2])), ['a', 'b'])
+    np.testing.assert_array_equal(collate([{'x': 1.0}, {'x': 2.0}])['x'], np.array([1.0, 2.0]))
+
+    with pytest.raises(ValueError):
+        collate([np.zeros((2, 2, 3)), np.zeros((3, 3, 3))])
+
+
+@pytest.mark.parametrize('workers, mode', [(0, 'thread'), (2, 'thread'), (2, 'process')])
+def test_loader(workers, mode):
+    loader = DataLoader(RangeDataset(10), batch_size=4, workers=workers, mode=mode)
+
+    assert len(loader) == 3
+    assert [batch.tolist() for batch in loader] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+    loader = DataLoader(RangeDataset(10), batch_size=4, drop_last=True, workers=workers, mode=mode)
+
+    assert len(loader) == 2
+    assert [batch.tolist() for batch in loader] == [[0, 1, 2, 3], [4, 5, 6, 7]]
+
+
+def test_loader_data_points():
+    class DataPointDataset(RangeDataset):
+        def __getitem__(self, item):
+            return _data_point(super(DataPointDataset, self).__getitem__(item))
+
+    loader = DataLoader(DataPointDataset(5), batch_size=2, workers=2)
+    batches = list(loader)
+
+    assert [batch[0]['image'].shape for batch in batches] == [(2, 12, 12, 3), (2, 12, 12, 3), (1, 12, 12, 3)]
+    np.testing.assert_array_equal(np.concatenate([batch[0]['image'][:, 0, 0, 0] for batch in batches]), np.arange(5))
+
+
+def test_loader_shuffle():
+    loader = DataLoader(RangeDataset(10), batch_size=3, shuffle=True, seed=0)
+    epochs = [np.concatenate(list(loader)).tolist() for _ in range(2)]
+
+    assert all(sorted(epoch) == list(range(10)) for epoch in epochs)
+    assert epochs[0] != epochs[1]
+    assert [np.concatenate(list(DataLoader(RangeDataset(10), batch_size=3, shuffle=True, seed=0))).tolist()
+            for _ in range(2)] == [epochs[0]] * 2
+
+
+def test_loader_unordered():
+    dataset = RangeDataset(4, delays={0: 0.5})
+
+    assert [batch.tolist() for batch in DataLoader(dataset, workers=2)] == [[0], [1], [2], [3]]
+
+    batches = [batch.tolist() for batch in DataLoader(dataset, workers=2, ordered=False)]
+    assert sorted(batches) == [[0], [1], [2], [3]]
+    assert batches[-1] == [0]
+
+
+def test_loader_prefetch():
+    loaded = []
+
+    def collate_fn(samples):
+        loaded.extend(samples)
+        return samples
+
+    iterator = iter(DataLoader(RangeDataset(20), workers=2, prefetch=2, collate_fn=collate_fn))
+    assert next(iterator) == [0]
+    time.sleep(0.1)
+    # At most prefetch batches per worker are loaded ahead of the consumer
+    assert 4 <= len(loaded) <= 5
+    iterator.close()
+
+
+def test_loader_iterable():
+    for workers in (0, 1):
+        loader = DataLoader(RangeStream(5), batch_size=2, workers=workers)
+        assert [batch.tolist() for batch in loader] == [[0, 1], [2, 3], [4]]
+
+        with pytest.raises(TypeError):
+            len(loader)
+
+        with pytest.raises(RuntimeError, match='Stream failure'):
+            list(DataLoader(RangeStream(5, fail=True), batch_size=2, workers=workers))
+
+    # Stopping early does not hang the background thread
+    iterator = iter(DataLoader(RangeStream(100), workers=1, prefetch=1))
+    assert next(iterator).tolist() == [0]
+    iterator.close()
+
+
+def test_loader_invalid():
+    with pytest.raises(ValueError):
+        DataLoader(RangeDataset(1), batch_size=0)
+
+    with pytest.raises(ValueError):
+        DataLoader(RangeDataset(1), prefetch=0)
+
+    with pytest.raises(ValueError):
+        DataLoader(RangeDataset(1), workers=-1)
+
+    with pytest.raises(ValueError):
+        DataLoader(RangeDataset(1), mode='fiber')
+
+    with pytest.raises(ValueError):
+        DataLoader(RangeStream(1), shuffle=True)
@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 from plums.commons.path import Path
@@ -161,3 +163,99 @@ def test_loose_recursive_walk(complex_tree):
     # Test unordered equality
     assert len(resolved) == len(ground_truth)
     assert all(path in ground_truth for path in resolved)
+
+
+def test_absolute_composed_strict_regex_recursive_walk(complex_tree):
+    root, path_list = complex_tree
+    resolver = PathResolver(str(root / 'data/images/{path/:[a-z]+_[0-9]+}/added/{tile}.jpg'))
+
+    ground_truth = [path for path in path_list if 'dataset_3' in path and 'added' in path]
+    resolved = list(resolver.find())
+
+    # Test unordered equality
+    assert len(resolved) == len(ground_truth)
+    assert all(path in ground_truth for path in resolved)
+
+
+def test_group_first_walk(complex_tree):
+    root, path_list = complex_tree
+    resolver = PathResolver('{data}/{images}/{dataset}/{tile}.jpg')
+
+    ground_truth = [path for path in path_list if 'dataset_3' in path and 'added' not in path]
+    resolved = list(resolver.find(root))
+
+    # Test unordered equality
+    assert len(resolved) == len(ground_truth)
+    assert all(path in ground_truth for path in resolved)
+
+
+def test_walk_order(complex_tree):
+    root, path_list = complex_tree
+
+    for pattern in ('data/images/{dataset}/{aoi}/{source}/{tile}.jpg', 'data/images/{path/}/{tile}.jpg',
+                    'data/{directory:.*}/{tile}.jpg'):
+        resolver = PathResolver(pattern)
+
+        # Matches are yielded in a top-down walk order, whatever the number of workers
+        walked = [Path(os.path.join(directory, file))
+                  for directory, _, files in os.walk(str(root), followlinks=True) for file in files
+                  if resolver._regex.fullmatch(os.path.relpath(os.path.join(directory, file), str(root)))]
+        assert walked
+        assert list(resolver.find(root, workers=1)) == walked
+        assert list(resolver.find(root, workers=4)) == walked
+
+
+def test_early_stop(complex_tree):
+    root, path_list = complex_tree
+    resolver = PathResolver('data/images/{path/}/{tile}.jpg')
+
+    generator = resolver.find(root)
+    first = next(generator)
+    generator.close()
+
+    assert first in path_list
+
+
+def test_snapshot_walk(tmp_path, monkeypatch):
+    for name in ('a', 'b', 'c'):
+        (tmp_path / 'data' / name).mkdir(parents=True)
+        (tmp_path / 'data' / name / 'tile.jpg').touch()
+
+    # Backdate directories so that snapshot entries are not considered racy
+    def backdate():
+        for directory, _, _ in os.walk(str(tmp_path)):
+            os.utime(directory, ns=(0, 0))
+
+    backdate()
+    resolver = PathResolver('data/{name}/{tile}.jpg')
+    snapshot = {}
+    first = list(resolver.find(tmp_path, snapshot=snapshot))
+    assert len(first) == 3
+    assert len(snapshot) == 4
+
+    listed = []
+    original = PathResolver._list
+
+    def _list(directory_path):
+        listed.append(directory_path)
+        return original(directory_path)
+
+    monkeypatch.setattr(PathResolver, '_list', staticmethod(_list))
+
+    # Unchanged directories are not listed again
+    assert list(resolver.find(tmp_path, snapshot=snapshot)) == first
+    assert not listed
+
+    # Modified directories are, and matches are updated accordingly
+    (tmp_path / 'data' / 'd').mkdir()
+    (tmp_path / 'data' / 'd' / 'tile.jpg').touch()
+    os.unlink(str(tmp_path / 'data' / 'a' / 'tile.jpg'))
+    backdate()
+    os.utime(str(tmp_path / 'data'), ns=(1, 1))
+    os.utime(str(tmp_path / 'data' / 'a'), ns=(1, 1))
+
+    second = list(resolver.find(tmp_path, snapshot=snapshot))
+    assert sorted(str(path) for path in second) == sorted(str(tmp_path / 'data' / name / 'tile.jpg')
+                                                          for name in ('b', 'c', 'd'))
+    assert all(path.match['tile'] == 'tile' for path in second)
+    assert sorted(os.path.basename(directory) for directory in listed) == ['a', 'd', 'data']
@@ -1,10 +1,14 @@
+import pickle
+import asyncio
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 import numpy as np
 
 from plums.commons.data import TileWrapper, Record, RecordCollection, DataPoint
-from plums.dataflow.dataset import PatternDataset
+from plums.dataflow.dataset import PatternDataset, IterablePatternDataset
+from plums.dataflow.utils.path import PathResolver
 
 
 def _dummy_tile_driver(paths, **matches):
@@ -183,9 +187,7 @@ class TestPairMatch:
                                 path=root, cache=True)
 
         assert dataset._tiles_database == cached._tiles_database
-        assert dataset._tiles_index == cached._tiles_index
         assert dataset._annotations_database == cached._annotations_database
-        assert dataset._annotations_index == cached._annotations_index
         assert dataset._matching_groups == cached._matching_groups
         assert dataset._group_index == cached._group_index
 
@@ -200,6 +202,50 @@ class TestPairMatch:
         assert set(dataset._group_index) == {('dataset_0', 'labeled', 'tile_00'),
                                              ('dataset_0', 'labeled', 'tile_01')}
 
+    def test_cache_update(self, tmp_path):
+        for dataset_id in ('dataset_0', 'dataset_1'):
+            for directory, extension in (('images', 'jpg'), ('labels', 'json')):
+                (tmp_path / 'data' / directory / dataset_id).mkdir(parents=True)
+                (tmp_path / 'data' / directory / dataset_id / 'tile_00.{}'.format(extension)).touch()
+
+        def _dataset():
+            return PatternDataset('data/images/{dataset}/{tile}.jpg', 'data/labels/{dataset}/{tile}.json',
+                                  _dummy_tile_driver, _dummy_annotation_driver, path=tmp_path, cache=True)
+
+        assert set(_dataset()._group_index) == {('dataset_0', 'tile_00'), ('dataset_1', 'tile_00')}
+
+        # Added and removed files are picked up on the next cached load
+        for directory, extension in (('images', 'jpg'), ('labels', 'json')):
+            (tmp_path / 'data' / directory / 'dataset_2').mkdir()
+            (tmp_path / 'data' / directory / 'dataset_2' / 'tile_00.{}'.format(extension)).touch()
+            (tmp_path / 'data' / directory / 'dataset_0' / 'tile_00.{}'.format(extension)).unlink()
+
+        dataset = _dataset()
+        assert set(dataset._group_index) == {('dataset_1', 'tile_00'), ('dataset_2', 'tile_00')}
+        assert set(dataset._tiles_database) == {('dataset_1', 'tile_00'), ('dataset_2', 'tile_00')}
+
+    def test_shared(self, strict_pattern_tree):
+        root, path_list = strict_pattern_tree
+        dataset = PatternDataset('data/images/{dataset}/{aoi}/{type}/{tile}.jpg',
+                                 'data/labels/{dataset}/{aoi}/{type}/{tile}.json',
+                                 _dummy_tile_driver, _dummy_annotation_driver,
+                                 path=root, sort_key=lambda x: x)
+        shared = PatternDataset('data/images/{dataset}/{aoi}/{type}/{tile}.jpg',
+                                'data/labels/{dataset}/{aoi}/{type}/{tile}.json',
+                                _dummy_tile_driver, _dummy_annotation_driver,
+                                path=root, sort_key=lambda x: x, shared=True)
+
+        assert shared._tiles_database.shared
+        assert shared._annotations_database.shared
+        assert shared._tiles_database == dataset._tiles_database
+        assert shared._annotations_database == dataset._annotations_database
+        assert shared._group_index == dataset._group_index
+
+        unpickled = pickle.loads(pickle.dumps(shared))
+        assert unpickled._tiles_database.shared
+        assert unpickled._group_index == dataset._group_index
+        assert unpickled[0].tiles.iloc[0].filename == dataset[0].tiles.iloc[0].filename
+
     def test_strict_recursive(self, strict_pattern_tree):
         root, path_list = strict_pattern_tree
         dataset = PatternDataset('data/images/{dataset}/{aoi/}/{tile}.jpg',
@@ -376,3 +422,140 @@ class TestDriver:
 
         with pytest.raises(TypeError):
             _ = dataset[0]
+
+
+class TestGetMany:
+    def test_get_many(self, strict_pattern_tree):
+        root, path_list = strict_pattern_tree
+        dataset = PatternDataset('data/images/{dataset}/{aoi}/{type}/{tile}.jpg',
+                                 'data/labels/{dataset}/{aoi}/{type}/{tile}.json',
+                                 _dummy_tile_driver, _dummy_annotation_driver, path=root,
+                                 sort_key=lambda group: tuple(reversed(group)))
+
+        indices = [5, 0, 3, -1, 0]
+        assert [_data_point_key(data_point) for data_point in dataset.get_many(indices)] \
+            == [_data_point_key(dataset[i]) for i in indices]
+        assert dataset.get_many([]) == []
+
+        with pytest.raises(IndexError):
+            _ = dataset.get_many([len(dataset)])
+
+
+class TestAsync:
+    def test_aget(self, strict_pattern_tree):
+        root, path_list = strict_pattern_tree
+        dataset = PatternDataset('data/images/{dataset}/{aoi}/{type}/{tile}.jpg',
+                                 'data/labels/{dataset}/{aoi}/{type}/{tile}.json',
+                                 _dummy_tile_driver, _dummy_annotation_driver, path=root)
+
+        data_point = asyncio.run(dataset.aget(3))
+        assert isinstance(data_point, DataPoint)
+        assert _data_point_key(data_point) == _data_point_key(dataset[3])
+
+    def test_aiter(self, strict_pattern_tree):
+        root, path_list = strict_pattern_tree
+        dataset = PatternDataset('data/images/{dataset}/{aoi}/{type}/{tile}.jpg',
+                                 'data/labels/{dataset}/{aoi}/{type}/{tile}.json',
+                                 _dummy_tile_driver, _dummy_annotation_driver, path=root)
+
+        async def collect(**kwargs):
+            return [_data_point_key(data_point) async for data_point in dataset.aiter(**kwargs)]
+
+        expected = [_data_point_key(dataset[i]) for i in range(len(dataset))]
+        assert asyncio.run(collect()) == expected
+        assert asyncio.run(collect(in_flight=1)) == expected
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            assert asyncio.run(collect(indices=[4, 0, 2], executor=executor)) == [expected[i] for i in (4, 0, 2)]
+
+        with pytest.raises(ValueError):
+            asyncio.run(collect(in_flight=0))
+
+
+def _data_point_key(data_point):
+    return (tuple(sorted(str(tile.filename) for tile in data_point.tiles.values())),
+            tuple(str(path) for path in data_point.annotation[0].paths))
+
+
+class TestIterable:
+    @pytest.mark.parametrize('tile_pattern, annotation_pattern, strict', [
+        ('data/images/{dataset}/{aoi}/{type}/{tile}.jpg', 'data/labels/{dataset}/{aoi}/{type}/{tile}.json', True),
+        ('data/images/{dataset}/{aoi/}/{tile}.jpg', 'data/labels/{dataset}/{aoi/}/{tile}.json', True),
+        ('data/images/{dataset}/{type}/{prior}/{tile}.jpg', 'data/labels/{dataset}/{type}/{tile}.json', False),
+        ('data/images/{dataset}/{type}/{prior}/{tile}.jpg', 'data/images.json', True),
+    ])
+    def test_equivalence(self, strict_pattern_tree, loose_pattern_tree, tile_pattern, annotation_pattern, strict):
+        for root, _ in (strict_pattern_tree, loose_pattern_tree):
+            try:
+                dataset = PatternDataset(tile_pattern, annotation_pattern, _dummy_tile_driver,
+                                         _dummy_annotation_driver, path=root, strict=strict)
+            except ValueError:
+                continue
+            iterable = IterablePatternDataset(tile_pattern, annotation_pattern, _dummy_tile_driver,
+                                              _dummy_annotation_driver, path=root, strict=strict)
+
+            expected = sorted(_data_point_key(dataset[i]) for i in range(len(dataset)))
+            assert sorted(_data_point_key(data_point) for data_point in iterable) == expected
+
+            # Shards are disjoint and cover the whole dataset
+            shards = [IterablePatternDataset(tile_pattern, annotation_pattern, _dummy_tile_driver,
+                                             _dummy_annotation_driver, path=root, strict=strict,
+                                             shard=shard, num_shards=3) for shard in range(3)]
+            assert sorted(_data_point_key(data_point) for shard in shards for data_point in shard) == expected
+
+    def test_strict(self, loose_pattern_tree):
+        root, path_list = loose_pattern_tree
+        dataset = IterablePatternDataset('data/images/{dataset}/{aoi}/{type}/{tile}.jpg',
+                                         'data/labels/{dataset}/{aoi}/{type}/{tile}.json',
+                                         _dummy_tile_driver, _dummy_annotation_driver, path=root)
+        with pytest.raises(ValueError, match='does not have a matching annotation'):
+            _ = list(dataset)
+
+    def test_lookahead(self, strict_pattern_tree):
+        root, path_list = strict_pattern_tree
+        dataset = IterablePatternDataset('data/images/{dataset}/{aoi}/{type}/{tile}.jpg',
+                                         'data/labels/{dataset}/{aoi}/{type}/{tile}.json',
+                                         _dummy_tile_driver, _dummy_annotation_driver, path=root, lookahead=1)
+        assert len(list(dataset)) == 8
+
+        with pytest.raises(ValueError, match='Invalid look-ahead'):
+            _ = IterablePatternDataset('data/images/{dataset}/{aoi}/{type}/{tile}.jpg',
+                                       'data/labels/{dataset}/{aoi}/{type}/{tile}.json',
+                                       _dummy_tile_driver, _dummy_annotation_driver, path=root, lookahead=0)
+
+        with pytest.raises(ValueError, match='Invalid shard'):
+            _ = IterablePatternDataset('data/images/{dataset}/{aoi}/{type}/{tile}.jpg',
+                                       'data/labels/{dataset}/{aoi}/{type}/{tile}.json',
+                                       _dummy_tile_driver, _dummy_annotation_driver, path=root, shard=2, num_shards=2)
+
+    def test_streaming(self, strict_pattern_tree, monkeypatch):
+        root, path_list = strict_pattern_tree
+        dataset = IterablePatternDataset('data/images/{dataset}/{aoi}/{type}/{tile}.jpg',
+                                         'data/labels/{dataset}/{aoi}/{type}/{tile}.json',
+                                         _dummy_tile_driver, _dummy_annotation_driver, path=root)
+
+        # Instrument the file-system walks
+        walks = []
+        find = PathResolver.find
+
+        def instrumented_find(resolver, *args, **kwargs):
+            walk = {'paths': 0, 'done': False}
+            walks.append(walk)
+            for path in find(resolver, *args, **kwargs):
+                walk['paths'] += 1
+                yield path
+            walk['done'] = True
+
+        monkeypatch.setattr(PathResolver, 'find', instrumented_find)
+
+        # The first data-point is yielded before the walks are over
+        iterator = iter(dataset)
+        first = next(iterator)
+        assert isinstance(first, DataPoint)
+        assert len(walks) == 2
+        assert not any(walk['done'] for walk in walks)
+        walked = sum(walk['paths'] for walk in walks)
+
+        # The remaining data-points are yielded as the walks go on
+        assert len(list(iterator)) == 7
+        assert all(walk['done'] for walk in walks)
+        assert walked < sum(walk['paths'] for walk in walks)
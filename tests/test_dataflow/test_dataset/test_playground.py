@@ -1,10 +1,13 @@
+import asyncio
+
 import pytest
 import numpy as np
 
 from plums.commons.path import Path
-from plums.commons.data import Taxonomy, Label, TileCollection
-from plums.dataflow.io import dump, RGB, BGR, Tile
+from plums.commons.data import Taxonomy, Label, TileCollection, ArrayRecordCollection
+from plums.dataflow.io import dump, RGB, BGR, Tile, TileCache
 from plums.dataflow.io.tile._backend import Image
+from plums.dataflow.utils.cache import MemoryCache
 from plums.dataflow.dataset.playground import PlaygroundDataset, TaxonomyReader, TileDriver, AnnotationDriver
 
 
@@ -94,8 +97,80 @@ def test_annotation_driver(tmp_path, json_feature_collection):  # noqa: R701
     # +--> Reopen
     assert driver((annotation_path, ), group='value') is annotation
 
+    # +-> Bounded cache
+    cache = MemoryCache(max_entries=1)
+    driver = AnnotationDriver(cache=cache)
+    annotation = driver((annotation_path, ), group='value')
+    assert driver((annotation_path, ), group='value') is annotation
+    assert cache.hits == 1
+    assert cache.misses == 1
+    other_path = tmp_path / 'other.json'
+    other_path.write_text(json_feature_collection)
+    _ = driver((other_path, ), group='value')
+    assert (annotation_path, ) not in cache
+    assert cache.evictions == 1
 
-def test_tile_driver(reference_image):  # noqa: R701
+
+def test_annotation_driver_columnar(tmp_path, json_feature_collection):
+    annotation_path = tmp_path / 'annotation.json'
+    annotation_path.write_text(json_feature_collection)
+
+    # +-> Records are parsed in arrays and constructed lazily, identically to the per-record parser
+    annotation = AnnotationDriver()((annotation_path, ), group='value')
+    reference = AnnotationDriver(columnar=False)((annotation_path, ), group='value')
+    assert isinstance(annotation.record_collection, ArrayRecordCollection)
+    assert not isinstance(reference.record_collection, ArrayRecordCollection)
+    assert annotation.record_collection._records == [None]
+    assert annotation.record_collection.to_geojson() == reference.record_collection.to_geojson()
+    assert annotation.mask_collection['zone_footprint'].coordinates \
+        == reference.mask_collection['zone_footprint'].coordinates
+
+    # +-> Taxonomy
+    with pytest.raises(ValueError, match='are not part of the taxonomy'):
+        AnnotationDriver(taxonomy=Taxonomy(Label('tag'), Label('other')))((annotation_path, ), group='value')
+    taxonomy = Taxonomy(Label('tag'), Label('class'))
+    annotation = AnnotationDriver(taxonomy=taxonomy)((annotation_path, ), group='value')
+    assert annotation.record_collection.taxonomy is taxonomy
+    assert annotation.record_collection[0].taxonomy is taxonomy
+
+    # +-> Integer coordinates and confidences are kept as integers if they all are
+    features = [{'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [0, 1]},
+                 'properties': {'tags': ['a'], 'confidence': 64}},
+                {'type': 'Feature', 'geometry': {'type': 'Polygon', 'coordinates': [[[0, 0], [0, 1], [1, 1], [0, 0]]]},
+                 'properties': {'tags': ['b'], 'confidence': 1}}]
+    dump({'type': 'FeatureCollection', 'features': features}, annotation_path)
+    record_collection = AnnotationDriver()((annotation_path, ), group='value').record_collection
+    assert record_collection.vertices.dtype == np.int64
+    assert record_collection.confidences.dtype == np.int64
+    assert record_collection[0].coordinates == [0, 1] and isinstance(record_collection[0].coordinates[0], int)
+    assert record_collection[0].confidence == 64 and isinstance(record_collection[0].confidence, int)
+    assert record_collection.to_geojson() \
+        == AnnotationDriver(columnar=False)((annotation_path, ), group='value').record_collection.to_geojson()
+
+    # +-> Otherwise, they are stored as floats for all records
+    features[1]['geometry']['coordinates'][0][1] = [0.5, 1]
+    features[1]['properties']['confidence'] = 0.5
+    dump({'type': 'FeatureCollection', 'features': features}, annotation_path)
+    record_collection = AnnotationDriver()((annotation_path, ), group='value').record_collection
+    assert record_collection.vertices.dtype == np.float64
+    assert record_collection.confidences.dtype == np.float64
+    assert record_collection[0].coordinates == [0.0, 1.0] and isinstance(record_collection[0].coordinates[0], float)
+    assert record_collection[0].confidence == 64.0 and isinstance(record_collection[0].confidence, float)
+
+    # +-> Coordinates of different dimensions fall back to the per-record parser
+    dump({'type': 'FeatureCollection',
+          'features': [{'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [0, 1]},
+                        'properties': {'tags': ['a'], 'record_id': 'first'}},
+                       {'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [0, 1, 2]},
+                        'properties': {'tags': ['b'], 'confidence': 0.5}}]}, annotation_path)
+    annotation = AnnotationDriver()((annotation_path, ), group='value')
+    assert not isinstance(annotation.record_collection, ArrayRecordCollection)
+    assert [record.coordinates for record in annotation.record_collection] == [[0, 1], [0, 1, 2]]
+    assert annotation.record_collection[0].id == 'first'
+    assert annotation.record_collection[1].confidence == 0.5
+
+
+def test_tile_driver(reference_image, tmp_path):  # noqa: R701
     # +-> Base
     driver = TileDriver(fetch_ordering=False)
     tiles = driver((Path(__file__)[:-1] / '..' / 'test_io' / 'test_tile' / '_data' / 'test_jpg.jpg',
@@ -174,6 +249,53 @@ def test_tile_driver(reference_image):  # noqa: R701
     assert all(tile.dtype == np.float64 for tile in tiles.values())
     assert all(np.array_equal(reference_image, tile.astype(ptype=RGB, dtype=np.uint8)) for tile in tiles.values())
 
+    # +-> Workers
+    driver = TileDriver(*names, fetch_ordering=False, workers=3)
+    tiles = driver((Path(__file__)[:-1] / '..' / 'test_io' / 'test_tile' / '_data' / 'test_jpg.jpg',
+                    Path(__file__)[:-1] / '..' / 'test_io' / 'test_tile' / '_data' / 'test_png.png',
+                    Path(__file__)[:-1] / '..' / 'test_io' / 'test_tile' / '_data' / 'test_jpg.jpg'), group='value')
+    assert isinstance(tiles, TileCollection)
+    assert len(tiles) == 3
+    assert all(name == names[i] for i, name in enumerate(tiles.keys()))
+    assert tiles['tile'].filename[-1] == 'test_png.png'
+    assert np.array_equal(reference_image, tiles['some'])
+    assert np.array_equal(reference_image, tiles['set'])
+
+    # +-> Scale
+    driver = TileDriver(fetch_ordering=False, scale=(1, 4), fast_dct=True)
+    tiles = driver((Path(__file__)[:-1] / '..' / 'test_io' / 'test_tile' / '_data' / 'test_jpg.jpg',
+                    Path(__file__)[:-1] / '..' / 'test_io' / 'test_tile' / '_data' / 'test_png.png'), group='value')
+    assert len(tiles) == 2
+    assert all(tile.size == (128, 128) for tile in tiles.values())
+
+    # +-> Cache
+    cache = TileCache(tmp_path)
+    driver = TileDriver(*names, ptype=BGR, fetch_ordering=False, cache=cache)
+    for _ in range(2):
+        tiles = driver((Path(__file__)[:-1] / '..' / 'test_io' / 'test_tile' / '_data' / 'test_jpg.jpg',
+                        Path(__file__)[:-1] / '..' / 'test_io' / 'test_tile' / '_data' / 'test_png.png',
+                        Path(__file__)[:-1] / '..' / 'test_io' / 'test_tile' / '_data' / 'test_jpg.jpg'),
+                       group='value')
+        assert len(tiles) == 3
+        assert all(isinstance(tile.data, np.memmap) for tile in tiles.values())
+        assert all(tile.ptype == BGR for tile in tiles.values())
+        assert np.array_equal(reference_image, tiles['some'].astype(ptype=RGB))
+        assert len(list(tmp_path.glob('*.npy'))) == 2
+
+    # +-> Memory cache
+    cache = MemoryCache(max_entries=1, max_size=10 ** 8)
+    driver = TileDriver(*names, fetch_ordering=False, memcache=cache)
+    paths = (Path(__file__)[:-1] / '..' / 'test_io' / 'test_tile' / '_data' / 'test_jpg.jpg',
+             Path(__file__)[:-1] / '..' / 'test_io' / 'test_tile' / '_data' / 'test_png.png',
+             Path(__file__)[:-1] / '..' / 'test_io' / 'test_tile' / '_data' / 'test_jpg.jpg')
+    tiles = driver(paths, group='value')
+    assert driver(paths, group='value') is tiles
+    assert TileDriver(*names, ptype=BGR, fetch_ordering=False, memcache=cache)(paths, group='value') is not tiles
+    assert cache.hits == 1
+    assert cache.misses == 2
+    assert cache.evictions == 1
+    assert cache.size == 3 * 512 * 512 * 3
+
 
 def test_base(playground_tree, reference_image):
     root, paths = playground_tree
@@ -209,6 +331,14 @@ def test_base(playground_tree, reference_image):
                                                                           "5562b632-72c3-4c21-b24e-e0536d8b20c8")
     assert tuple(tile.image_id for tile in dataset[4].tiles.values()) == ("f9525e3bfbd081cd545261b3b5414eb88f689005",
                                                                           "75ad128196254e711ef7c9b129d1c59153098b18")
+    # +-> Tiles are ordered once and for all when indexed
+    assert dataset._tile_driver.presorted
+    tile_driver = TileDriver()
+    assert PlaygroundDataset(root, use_taxonomy=False, tile_driver=tile_driver)._tile_driver.presorted
+    assert not tile_driver.presorted
+    assert tuple(path[-2] for path in dataset._tiles_database[dataset._group_index[4]]) \
+        == ("f9525e3bfbd081cd545261b3b5414eb88f689005", "75ad128196254e711ef7c9b129d1c59153098b18")
+    assert asyncio.run(dataset.aget(4)).tile_id == '7c47df1097b349278c052e93e1d1903a'
 
     assert len(dataset[0].annotation.record_collection) == 1
     assert dataset[0].annotation.record_collection[0].labels == ('tag', 'class')
@@ -428,6 +558,7 @@ def test_fetch_ordering_missing_image(playground_tree_summary_missing_image):
     root, paths = playground_tree_summary_missing_image
 
     dataset = PlaygroundDataset(root, use_taxonomy=False)
+    assert not dataset._tile_driver.presorted
     with pytest.raises(ValueError, match='Invalid dataset: Some images seem to be missing from the summaries'):
         _ = dataset[5]
 
@@ -0,0 +1,113 @@
+import gc
+import os
+import pickle
+
+import pytest
+import numpy as np
+
+from plums.commons.data import TileCollection, DataPoint, Annotation, RecordCollection
+from plums.dataflow.io import BGR, Tile
+from plums.dataflow.io.tile._backend import Image
+from plums.dataflow.dataset import PlaygroundDataset, ShardedDataset
+
+
+def test_pack(playground_tree, tmp_path):
+    root, paths = playground_tree
+    dataset = PlaygroundDataset(root, use_taxonomy=False)
+    sharded = ShardedDataset.pack(dataset, tmp_path / 'packed', shard_size=1)
+
+    assert len(sharded) == len(dataset)
+    assert len(list((tmp_path / 'packed').glob('shard_*.bin'))) == len(dataset)
+
+    for reference, data_point in zip((dataset[i] for i in range(len(dataset))), sharded):
+        assert data_point.dataset_id == reference.dataset_id
+        assert data_point.zone_id == reference.zone_id
+        assert data_point.tile_id == reference.tile_id
+
+        assert isinstance(data_point.tiles, TileCollection)
+        assert tuple(data_point.tiles.keys()) == tuple(reference.tiles.keys())
+        for name, tile in data_point.tiles.items():
+            assert tile.filename == reference.tiles[name].filename
+            assert tile.properties == reference.tiles[name].properties
+            np.testing.assert_array_equal(tile.data, reference.tiles[name].data)
+
+        assert data_point.annotation.filename == reference.annotation.filename
+        assert [record.labels for record in data_point.annotation.record_collection] \
+            == [record.labels for record in reference.annotation.record_collection]
+
+    # Identifiers are stored in the shards
+    assert sharded[0].id == sharded[0].id
+    assert sharded[-1].id == sharded[len(sharded) - 1].id
+    with pytest.raises(IndexError):
+        _ = sharded[len(sharded)]
+
+
+def test_pack_without_decoding(playground_tree, tmp_path, monkeypatch):
+    root, paths = playground_tree
+    dataset = PlaygroundDataset(root, use_taxonomy=False)
+
+    def fail(*args, **kwargs):
+        raise AssertionError('Tiles must not be decoded while packing.')
+
+    with monkeypatch.context() as patch:
+        patch.setattr(Image, 'load', fail)
+        patch.setattr(Image, 'load_many', fail)
+        sharded = ShardedDataset.pack(dataset, tmp_path / 'packed')
+
+    np.testing.assert_array_equal(sharded[0].tiles.iloc[0].data, dataset[0].tiles.iloc[0].data)
+
+
+def test_descriptors(playground_tree, tmp_path):
+    root, paths = playground_tree
+    sharded = ShardedDataset.pack(PlaygroundDataset(root, use_taxonomy=False), tmp_path, shard_size=1)
+
+    _ = sharded[0], sharded[1]
+    descriptors = list(sharded._descriptors.values())
+    assert len(descriptors) == 2
+
+    # Shard files are closed and reopened on demand
+    sharded.close()
+    assert not sharded._descriptors
+    for descriptor in descriptors:
+        with pytest.raises(OSError):
+            os.fstat(descriptor)
+    _ = sharded[0]
+    descriptors = list(sharded._descriptors.values())
+
+    # Shard files are closed along with the dataset
+    del sharded
+    gc.collect()
+    for descriptor in descriptors:
+        with pytest.raises(OSError):
+            os.fstat(descriptor)
+
+
+def test_single_shard(playground_tree, tmp_path):
+    root, paths = playground_tree
+    dataset = PlaygroundDataset(root, use_taxonomy=False)
+    ShardedDataset.pack(dataset, tmp_path)
+
+    assert len(list(tmp_path.glob('shard_*.bin'))) == 1
+
+    sharded = ShardedDataset(tmp_path, ptype=BGR, dtype=np.float32, scale=(1, 2))
+    tile = sharded[0].tiles.iloc[0]
+    assert tile.ptype == BGR
+    assert tile.dtype == np.float32
+    assert tile.size == (256, 256)
+
+    # Pickling drops file descriptors
+    sharded = pickle.loads(pickle.dumps(sharded))
+    assert sharded[0].tiles.iloc[0].size == (256, 256)
+    identifier = sharded[1].id
+    sharded.close()
+    assert sharded[1].id == identifier
+
+
+def test_invalid(tmp_path):
+    with pytest.raises(FileNotFoundError, match='Invalid dataset'):
+        ShardedDataset(tmp_path)
+
+    data_point = DataPoint(TileCollection(Tile(None, __array__=np.zeros((2, 2, 3), dtype=np.uint8))),
+                           Annotation(RecordCollection()))
+    with pytest.raises(ValueError, match='Invalid tile'):
+        ShardedDataset.pack([data_point], tmp_path / 'packed')
@@ -49,6 +49,11 @@ def disable_import(*modules):
         yield [context]
 
 
+def read(path):
+    with open(str(path), 'rb') as f:
+        return f.read()
+
+
 def psnr(reference_image, test_image):
     """Compute the :math:`PSNR` between two image stored as uint8 HWC :class:`numpy.ndarray`.
 
@@ -174,8 +179,8 @@ class TestLoad:
     def test_jpeg_ext(self, disabled_backend):
         with disable_import(*disabled_backend):
             from plums.dataflow.io.tile._backend import _load_jpg
-            array = _load_jpg(Path(__file__)[:-1] / '_data/test_jpg.jpg')
-            array_noext = _load_jpg(Path(__file__)[:-1] / '_data/test_jpg')
+            array = _load_jpg(read(Path(__file__)[:-1] / '_data/test_jpg.jpg'))
+            array_noext = _load_jpg(read(Path(__file__)[:-1] / '_data/test_jpg'))
 
             assert np.array_equal(array, array_noext)
 
@@ -186,10 +191,10 @@ class TestLoad:
             plums.dataflow.io.tile._backend._HAS_PILLOW = False
 
             with pytest.raises(RuntimeError, match='No backend available to open JPG image.'):
-                plums.dataflow.io.tile._backend._load_jpg(Path(__file__)[:-1] / '_data/test_jpg.jpg')
+                plums.dataflow.io.tile._backend._load_jpg(read(Path(__file__)[:-1] / '_data/test_jpg.jpg'))
 
             with pytest.raises(RuntimeError, match='No backend available to open JPG image.'):
-                plums.dataflow.io.tile._backend._load_jpg(Path(__file__)[:-1] / '_data/test_jpg')
+                plums.dataflow.io.tile._backend._load_jpg(read(Path(__file__)[:-1] / '_data/test_jpg'))
 
     @pytest.mark.parametrize('disabled_backend', (('none', ), ('plums.dataflow.io.tile._vendor.turbojpeg', ),
                                                   ('plums.dataflow.io.tile._vendor.turbojpeg', 'lycon'),
@@ -205,8 +210,8 @@ class TestLoad:
     def test_png_ext(self, disabled_backend):
         with disable_import(*disabled_backend):
             from plums.dataflow.io.tile._backend import _load_png
-            array = _load_png(Path(__file__)[:-1] / '_data/test_png.png')
-            array_noext = _load_png(Path(__file__)[:-1] / '_data/test_png')
+            array = _load_png(read(Path(__file__)[:-1] / '_data/test_png.png'))
+            array_noext = _load_png(read(Path(__file__)[:-1] / '_data/test_png'))
 
             assert np.array_equal(array, array_noext)
 
@@ -214,10 +219,10 @@ class TestLoad:
         with disable_import('lycon', 'cv2', 'PIL'):
             import plums.dataflow.io.tile._backend
             with pytest.raises(RuntimeError, match='No backend available to open PNG image.'):
-                plums.dataflow.io.tile._backend._load_png(Path(__file__)[:-1] / '_data/test_png.png')
+                plums.dataflow.io.tile._backend._load_png(read(Path(__file__)[:-1] / '_data/test_png.png'))
 
             with pytest.raises(RuntimeError, match='No backend available to open PNG image.'):
-                plums.dataflow.io.tile._backend._load_png(Path(__file__)[:-1] / '_data/test_png')
+                plums.dataflow.io.tile._backend._load_png(read(Path(__file__)[:-1] / '_data/test_png'))
 
     @pytest.mark.parametrize('disabled_backend', (('none', ), ('plums.dataflow.io.tile._vendor.turbojpeg', ),
                                                   ('plums.dataflow.io.tile._vendor.turbojpeg', 'lycon'),
@@ -233,16 +238,60 @@ class TestLoad:
     def test_png_jpg(self, disabled_backend):
         with disable_import(*disabled_backend):
             from plums.dataflow.io.tile._backend import _load_png, _load_jpg
-            array_png = _load_png(Path(__file__)[:-1] / '_data/test_png.png').astype(np.float64)
-            array_noext_png = _load_png(Path(__file__)[:-1] / '_data/test_png').astype(np.float64)
-            array_jpg = _load_jpg(Path(__file__)[:-1] / '_data/test_jpg.jpg').astype(np.float64)
-            array_noext_jpg = _load_jpg(Path(__file__)[:-1] / '_data/test_jpg').astype(np.float64)
+            array_png = _load_png(read(Path(__file__)[:-1] / '_data/test_png.png')).astype(np.float64)
+            array_noext_png = _load_png(read(Path(__file__)[:-1] / '_data/test_png')).astype(np.float64)
+            array_jpg = _load_jpg(read(Path(__file__)[:-1] / '_data/test_jpg.jpg')).astype(np.float64)
+            array_noext_jpg = _load_jpg(read(Path(__file__)[:-1] / '_data/test_jpg')).astype(np.float64)
 
             assert psnr(array_jpg, array_png) > 35
             assert psnr(array_jpg, array_noext_png) > 35
             assert psnr(array_noext_jpg, array_png) > 35
             assert psnr(array_noext_jpg, array_noext_png) > 35
 
+    @pytest.mark.parametrize('disabled_backend', (('none', ), ('plums.dataflow.io.tile._vendor.turbojpeg', ),
+                                                  ('plums.dataflow.io.tile._vendor.turbojpeg', 'lycon'),
+                                                  ('plums.dataflow.io.tile._vendor.turbojpeg', 'lycon',
+                                                   'cv2'),
+                                                  ('lycon', 'cv2'),
+                                                  ('plums.dataflow.io.tile._vendor.turbojpeg', 'cv2'),
+                                                  ('plums.dataflow.io.tile._vendor.turbojpeg', 'lycon',
+                                                   'PIL'),
+                                                  ('plums.dataflow.io.tile._vendor.turbojpeg', 'PIL'),
+                                                  ('lycon', 'PIL'),
+                                                  ('cv2', 'PIL')), ids=lambda backends: ', '.join(backends))
+    @pytest.mark.parametrize('scale, size', (((1, 2), 256), ((1, 4), 128), ((1, 8), 64), ((3, 4), 384)))
+    def test_scale(self, disabled_backend, scale, size):
+        with disable_import(*disabled_backend):
+            from plums.dataflow.io.tile._backend import _load_png, _load_jpg
+            array_png = _load_png(read(Path(__file__)[:-1] / '_data/test_png.png'), scale=scale).astype(np.float64)
+            array_jpg = _load_jpg(read(Path(__file__)[:-1] / '_data/test_jpg.jpg'), scale=scale).astype(np.float64)
+
+            assert array_png.shape == array_jpg.shape == (size, size, 3)
+            assert psnr(array_jpg, array_png) > 30
+
+            with pytest.raises(ValueError, match='Invalid scale'):
+                _load_jpg(read(Path(__file__)[:-1] / '_data/test_jpg.jpg'), scale=(1, -2))
+
+    def test_lycon_order(self):
+        from plums.dataflow.io.tile import _backend
+        reference = {'jpg': _backend._load_jpg(read(Path(__file__)[:-1] / '_data/test_jpg.jpg')),
+                     'png': _backend._load_png(read(Path(__file__)[:-1] / '_data/test_png.png'))}
+        lycon = mock.Mock()
+        lycon.load.side_effect = lambda filepath: reference[filepath[-3:]].copy()
+
+        with mock.patch.object(_backend, '_HAS_TURBO_JPEG', False), mock.patch.object(_backend, '_HAS_LYCON', True), \
+                mock.patch.object(_backend, 'lycon', lycon, create=True):
+            # lycon is used ahead of OpenCV and Pillow when the image was read from disk
+            for name in ('jpg', 'png'):
+                path = Path(__file__)[:-1] / '_data' / ('test_' + name + '.' + name)
+                np.testing.assert_array_equal(_backend.Image.load(path), reference[name])
+                lycon.load.assert_called_once_with(str(path))
+                lycon.load.reset_mock()
+
+            # It is skipped when decoding from memory
+            _backend.Image.decode(read(Path(__file__)[:-1] / '_data/test_png.png'))
+            lycon.load.assert_not_called()
+
 
 class TestDump:
     @pytest.fixture(autouse=True)
@@ -288,9 +337,9 @@ class TestDump:
         image_path = tmp_path / 'test.jpg'
         with disable_import(*disabled_backend):
             from plums.dataflow.io.tile._backend import _dump_jpg, _load_jpg
-            loaded = _load_jpg(jpeg_image)
+            loaded = _load_jpg(read(jpeg_image))
             _dump_jpg(image_path, loaded)
-            reloaded = _load_jpg(image_path)
+            reloaded = _load_jpg(read(image_path))
             assert psnr(loaded.astype(np.float64), reloaded.astype(np.float64)) > 31
 
     @pytest.mark.parametrize('disabled_backend', (('none',), ('plums.dataflow.io.tile._vendor.turbojpeg',),
@@ -308,9 +357,9 @@ class TestDump:
         image_path = tmp_path / 'test.png'
         with disable_import(*disabled_backend):
             from plums.dataflow.io.tile._backend import _dump_png, _load_png
-            loaded = _load_png(jpeg_image)
+            loaded = _load_png(read(jpeg_image))
             _dump_png(image_path, loaded)
-            reloaded = _load_png(image_path)
+            reloaded = _load_png(read(image_path))
             assert psnr(loaded.astype(np.float64), reloaded.astype(np.float64)) > 35
 
 
@@ -357,7 +406,68 @@ class TestImage:
         with disable_import(*disabled_backend):
             from plums.dataflow.io.tile._backend import Image, _load_jpg, _load_png
             load = _load_png if 'png' in str(image) else _load_jpg
-            assert np.array_equal(Image.load(image)._array_data, load(image))
+            assert np.array_equal(Image.load(image)._array_data, load(read(image)))
+            assert np.array_equal(Image.decode(read(image))._array_data, load(read(image)))
+
+    @pytest.mark.parametrize('disabled_backend', (('none',), ('plums.dataflow.io.tile._vendor.turbojpeg',),
+                                                  ('plums.dataflow.io.tile._vendor.turbojpeg', 'lycon'),
+                                                  ('plums.dataflow.io.tile._vendor.turbojpeg', 'lycon',
+                                                   'cv2'),
+                                                  ('lycon', 'cv2'),
+                                                  ('plums.dataflow.io.tile._vendor.turbojpeg', 'cv2'),
+                                                  ('plums.dataflow.io.tile._vendor.turbojpeg', 'lycon',
+                                                   'PIL'),
+                                                  ('plums.dataflow.io.tile._vendor.turbojpeg', 'PIL'),
+                                                  ('lycon', 'PIL'),
+                                                  ('cv2', 'PIL')), ids=lambda backends: ', '.join(backends))
+    @pytest.mark.parametrize('workers', (None, 1, 2))
+    def test_load_many(self, disabled_backend, workers):
+        images = (Path(__file__)[:-1] / '_data/test_jpg.jpg', Path(__file__)[:-1] / '_data/test_png',
+                  Path(__file__)[:-1] / '_data/test_png.png', Path(__file__)[:-1] / '_data/test_jpg')
+        with disable_import(*disabled_backend):
+            from plums.dataflow.io.tile._backend import Image
+            loaded = Image.load_many(images, workers=workers)
+            assert len(loaded) == len(images)
+            for image, path in zip(loaded, images):
+                assert isinstance(image, Image)
+                assert np.array_equal(image._array_data, Image.load(path)._array_data)
+
+            assert Image.load_many((), workers=workers) == ()
+
+            with pytest.raises(ValueError, match='Invalid number of workers'):
+                Image.load_many(images, workers=0)
+
+    def test_sniff(self, tmp_path):
+        from plums.dataflow.io.tile._backend import Image, _sniff
+        assert _sniff(read(Path(__file__)[:-1] / '_data/test_jpg')) == 'jpeg'
+        assert _sniff(read(Path(__file__)[:-1] / '_data/test_png')) == 'png'
+        assert _sniff(b'GIF89a') is None
+        assert _sniff(b'') is None
+
+        (tmp_path / 'test.jpg').write_bytes(b'GIF89a')
+        with pytest.raises(TypeError, match='Unsupported image type'):
+            Image.load(tmp_path / 'test.jpg')
+
+    @pytest.mark.parametrize('filename, format', (('test_jpg.jpg', 'jpeg'), ('test_jpg', 'jpeg'),
+                                                  ('test_png.png', 'png'), ('test_png', 'png')))
+    def test_probe(self, filename, format):
+        from plums.dataflow.io.tile._backend import Image, ImageInfo
+        info = Image.probe(Path(__file__)[:-1] / '_data' / filename)
+        assert isinstance(info, ImageInfo)
+        assert info == (format, 512, 512, 3)
+
+    def test_probe_invalid(self, tmp_path):
+        from plums.dataflow.io.tile._backend import Image
+        buffer = read(Path(__file__)[:-1] / '_data/test_jpg')
+        # Truncate the file in the middle of the first segment header and of the frame header
+        for end in (5, buffer.index(b'\xff\xc2') + 6):
+            (tmp_path / 'test.jpg').write_bytes(buffer[:end])
+            with pytest.raises(ValueError, match='Invalid JPG file'):
+                Image.probe(tmp_path / 'test.jpg')
+
+        (tmp_path / 'test.png').write_bytes(read(Path(__file__)[:-1] / '_data/test_png')[:20])
+        with pytest.raises(ValueError, match='Invalid PNG file'):
+            Image.probe(tmp_path / 'test.png')
 
     @pytest.mark.parametrize('disabled_backend', (('none',), ('plums.dataflow.io.tile._vendor.turbojpeg',),
                                                   ('plums.dataflow.io.tile._vendor.turbojpeg', 'lycon'),
@@ -338,3 +338,38 @@ class TestPType:
         # +-> Row
         data = make_image(1)
         assert np.array_equal(y.get_conversion_fn_to(y)(data), data)
+
+    def test_conversion_plan(self):
+        ptypes = (rgb, rgba, bgr, bgra, y)
+        data = (np.random.rand(12, 12, 4) * 255).astype(np.uint8)
+
+        # Compiled plans are equivalent to channel-by-channel conversions
+        for origin in ptypes:
+            for destination in ptypes:
+                image = data[..., :len(origin)]
+                result = origin.get_conversion_fn_to(destination)(image)
+                expected = np.stack([channel.get_conversion_fn_from(origin)(image) for channel in destination], axis=-1)
+                assert result.dtype == expected.dtype
+                assert np.allclose(result, expected)
+
+        # Conversion functions are cached
+        assert rgb.get_conversion_fn_to(bgr) is rgb.get_conversion_fn_to(bgr)
+
+    def test_conversion_out(self):
+        data = make_image(3)
+
+        out = np.zeros((12, 12, 4), dtype=np.float64)
+        result = rgb.get_conversion_fn_to(bgra)(data, out=out)
+        assert result is out
+        assert np.array_equal(out, np.concatenate((data[..., ::-1], make_channel(1)), axis=-1))
+
+        out = np.zeros((12, 12, 1), dtype=np.float32)
+        result = rgb.get_conversion_fn_to(y)(data, out=out)
+        assert result is out
+        assert np.allclose(out, make_channel(1.815))
+
+        with pytest.raises(ValueError, match='Invalid output array'):
+            rgb.get_conversion_fn_to(y)(data, out=np.zeros((12, 12, 3)))
+
+        with pytest.raises(ValueError, match='Inconsistent shape'):
+            rgb.get_conversion_fn_to(y)(make_image(4), out=np.zeros((12, 12, 1)))
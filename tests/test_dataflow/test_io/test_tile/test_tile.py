@@ -2,7 +2,7 @@ import pytest
 import numpy as np
 
 from plums.commons.path import Path
-from plums.dataflow.io.tile import Tile, rgb, rgba, bgr, bgra, y
+from plums.dataflow.io.tile import Tile, BufferPool, TileCache, rgb, rgba, bgr, bgra, y, GREY
 
 
 @pytest.fixture(params=('ext', 'no_ext'))
@@ -151,6 +151,16 @@ def test_tile(image, tmp_path):  # noqa: R701
     assert conversion.dtype == np.uint8
     assert conversion.shape[2] == 1
 
+    # Fused conversions match a pixel-type conversion followed by a data-type conversion
+    for ptype in (rgb, bgr, y):
+        for dtype in (np.uint8, np.float32):
+            conversion = tile.astype(ptype=ptype, dtype=dtype)
+            expected = bgra.get_conversion_fn_to(ptype)(tile.data).astype(dtype)
+            assert conversion.dtype == dtype
+            assert np.array_equal(conversion.data, expected)
+            assert not np.shares_memory(conversion.data, tile.data)
+
+    conversion = tile.astype(ptype=y, dtype=np.uint8)
     conversion.ptype = bgr
     assert conversion.filename == image
     assert conversion.ptype == bgr
@@ -162,3 +172,253 @@ def test_tile(image, tmp_path):  # noqa: R701
     assert conversion.ptype == bgr
     assert conversion.dtype == np.float64
     assert conversion.shape[2] == 3
+
+
+@pytest.mark.parametrize('workers', (None, 1, 4))
+def test_tile_load_many(workers):
+    images = (Path(__file__)[:-1] / '_data' / 'test_jpg.jpg',
+              Path(__file__)[:-1] / '_data' / 'test_png.png',
+              Path(__file__)[:-1] / '_data' / 'test_jpg')
+    tiles = Tile.load_many(images, ptype=bgr, dtype=np.float64, workers=workers, foo='bar')
+    assert len(tiles) == 3
+    for tile, image in zip(tiles, images):
+        assert isinstance(tile, Tile)
+        assert tile.filename == image
+        assert tile.ptype == bgr
+        assert tile.dtype == np.float64
+        assert tile.foo == 'bar'
+        np.testing.assert_array_equal(tile.data, Tile(image, ptype=bgr, dtype=np.float64).data)
+
+    assert Tile.load_many((), workers=workers) == ()
+
+    with pytest.raises(ValueError, match='Invalid number of workers'):
+        Tile.load_many(images, workers=0)
+
+
+@pytest.mark.parametrize('scale, size', (((1, 1), 512), ((1, 2), 256), ((1, 4), 128), ((1, 8), 64), ((3, 8), 192)))
+def test_tile_scale(image, scale, size):
+    tile = Tile(image, scale=scale, fast_dct=True, fast_upsample=True)
+    assert tile.filename == image
+    assert tile.ptype == rgb
+    assert tile.dtype == np.uint8
+    assert tile.size == (size, size)
+    assert tile.shape == (size, size, 3)
+
+    reference = Tile(image, dtype=np.float64).data
+    reference = reference.reshape((size, 512 // size, size, 512 // size, 3)).mean(axis=(1, 3)) \
+        if 512 % size == 0 else None
+    if reference is not None:
+        assert np.mean(np.abs(reference - tile.data)) < 8
+
+    tiles = Tile.load_many((image, image), scale=scale)
+    assert all(tile.shape == (size, size, 3) for tile in tiles)
+
+
+def test_tile_invalid_scale(image):
+    with pytest.raises(ValueError, match='Invalid scale'):
+        Tile(image, scale=(0, 2))
+
+    with pytest.raises(ValueError, match='Invalid scale'):
+        Tile(image, scale=2)
+
+
+def test_tile_out(image):
+    reference = Tile(image)
+
+    out = np.zeros((512, 512, 3), dtype=np.uint8)
+    tile = Tile(image, out=out)
+    assert np.shares_memory(tile.data, out)
+    np.testing.assert_array_equal(out, reference.data)
+
+    out = np.zeros((512, 512, 3), dtype=np.uint8)
+    tile = Tile(image, ptype=bgr, out=out)
+    assert not np.shares_memory(tile.data, out)
+    np.testing.assert_array_equal(out, reference.data)
+
+    out = np.zeros((128, 128, 3), dtype=np.uint8)
+    tile = Tile(image, scale=(1, 4), out=out)
+    assert np.shares_memory(tile.data, out)
+    assert tile.size == (128, 128)
+
+    with pytest.raises(ValueError):
+        Tile(image, out=np.zeros((256, 512, 3), dtype=np.uint8))
+
+    with pytest.raises(ValueError):
+        Tile(image, out=np.zeros((512, 512, 3), dtype=np.float32))
+
+
+@pytest.mark.parametrize('workers', (1, 4))
+def test_tile_load_many_out(image, workers):
+    pool = BufferPool()
+    with pool.buffer((3, 512, 512, 3)) as batch:
+        tiles = Tile.load_many((image, image, image), workers=workers, out=batch)
+        for i, tile in enumerate(tiles):
+            assert np.shares_memory(tile.data, batch[i])
+            np.testing.assert_array_equal(batch[i], Tile(image).data)
+    assert len(pool) == 1
+
+    with pytest.raises(ValueError, match='Invalid output buffer'):
+        Tile.load_many((image, image), workers=workers, out=np.zeros((3, 512, 512, 3), dtype=np.uint8))
+
+
+def test_tile_ptype_conversion_dtype(jpeg_image):
+    # The requested data-type is kept when the pixel-type changes, even if it matches the input data-type
+    tile = Tile(jpeg_image, ptype=GREY)
+    assert tile.dtype == np.uint8
+    assert tile.data.dtype == np.uint8
+    assert Tile.probe(jpeg_image, ptype=GREY).data.dtype == np.uint8
+
+    tile = Tile(jpeg_image)
+    assert tile.astype(ptype=GREY, dtype=np.uint8).data.dtype == np.uint8
+    assert tile.astype(ptype=GREY).data.dtype == np.float64
+    tile.totype(ptype=GREY, dtype=np.uint8)
+    assert tile.data.dtype == np.uint8
+
+    np.testing.assert_array_equal(tile.data, Tile(jpeg_image).astype(ptype=GREY).data.astype(np.uint8))
+
+
+@pytest.mark.parametrize('scale, size', ((None, 512), ((1, 4), 128), ((3, 8), 192)))
+def test_tile_lazy(image, scale, size):
+    tile = Tile.probe(image, scale=scale, foo='bar')
+    assert not tile.loaded
+    assert tile.filename == image
+    assert tile.foo == 'bar'
+    assert tile.ptype == rgb
+    assert tile.dtype == np.uint8
+    assert tile.size == (size, size)
+    assert tile.shape == (size, size, 3)
+
+    # Conversions are deferred
+    tile.totype(ptype=bgra, dtype=np.float32)
+    assert not tile.loaded
+    assert tile.ptype == bgra
+    assert tile.dtype == np.float32
+    assert tile.shape == (size, size, 4)
+
+    # Clones are lazy too
+    clone = tile.clone()
+    assert not clone.loaded
+    assert clone.ptype == bgra
+    assert clone.dtype == np.float32
+
+    # Data access decodes
+    reference = Tile(image, ptype=bgra, dtype=np.float32, scale=scale)
+    np.testing.assert_array_equal(np.asarray(tile), reference.data)
+    assert tile.loaded
+    assert tile.ptype == bgra
+    assert tile.dtype == np.float32
+    assert tile.shape == (size, size, 4)
+    np.testing.assert_array_equal(clone.data, reference.data)
+
+    # Clones do not share the decoding buffer
+    out = np.zeros((size, size, 3), dtype=np.uint8)
+    tile = Tile.probe(image, scale=scale, out=out)
+    clone = tile.clone()
+    clone.data[...] = 0
+    assert not np.shares_memory(clone.data, out)
+    np.testing.assert_array_equal(tile.data, Tile(image, scale=scale).data)
+    assert np.shares_memory(tile.data, out)
+
+    tile = Tile(image, lazy=True, dtype=np.float64)
+    assert not tile.loaded
+    assert tile.astype(ptype=y).shape == (512, 512, 1)
+    assert not tile.loaded
+    assert tile.data.dtype == np.float64
+
+
+def test_tile_from_bytes(image):
+    with open(str(image), 'rb') as f:
+        buffer = f.read()
+
+    reference = Tile(image, ptype=bgr, dtype=np.float32)
+    tile = Tile.from_bytes(buffer, ptype=bgr, dtype=np.float32, foo='bar')
+    assert tile.filename is None
+    assert tile.foo == 'bar'
+    assert tile.ptype == bgr
+    assert tile.dtype == np.float32
+    np.testing.assert_array_equal(tile.data, reference.data)
+
+    tile = Tile.from_bytes(memoryview(buffer), filename=image, scale=(1, 2))
+    assert tile.filename == image
+    assert tile.size == (256, 256)
+
+    with pytest.raises(TypeError, match='Unsupported image type'):
+        Tile.from_bytes(b'GIF89a')
+
+
+def test_tile_cache(image, tmp_path):
+    cache = TileCache(tmp_path)
+    assert cache.path == tmp_path
+
+    reference = Tile(image, ptype=bgr, dtype=np.float32, scale=(1, 2))
+    for _ in range(2):
+        tile = Tile(image, ptype=bgr, dtype=np.float32, scale=(1, 2), cache=cache, foo='bar')
+        assert isinstance(tile.data, np.memmap)
+        assert tile.foo == 'bar'
+        assert tile.ptype == bgr
+        assert tile.dtype == np.float32
+        np.testing.assert_array_equal(tile.data, reference.data)
+        assert len(list(tmp_path.glob('*.npy'))) == 1
+
+    # Entries are copy-on-write
+    tile.data[...] = 0
+    np.testing.assert_array_equal(Tile(image, ptype=bgr, dtype=np.float32, scale=(1, 2), cache=cache).data,
+                                  reference.data)
+
+    # Different types are different entries
+    tile = Tile(image, cache=cache)
+    np.testing.assert_array_equal(tile.data, Tile(image).data)
+    assert len(list(tmp_path.glob('*.npy'))) == 2
+
+    cache.clear()
+    assert not list(tmp_path.glob('*.npy'))
+
+
+def test_buffer_pool():
+    pool = BufferPool()
+    assert len(pool) == 0
+
+    buffer = pool.acquire((16, 16, 3))
+    assert buffer.shape == (16, 16, 3)
+    assert buffer.dtype == np.uint8
+    assert len(pool) == 0
+
+    pool.release(buffer)
+    assert len(pool) == 1
+    assert pool.acquire((16, 16, 3)) is buffer
+    assert len(pool) == 0
+
+    pool.release(buffer)
+    other = pool.acquire((16, 16, 3), dtype=np.float32)
+    assert other is not buffer
+    assert other.dtype == np.float32
+    assert pool.acquire((16, 16, 4)) is not buffer
+    assert len(pool) == 1
+
+    with pytest.raises(ValueError, match='Invalid buffer'):
+        pool.release(buffer[:8])
+
+    pool.clear()
+    assert len(pool) == 0
+
+
+def test_buffer_pool_max_buffers():
+    pool = BufferPool(max_buffers=2)
+    buffers = [pool.acquire((4, 4, 3)) for _ in range(3)]
+    for buffer in buffers:
+        pool.release(buffer)
+    assert len(pool) == 2
+
+
+def test_buffer_pool_context():
+    pool = BufferPool()
+    with pool.buffer((2, 4, 4, 3)) as buffer:
+        assert buffer.shape == (2, 4, 4, 3)
+        assert len(pool) == 0
+    assert len(pool) == 1
+
+    with pytest.raises(RuntimeError):
+        with pool.buffer((2, 4, 4, 3)) as other:
+            assert other is buffer
+            raise RuntimeError
+    assert len(pool) == 1